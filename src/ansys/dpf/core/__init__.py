@@ -25,9 +25,17 @@ try:
 except Exception as e:  # pragma: no cover
     warnings.warn(f"Could not set up example data directory: {e}")
 
-installed = [d.metadata["Name"] for d in importlib_metadata.distributions()]
+def _is_installed(distribution_name):
+    # Looking up the distributions by name avoids reading the metadata of every installed one
+    try:
+        importlib_metadata.distribution(distribution_name)
+    except importlib_metadata.PackageNotFoundError:
+        return False
+    return True
+
+
 check_for = ["ansys-dpf-gatebin", "ansys-dpf-gate", "ansys-grpc-dpf"]
-if any([c in installed for c in check_for]):
+if any(_is_installed(c) for c in check_for):
     raise ImportError(f"Error during import of ansys-dpf-core:\n"
                       f"detected one of {check_for} installed. "
                       f"The current version of ansys-dpf-core requires uninstalling these previous "
@@ -105,6 +113,7 @@ from ansys.dpf.core.server_context import (
 from ansys.dpf.core.server_types import AnyServerType  # noqa: F401
 from ansys.dpf.core.unit_system import UnitSystem, unit_systems
 from ansys.dpf.core.incremental import IncrementalHelper, split_workflow_in_chunks
+from ansys.dpf.core.server_pool import ServerPool
 from ansys.dpf.core.any import Any
 from ansys.dpf.core.mesh_info import MeshInfo
 from ansys.dpf.core.generic_data_container import GenericDataContainer
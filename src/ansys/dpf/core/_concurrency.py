@@ -0,0 +1,78 @@
+# Copyright (C) 2020 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run blocking requests to DPF servers in the background, with a bounded concurrency."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+
+from ansys.dpf.core import misc
+
+_executors_lock = threading.Lock()
+
+
+def _executor(server) -> ThreadPoolExecutor:
+    """Return the executor running the background requests of a server."""
+    with _executors_lock:
+        max_requests = getattr(server, "_max_concurrent_requests", None)
+        if max_requests is None:
+            max_requests = misc.MAX_CONCURRENT_REQUESTS
+        executor, executor_max_requests = getattr(server, "_requests_executor", (None, None))
+        if executor is None or executor_max_requests != max_requests:
+            if executor is not None:
+                # already submitted requests still complete on the previous executor
+                executor.shutdown(wait=False)
+            executor = ThreadPoolExecutor(
+                max_workers=max_requests, thread_name_prefix="dpf-requests"
+            )
+            server._requests_executor = (executor, max_requests)
+        return executor
+
+
+def set_max_concurrent_requests(max_requests, server) -> None:
+    """Bound the number of requests run concurrently in the background on a server.
+
+    Parameters
+    ----------
+    max_requests : int, None
+        Maximum number of concurrent requests. ``None`` to use the default
+        ``misc.MAX_CONCURRENT_REQUESTS``.
+    server : server.DPFServer
+        Server to set the limit of.
+    """
+    if max_requests is not None and max_requests < 1:
+        raise ValueError(f"max_requests must be at least 1, got {max_requests}.")
+    server._max_concurrent_requests = max_requests
+
+
+def submit(server, func, *args, **kwargs) -> Future:
+    """Run ``func(*args, **kwargs)`` in the background among the requests of ``server``.
+
+    Requests beyond the concurrency limit of the server are queued. A queued request can be
+    cancelled with ``Future.cancel()``, while a request already sent to the server completes.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Future holding the result of the call. Use ``asyncio.wrap_future`` to await it.
+    """
+    return _executor(server).submit(func, *args, **kwargs)
@@ -0,0 +1,125 @@
+# Copyright (C) 2020 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Vectorized mapping of entity IDs to their indices in a mesh."""
+
+import numpy as np
+
+# A dense lookup table is used when the ID range is at most this many times the
+# number of IDs (plus a small constant for tiny meshes), otherwise sorted arrays are used.
+_DENSE_TABLE_MAX_RATIO = 4
+_DENSE_TABLE_MIN_SIZE = 1 << 16
+
+
+class IdToIndexMap:
+    """Map entity IDs to their index in a reference list of IDs.
+
+    For compact ID ranges, the map is a dense ``int32`` lookup table indexed by
+    ``id - min_id``. Otherwise, it stores the sorted IDs with their original indices
+    and uses :func:`numpy.searchsorted`. In both cases, mapping an array of IDs is
+    fully vectorized.
+
+    When an ID appears several times in the reference IDs, its last index is kept,
+    as for a dictionary built by enumerating the IDs.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray, list
+        Reference IDs. The index of each ID is its position in this array.
+    """
+
+    def __init__(self, ids):
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        self._size = ids.size
+        self._table = None
+        self._sorted_ids = None
+        self._sorted_indices = None
+        if self._size == 0:
+            self._min_id = 0
+            self._table = np.empty(0, dtype=np.int32)
+            return
+        self._min_id = int(ids.min())
+        span = int(ids.max()) - self._min_id + 1
+        indices = np.arange(self._size, dtype=np.int32)
+        if span <= _DENSE_TABLE_MAX_RATIO * self._size + _DENSE_TABLE_MIN_SIZE:
+            self._table = np.full(span, -1, dtype=np.int32)
+            self._table[ids - self._min_id] = indices
+        else:
+            order = np.argsort(ids, kind="stable")
+            self._sorted_ids = ids[order]
+            self._sorted_indices = indices[order]
+
+    def __len__(self):
+        """Return the number of reference IDs."""
+        return self._size
+
+    @property
+    def is_dense(self) -> bool:
+        """Whether the map uses a dense lookup table."""
+        return self._table is not None
+
+    def lookup(self, ids) -> np.ndarray:
+        """Return the index of each ID, or ``-1`` for IDs which are not mapped.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, list
+            IDs to look up.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``int32`` indices with the same length as ``ids``.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        result = np.full(ids.size, -1, dtype=np.int32)
+        if self._size == 0 or ids.size == 0:
+            return result
+        if self._table is not None:
+            offsets = ids - self._min_id
+            in_range = (offsets >= 0) & (offsets < self._table.size)
+            result[in_range] = self._table[offsets[in_range]]
+        else:
+            positions = np.searchsorted(self._sorted_ids, ids, side="right") - 1
+            found = positions >= 0
+            found[found] = self._sorted_ids[positions[found]] == ids[found]
+            result[found] = self._sorted_indices[positions[found]]
+        return result
+
+    def map(self, ids):
+        """Return the indices of the mapped IDs and the mask of the mapped IDs.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, list
+            IDs to map.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            ``int32`` indices of the IDs which are mapped, in the order of ``ids``.
+        mask : numpy.ndarray
+            Boolean array, ``True`` for each member of ``ids`` which is mapped.
+        """
+        indices = self.lookup(ids)
+        mask = indices >= 0
+        return indices[mask], mask
@@ -45,6 +45,12 @@ class DataSourcesOrStreamsConnector:
             return self._metadata()._mesh_provider_cached
         return None
 
+    @property
+    def result_cache(self):
+        if self._metadata():
+            return self._metadata()._result_cache
+        return None
+
     @property
     def data_sources(self):
         if self._metadata():
@@ -28,11 +28,14 @@ This module contains the DPF animator class.
 Contains classes used to animate results based on workflows using PyVista.
 """
 
+import time
 from typing import Sequence, Union
 
 import numpy as np
 
 from ansys.dpf import core
+from ansys.dpf.core import _concurrency
+from ansys.dpf.core.common import locations
 from ansys.dpf.core.helpers.utils import _sort_supported_kwargs
 from ansys.dpf.core.plotter import _PyVistaPlotter
 
@@ -50,6 +53,23 @@ class _PyVistaAnimator(_PyVistaPlotter):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.frames_per_second = None
+
+    def _update_field_actor(self, data, points=None, clim=None):
+        """Update the data and coordinates of the grid of the last field added in place."""
+        import pyvista as pv
+
+        grid = self._field_actor.mapper.dataset
+        if points is not None:
+            grid.SetPoints(pv.vtk_points(points, deep=True))
+        if self._field_actor.mapper.scalar_map_mode == "point":
+            grid.point_data[self._field_actor.mapper.array_name][:] = data
+        else:
+            grid.cell_data[self._field_actor.mapper.array_name][:] = data
+        if clim is None and not np.isnan(data).all():
+            clim = [np.nanmin(data), np.nanmax(data)]
+        if clim is not None:
+            self._plotter.update_scalar_bar_range(clim)
 
     def animate_workflow(  # noqa: PLR0912, PLR0913, PLR0915, C901
         self,
@@ -106,9 +126,12 @@ class _PyVistaAnimator(_PyVistaPlotter):
             if isinstance(cpos[0][0], float):
                 cpos = [cpos] * len(indices)
 
-        def render_frame(frame):
-            self._plotter.clear()
+        # When given, the mesh support is shared by all frames and its VTK grid is reused
+        meshed_region = kwargs.pop("meshed_region", None)
+        pipeline = kwargs.pop("pipeline", False)
+        in_place = False
 
+        def compute_frame(frame, prepare=False):
             if mode_number is None:
                 workflow.connect(input_name, [frame])
 
@@ -119,15 +142,61 @@ class _PyVistaAnimator(_PyVistaPlotter):
             deform = None
             if "deform_by" in workflow.output_names:
                 deform = workflow.get_output("deform_by", core.types.field)
-            self.add_field(
-                field,
-                deform_by=deform,
-                scale_factor=scale_factor[frame],
-                scale_factor_legend=scale_factor[frame],
-                shell_layer=shell_layer,
-                **kwargs,
-            )
+            if not prepare:
+                return field, deform, None, None
+            # Also retrieve the data to plot and the deformed coordinates of the frame
+            _, data = self._field_data_on_mesh(field, meshed_region, shell_layer)
+            points = None
+            if deform:
+                points = meshed_region.deform_by(deform, scale_factor[frame]).data
+            return field, deform, data, points
+
+        def frames(first):
+            nonlocal in_place
+            if not pipeline:
+                for frame in range(first, len(indices)):
+                    yield frame, compute_frame(frame)
+                return
+            if first >= len(indices):
+                return
+            # Compute the next frame in the background while the current one is rendered
+            server = workflow._server
+            future = _concurrency.submit(server, compute_frame, first)
+            for frame in range(first, len(indices)):
+                outputs = future.result()
+                if frame == first:
+                    in_place = (
+                        meshed_region is not None
+                        and outputs[0].location != locations.elemental_nodal
+                        and len(set(scale_factor)) == 1
+                        and not kwargs.get("show_max")
+                        and not kwargs.get("show_min")
+                    )
+                if frame + 1 < len(indices):
+                    # The workflow is reconnected once the outputs of the frame are retrieved
+                    future = _concurrency.submit(server, compute_frame, frame + 1, in_place)
+                yield frame, outputs
+
+        def render_frame(frame, outputs):
+            field, deform, data, points = outputs
+            if data is not None and (
+                points is None or len(points) == self._field_actor.mapper.dataset.n_points
+            ):
+                # Update the grid of the previous frame instead of adding a new one
+                self._update_field_actor(data, points, clim=kwargs.get("clim"))
+            else:
+                self._plotter.clear()
+                self.add_field(
+                    field,
+                    meshed_region=meshed_region,
+                    deform_by=deform,
+                    scale_factor=scale_factor[frame],
+                    scale_factor_legend=scale_factor[frame],
+                    shell_layer=shell_layer,
+                    **kwargs,
+                )
             kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_text, **freq_kwargs)
+            kwargs_in.setdefault("name", "frame_text")
             if mode_number is None:
                 str_template = "t={0:{2}} {1}"
                 self._plotter.add_text(
@@ -145,6 +214,7 @@ class _PyVistaAnimator(_PyVistaPlotter):
         try:
 
             def animation():
+                start = time.perf_counter()
                 if save_as:
                     try:
                         self._plotter.write_frame()
@@ -157,19 +227,23 @@ class _PyVistaAnimator(_PyVistaPlotter):
                             print(e)
                             return result
                 # For each additional frame requested
-                if len(indices) > 1:
-                    for frame in range(1, len(indices)):
-                        try:
-                            render_frame(frame)
-                        except AttributeError as e:  # pragma: no cover
-                            if "'NoneType' object has no attribute 'interactor'" in e.args[0]:
-                                print("Animation canceled.")
-                                return result
-                        if save_as:
-                            self._plotter.write_frame()
+                rendered = 0
+                for frame, outputs in frames(1):
+                    try:
+                        render_frame(frame, outputs)
+                    except AttributeError as e:  # pragma: no cover
+                        if "'NoneType' object has no attribute 'interactor'" in e.args[0]:
+                            print("Animation canceled.")
+                            return result
+                    rendered += 1
+                    if save_as:
+                        self._plotter.write_frame()
+                elapsed = time.perf_counter() - start
+                if rendered and elapsed > 0:
+                    self.frames_per_second = rendered / elapsed
 
             # Write initial frame
-            render_frame(0)
+            render_frame(0, compute_frame(0))
             # If not off_screen, enable the user to choose the camera position
             off_screen = kwargs.pop("off_screen", None)
             if off_screen is None:
@@ -272,6 +346,7 @@ class Animator:
         scale_factor: Union[float, Sequence[float]] = 1.0,
         freq_kwargs: dict = None,
         shell_layer: core.shell_layers = core.shell_layers.top,
+        pipeline: bool = False,
         **kwargs,
     ):
         """
@@ -302,12 +377,19 @@ class Animator:
         shell_layer:
             Enum used to set the shell layer if the field to plot
             contains shell elements. Defaults to top layer.
+        pipeline:
+            Whether to compute the workflow outputs of the next frame in the background while
+            the current frame is rendered. When a ``meshed_region`` keyword argument is also
+            given, the data and coordinates of the VTK grid are updated in place at each frame
+            instead of adding the mesh again. Defaults to False.
+            The frame rate achieved is available in :attr:`frames_per_second`.
         **kwargs : optional
             Additional keyword arguments for the animator.
             Used by :func:`pyvista.Plotter` (off_screen, cpos, ...),
             or by :func:`pyvista.Plotter.open_movie`
-            (framerate, quality, ...)
-
+            (framerate, quality, ...).
+            A ``meshed_region`` keyword argument can be given when all frames share the
+            same mesh support, so that it is converted to VTK only once.
 
         """
         if freq_kwargs is None:
@@ -323,9 +405,22 @@ class Animator:
             scale_factor=scale_factor,
             freq_kwargs=freq_kwargs,
             shell_layer=shell_layer,
+            pipeline=pipeline,
             **kwargs,
         )
 
+    @property
+    def frames_per_second(self) -> Union[float, None]:
+        """
+        Number of frames rendered per second by the last animation.
+
+        Returns
+        -------
+        frames_per_second : float, None
+            ``None`` if no animation was produced yet.
+        """
+        return self._internal_animator.frames_per_second
+
 
 def scale_factor_to_fc(scale_factor, fc):
     """Scale the fields being animated by a factor.
@@ -154,6 +154,7 @@ class AvailableResult:
         self._sub_res = availableresult.sub_res
         self._qualifiers = availableresult.qualifiers
         self._qualifier_labels = availableresult.qualifier_labels
+        self._server = getattr(availableresult, "server", None)
 
     def __str__(self):
         """Construct an informal string representation of available result.
@@ -176,13 +177,13 @@ class AvailableResult:
             txt += "Units: %s\n" % self.unit
         if self.native_location:
             txt += "Location: %s\n" % self.native_location
-        if self.qualifiers:
+        if self._qualifiers:
             txt += "Available qualifier labels:\n"
             for label in self.qualifier_labels:
                 txt += f"  - {label}: {', '.join(map(str, self.qualifier_labels[label]))}\n"
             txt += "Available qualifier combinations:\n"
-            for qualifier in self.qualifiers:
-                txt += f"  {qualifier.__dict__()}\n"
+            for qualifier in self.qualifier_combinations:
+                txt += f"  {qualifier}\n"
         return txt
 
     def __repr__(self):
@@ -289,6 +290,13 @@ class AvailableResult:
         These qualifiers can then be used to request the result
         on specified locations/properties.
         """
+        if any(isinstance(q, dict) for q in self._qualifiers):
+            from ansys.dpf.core.label_space import LabelSpace
+
+            self._qualifiers = [
+                LabelSpace(label_space=q, server=self._server) if isinstance(q, dict) else q
+                for q in self._qualifiers
+            ]
         return self._qualifiers
 
     @property
@@ -302,4 +310,4 @@ class AvailableResult:
 
         Each combination is a dictionary which can be used for a result request.
         """
-        return [q.__dict__() for q in self.qualifiers]
+        return [dict(q) if isinstance(q, dict) else q.__dict__() for q in self._qualifiers]
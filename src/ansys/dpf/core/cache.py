@@ -22,7 +22,24 @@
 
 """Provides for caching evaluated results for faster re-evaluation."""
 
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+import hashlib
+from pathlib import Path
+import threading
 from typing import NamedTuple
+import uuid
+
+import numpy as np
+
+from ansys.dpf.core import misc
+
+DEFAULT_CACHE_MAX_ENTRIES = 128
+"""Default maximum number of results cached per instance."""
+
+DEFAULT_CACHE_MAX_BYTES = None
+"""Default maximum number of bytes of array results cached per instance, ``None`` for no limit."""
 
 
 def class_handling_cache(cls):
@@ -33,17 +50,33 @@ def class_handling_cache(cls):
     At initialization, this decorator add a ''_cache'' property to the class.
     This new property is an instance of ''CacheHandler''.
 
+    The size of each instance's cache can be bounded with the optional
+    ''_cache_max_entries'' and ''_cache_max_bytes'' static attributes, which default to
+    ''DEFAULT_CACHE_MAX_ENTRIES'' and ''DEFAULT_CACHE_MAX_BYTES''.
+
     .. note::
        The method must be used as a class decorator.
     """
     if hasattr(cls, "_to_cache"):
+        handler_lock = threading.Lock()
 
         def get_handler(mesh):
-            if hasattr(mesh, "__cache"):
-                return mesh.__cache
-            else:
-                setattr(mesh, "__cache", CacheHandler(cls, cls._to_cache))
-            return mesh.__cache
+            if not hasattr(mesh, "__cache"):
+                with handler_lock:
+                    if not hasattr(mesh, "__cache"):
+                        setattr(
+                            mesh,
+                            "__cache",
+                            CacheHandler(
+                                cls,
+                                cls._to_cache,
+                                max_entries=getattr(
+                                    cls, "_cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES
+                                ),
+                                max_bytes=getattr(cls, "_cache_max_bytes", DEFAULT_CACHE_MAX_BYTES),
+                            ),
+                        )
+            return getattr(mesh, "__cache")
 
         for getter, setters in cls._to_cache.items():
             if setters:
@@ -55,6 +88,27 @@ def class_handling_cache(cls):
     return cls
 
 
+def _hashable(value):
+    """Return a hashable equivalent of a method argument.
+
+    Arrays are identified by a digest of their content. A ``TypeError`` is raised for
+    arguments without value semantics, which cannot be cached.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("arrays of objects cannot be cached")
+        digest = hashlib.blake2b(np.ascontiguousarray(value), digest_size=16).digest()
+        return ("ndarray", value.dtype.str, value.shape, digest)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_hashable(item) for item in value))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((key, _hashable(item)) for key, item in value.items())))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_hashable(item) for item in value))
+    hash(value)
+    return value
+
+
 class MethodIdentifier(NamedTuple):
     """Provides for identifying a method."""
 
@@ -62,25 +116,54 @@ class MethodIdentifier(NamedTuple):
     args: list
     kwargs: dict
 
+    @property
+    def _key(self):
+        return (self.method_name, _hashable(self.args), _hashable(self.kwargs or {}))
+
     def __eq__(self, other):
         """Compare two methods for equality."""
         if isinstance(other, str):
             return self.method_name == other
-        else:
-            return (
-                self.method_name == other.method_name
-                and self.args == other.args
-                and self.kwargs == other.kwargs
-            )
+        elif isinstance(other, MethodIdentifier):
+            return self._key == other._key
+        return NotImplemented
+
+    def __ne__(self, other):
+        """Compare two methods for inequality."""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
     def __hash__(self):
         """Fetch the hash corresponding to a method."""
-        hash = self.method_name.__hash__()
-        if self.args:
-            hash += self.args.__hash__()
-        if self.kwargs:
-            hash += self.kwargs.__hash__()
-        return hash
+        return hash(self._key)
+
+
+@dataclass
+class CacheStatistics:
+    """Provides the usage statistics of the caches of a class."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self):
+        """Ratio of calls served from the cache."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+_statistics_lock = threading.Lock()
+
+
+def _result_nbytes(result):
+    """Return the number of bytes of array data held by a cached result."""
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (list, tuple)):
+        return sum(_result_nbytes(item) for item in result)
+    return 0
 
 
 class CacheHandler:
@@ -92,7 +175,11 @@ class CacheHandler:
     and their results are cached so that, when the getters are called again
     with the same parameters, the data is directly recovered instead of reevaluated.
     When the setters associated to getters in the input dictionary are called,
-    their associated getters' caches are cleared.
+    the cached results of their associated getters are cleared, whatever their parameters.
+
+    The cache is thread-safe and bounded: the least recently used results are evicted
+    when more than ``max_entries`` results, or more than ``max_bytes`` bytes of arrays,
+    are cached. Hits, misses, evictions and invalidations are counted per class.
 
     Parameters
     ----------
@@ -101,9 +188,24 @@ class CacheHandler:
 
     getters_to_setters_dict : dict[function:list[function]]
         Map class getters to their list of setters which need to be cached
+
+    max_entries : int, optional
+        Maximum number of cached results. ``None`` for no limit.
+
+    max_bytes : int, optional
+        Maximum number of bytes of NumPy arrays held by the cached results.
+        ``None`` for no limit.
     """
 
-    def __init__(self, cls, getters_to_setters_dict):
+    _statistics = {}
+
+    def __init__(
+        self,
+        cls,
+        getters_to_setters_dict,
+        max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes=DEFAULT_CACHE_MAX_BYTES,
+    ):
         self.getter_to_setters_name = {}
         for getter, setters in getters_to_setters_dict.items():
             setters_name = []
@@ -115,30 +217,378 @@ class CacheHandler:
         self.setter_to_getter_names = {}
         for getter, setters in self.getter_to_setters_name.items():
             for setter in setters:
-                self.setter_to_getter_names[setter] = getter
-
-        self.cached = {}
+                self.setter_to_getter_names.setdefault(setter, []).append(getter)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cached = OrderedDict()
+        self._nbytes = {}
+        self.nbytes = 0
+        self._lock = threading.RLock()
+        with _statistics_lock:
+            self.statistics = CacheHandler._statistics.setdefault(cls.__name__, CacheStatistics())
+
+    @classmethod
+    def class_statistics(cls, class_name):
+        """Return the statistics of the caches of all the instances of a class.
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class declaring ``_to_cache``.
+
+        Returns
+        -------
+        CacheStatistics
+        """
+        with _statistics_lock:
+            return CacheHandler._statistics.setdefault(class_name, CacheStatistics())
+
+    def _count(self, **increments):
+        with _statistics_lock:
+            for counter, increment in increments.items():
+                setattr(self.statistics, counter, getattr(self.statistics, counter) + increment)
 
     def handle(self, object, func, *args, **kwargs):
         """Recover data which has already been cached."""
-        identifier = MethodIdentifier(func.__name__, args, kwargs)
-        if identifier in self.cached:
-            return self.cached[identifier]
-        elif func.__name__ in self.getter_to_setters_name:
-            self.cached[identifier] = func(object, *args, **kwargs)
-            setattr(func, "under_cache", False)
-            return self.cached[identifier]
+        if func.__name__ in self.getter_to_setters_name:
+            identifier = MethodIdentifier(func.__name__, args, kwargs)
+            try:
+                hash(identifier)
+            except TypeError:
+                # arguments without value semantics are not cached
+                self._count(misses=1)
+                return func(object, *args, **kwargs)
+            with self._lock:
+                if identifier in self.cached:
+                    self.cached.move_to_end(identifier)
+                    self._count(hits=1)
+                    return self.cached[identifier]
+            self._count(misses=1)
+            result = func(object, *args, **kwargs)
+            self._store(identifier, result)
+            return result
         else:
-            if (
-                func.__name__ in self.setter_to_getter_names
-                and self.setter_to_getter_names[func.__name__] in self.cached
-            ):
-                del self.cached[self.setter_to_getter_names[func.__name__]]
+            if func.__name__ in self.setter_to_getter_names:
+                self.invalidate(*self.setter_to_getter_names[func.__name__])
             return func(object, *args, **kwargs)
 
+    def _store(self, identifier, result):
+        nbytes = _result_nbytes(result)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # Never evict everything for a single result larger than the budget
+            return
+        with self._lock:
+            if identifier in self.cached:
+                self.nbytes -= self._nbytes.pop(identifier)
+            self.cached[identifier] = result
+            self._nbytes[identifier] = nbytes
+            self.nbytes += nbytes
+            evictions = 0
+            while (self.max_entries is not None and len(self.cached) > self.max_entries) or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes
+            ):
+                evicted, _ = self.cached.popitem(last=False)
+                self.nbytes -= self._nbytes.pop(evicted)
+                evictions += 1
+        if evictions:
+            self._count(evictions=evictions)
+
+    def invalidate(self, *getter_names):
+        """Clear the cached results of the given getters, whatever their parameters.
+
+        Parameters
+        ----------
+        *getter_names : str
+            Names of the getters to clear.
+        """
+        with self._lock:
+            to_remove = [
+                identifier for identifier in self.cached if identifier.method_name in getter_names
+            ]
+            for identifier in to_remove:
+                del self.cached[identifier]
+                self.nbytes -= self._nbytes.pop(identifier)
+        if to_remove:
+            self._count(invalidations=len(to_remove))
+
     def clear(self):
         """Clear cached data."""
-        self.cached = {}
+        with self._lock:
+            self.cached = OrderedDict()
+            self._nbytes = {}
+            self.nbytes = 0
+
+
+class _ReadCache:
+    """Keep the last data read from the server for an object, validated by its size.
+
+    Used when ``misc.FIELD_DATA_CACHE`` is enabled to avoid streaming the same arrays
+    again from gRPC servers. Cached arrays are made read-only. Hits, misses and
+    invalidations are counted in the statistics of the class of the object, see
+    :meth:`CacheHandler.class_statistics`.
+
+    Parameters
+    ----------
+    class_name : str
+        Name of the class of the object owning the data.
+    """
+
+    def __init__(self, class_name):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.statistics = CacheHandler.class_statistics(class_name)
+
+    def _count(self, counter, increment=1):
+        with _statistics_lock:
+            setattr(self.statistics, counter, getattr(self.statistics, counter) + increment)
+
+    def get(self, name, size, read):
+        """Return the cached value of ``name`` if ``size()`` did not change, else ``read()`` it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the cached value.
+        size : callable
+            Return the current size of the data on the server, with one small request.
+        read : callable
+            Read the value from the server.
+        """
+        current_size = size()
+        with self._lock:
+            entry = self._entries.get(name)
+        if entry is not None and entry[0] == current_size:
+            self._count("hits")
+            return entry[1]
+        self._count("misses")
+        value = read()
+        if value is not None:
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            with self._lock:
+                self._entries[name] = (current_size, value)
+        return value
+
+    def invalidate(self):
+        """Clear the cached values."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries = {}
+        if count:
+            self._count("invalidations", count)
+
+
+_read_cache_lock = threading.Lock()
+
+
+def _cached_read(obj, name, size, read):
+    """Read data of ``obj`` from the server, through its read cache when it is enabled.
+
+    See :class:`_ReadCache` for the parameters.
+    """
+    if not misc.FIELD_DATA_CACHE:
+        return read()
+    read_cache = obj.__dict__.get("_read_cache")
+    if read_cache is None:
+        # Statistics are gathered under the public class, such as Field for local fields
+        class_name = next(
+            cls.__name__ for cls in type(obj).__mro__ if not cls.__name__.startswith("_")
+        )
+        with _read_cache_lock:
+            read_cache = obj.__dict__.setdefault("_read_cache", _ReadCache(class_name))
+    return read_cache.get(name, size, read)
+
+
+def _invalidate_read_cache(obj):
+    """Clear the data of ``obj`` cached by :func:`_cached_read`."""
+    read_cache = obj.__dict__.get("_read_cache")
+    if read_cache is not None:
+        read_cache.invalidate()
+
+
+@dataclass
+class ResultCacheStatistics(CacheStatistics):
+    """Provides the usage statistics of a result cache."""
+
+    bytes_saved: int = 0
+    spills: int = 0
+
+
+def _fields_container_nbytes(fields_container):
+    """Return the number of bytes of the data of the fields of a container.
+
+    Only the data size of each field is requested, the scoping ids are not counted.
+    """
+    itemsize = np.dtype(np.float64).itemsize
+    return sum(
+        field.size * itemsize for field, _ in fields_container.get_entries_and_label_spaces()
+    )
+
+
+def _file_signature(path):
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        # files only visible to a remote server are not checked
+        return (path, None)
+    return (path, stat.st_size, stat.st_mtime_ns)
+
+
+def _data_sources_signature(data_sources):
+    """Return the signature of every file of data sources, upstream data sources included.
+
+    Each file is identified by its key, path, size and modification time, and each upstream
+    data sources by its own signature, keyed by ``None``. Files which cannot be checked by the
+    client, such as files of remote servers, have no size. ``None`` is returned when the
+    upstream data sources are unknown, for example for data sources returned by an operator.
+    """
+    upstreams = getattr(data_sources, "_upstreams", None)
+    if upstreams is None:
+        return None
+    signature = [(key, *_file_signature(path)) for key, path in data_sources._paths()]
+    for upstream in upstreams:
+        upstream_signature = _data_sources_signature(upstream)
+        if upstream_signature is None:
+            return None
+        signature.append((None, upstream_signature))
+    return tuple(signature)
+
+
+def _signature_is_checked(signature):
+    """Whether all the files of a data sources signature can be checked by the client."""
+    return signature is not None and all(
+        _signature_is_checked(item[1]) if item[0] is None else item[2] is not None
+        for item in signature
+    )
+
+
+class ResultCache:
+    """Cache of the fields containers evaluated by the results of a model.
+
+    A fields container stays on the server and is returned again when a result is evaluated
+    with the same result name, time scoping, mesh scoping, location and split. The least
+    recently used fields containers are evicted when more than ``max_bytes`` bytes of field data
+    are cached. With a ``spill_directory``, evicted fields containers are serialized by the server
+    in this directory and read back on their next hit instead of reading the result files again.
+    The cache is cleared when the size or modification time of a result file changes. Only the
+    files accessible to the client are checked, files of a remote server are not.
+
+    Returned fields containers are shared by all the evaluations hitting the cache and should not
+    be modified in place.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Maximum number of bytes of field data kept on the server. ``None`` for no limit.
+    spill_directory : str, os.PathLike, optional
+        Local directory where evicted fields containers are written. The spilled files are
+        removed by the client, so only the fields containers of local servers are spilled,
+        those of remote servers are dropped. ``None`` to drop them all.
+    """
+
+    def __init__(self, max_bytes=None, spill_directory=None):
+        self.max_bytes = max_bytes
+        self.spill_directory = spill_directory
+        self.cached = OrderedDict()
+        self.spilled = {}
+        self.nbytes = 0
+        self.statistics = ResultCacheStatistics()
+        self._files_signature = None
+        self._lock = threading.RLock()
+
+    def _count(self, **increments):
+        with self._lock:
+            for counter, increment in increments.items():
+                setattr(self.statistics, counter, getattr(self.statistics, counter) + increment)
+
+    def get(self, key, evaluate, data_sources=None):
+        """Return the fields container cached for ``key``, else ``evaluate()`` and cache it.
+
+        Parameters
+        ----------
+        key : tuple
+            Hashable identifier of the evaluation.
+        evaluate : callable
+            Evaluate the fields container.
+        data_sources : DataSources, optional
+            Data sources the fields container is read from. The cache is cleared when one of
+            their files, or of their upstream data sources, changes.
+        """
+        self._check_files(data_sources)
+        with self._lock:
+            entry = self.cached.get(key)
+            if entry is not None:
+                self.cached.move_to_end(key)
+            elif key in self.spilled:
+                entry = self._load(key)
+        if entry is not None:
+            self._count(hits=1, bytes_saved=entry[1])
+            return entry[0]
+        self._count(misses=1)
+        fields_container = evaluate()
+        self._store(key, fields_container, _fields_container_nbytes(fields_container))
+        return fields_container
+
+    def _check_files(self, data_sources):
+        signature = None if data_sources is None else _data_sources_signature(data_sources)
+        with self._lock:
+            if self._files_signature is not None and signature != self._files_signature:
+                count = len(self.cached) + len(self.spilled)
+                self.clear()
+                self._count(invalidations=count)
+            self._files_signature = signature
+
+    def _store(self, key, fields_container, nbytes):
+        with self._lock:
+            self.cached[key] = (fields_container, nbytes)
+            self.nbytes += nbytes
+            evictions = 0
+            while self.max_bytes is not None and self.nbytes > self.max_bytes and self.cached:
+                evicted_key, (evicted, evicted_nbytes) = self.cached.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+                evictions += 1
+                if self.spill_directory is not None and evicted._server.local_server:
+                    self._spill(evicted_key, evicted, evicted_nbytes)
+        if evictions:
+            self._count(evictions=evictions)
+
+    def _spill(self, key, fields_container, nbytes):
+        from ansys.dpf.core.operators.serialization import serializer
+
+        path = Path(self.spill_directory) / f"result_cache_{uuid.uuid4().hex}.dpf"
+        serializer(
+            file_path=str(path), any_input1=fields_container, server=fields_container._server
+        ).run()
+        self.spilled[key] = (path, type(fields_container), nbytes, fields_container._server)
+        self._count(spills=1)
+
+    def _load(self, key):
+        from ansys.dpf.core.common import types
+        from ansys.dpf.core.operators.serialization import deserializer
+
+        path, fields_container_type, nbytes, server = self.spilled.pop(key)
+        fields_container = deserializer(file_path=str(path), server=server).get_output(
+            1, types.fields_container
+        )
+        if type(fields_container) is not fields_container_type:
+            fields_container = fields_container_type(
+                fields_container=fields_container._get_ownership(), server=server
+            )
+        with suppress(OSError):
+            path.unlink()
+        self._store(key, fields_container, nbytes)
+        return fields_container, nbytes
+
+    def clear(self):
+        """Clear the cached fields containers and remove the spilled files."""
+        with self._lock:
+            for path, *_ in self.spilled.values():
+                with suppress(OSError):
+                    path.unlink()
+            self.cached = OrderedDict()
+            self.spilled = {}
+            self.nbytes = 0
 
 
 def _handle_cache(func):
@@ -153,7 +603,7 @@ def _handle_cache(func):
         if hasattr(self, "_cache"):
             return self._cache.handle(self, func, *args, **kwargs)
         else:
-            func(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
 
     return wrapper
 
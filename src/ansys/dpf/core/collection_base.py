@@ -25,6 +25,8 @@
 from __future__ import annotations
 
 import abc
+from contextlib import suppress
+import operator
 import traceback
 from typing import TYPE_CHECKING, Generic, List, Optional, TypeVar
 import warnings
@@ -44,6 +46,7 @@ from ansys.dpf.gate import (
     dpf_array,
     dpf_vector,
 )
+from ansys.dpf.gate.errors import DPFServerException
 
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.dpf.core.support import Support
@@ -53,6 +56,57 @@ from ansys.dpf.gate.integral_types import MutableListInt32
 TYPE = TypeVar("TYPE")
 
 
+class _LabelSpaceIndex:
+    """Label spaces of all the entries of a collection, held on the client.
+
+    Entries are looked up with dictionary lookups for complete label spaces and with
+    vectorized comparisons for partial label spaces, instead of a server query each.
+
+    Parameters
+    ----------
+    labels : list[str]
+        Labels of the collection.
+    label_spaces : list[dict[str,int]]
+        Label space of each entry, in index order.
+    """
+
+    def __init__(self, labels, label_spaces):
+        self.labels = list(labels)
+        self._columns = {label: column for column, label in enumerate(self.labels)}
+        self.values = np.zeros((len(label_spaces), len(self.labels)), dtype=np.int64)
+        # labels with no value for some entries are left to the server
+        self.incomplete = set()
+        for index, label_space in enumerate(label_spaces):
+            for label, column in self._columns.items():
+                value = label_space.get(label)
+                if value is None:
+                    self.incomplete.add(label)
+                else:
+                    self.values[index, column] = value
+        self._by_label_space = {}
+        for index, row in enumerate(map(tuple, self.values.tolist())):
+            self._by_label_space.setdefault(row, []).append(index)
+
+    def indices(self, label_space):
+        """Return the indices of the entries matching a complete or partial label space.
+
+        Returns ``None`` when the request cannot be answered from the index, for example
+        when it contains a label which is not a label of the collection.
+        """
+        try:
+            query = {label: operator.index(value) for label, value in label_space.items()}
+        except TypeError:
+            return None
+        if not query.keys() <= self._columns.keys() or not self.incomplete.isdisjoint(query):
+            return None
+        if len(query) == len(self.labels):
+            return list(self._by_label_space.get(tuple(query[label] for label in self.labels), ()))
+        mask = np.ones(len(self.values), dtype=bool)
+        for label, value in query.items():
+            mask &= self.values[:, self._columns[label]] == value
+        return np.flatnonzero(mask).tolist()
+
+
 class CollectionBase(Generic[TYPE]):
     """Represents a collection of entries ordered by labels and IDs.
 
@@ -90,6 +144,8 @@ class CollectionBase(Generic[TYPE]):
                 self._internal_obj = collection
         self.owned = False
         self._loop_index = 0
+        self._loop_iterator = None
+        self._label_index = None
 
     @property
     def _server(self):
@@ -215,6 +271,7 @@ class CollectionBase(Generic[TYPE]):
         >>> coll.add_label('time')
 
         """
+        self._label_index = None
         if default_value is not None:
             self._api.collection_add_label_with_default_value(self, label, default_value)
         else:
@@ -291,6 +348,12 @@ class CollectionBase(Generic[TYPE]):
             Entries corresponding to the request.
         """
         if isinstance(label_space_or_index, dict):
+            indices = self._get_label_index().indices(label_space_or_index)
+            if indices is not None:
+                return [
+                    self.create_subtype(self._api.collection_get_obj_by_index(self, index))
+                    for index in indices
+                ]
             client_label_space = LabelSpace(
                 label_space=label_space_or_index, obj=self, server=self._server
             )
@@ -329,6 +392,9 @@ class CollectionBase(Generic[TYPE]):
         indices : list[int], list[Field], list[MeshedRegion]
             Indices of the entries corresponding to the request.
         """
+        indices = self._get_label_index().indices(label_space)
+        if indices is not None:
+            return indices
         client_label_space = LabelSpace(label_space=label_space, obj=self, server=self._server)
         num = self._api.collection_get_num_obj_for_label_space(self, client_label_space)
         int_list = MutableListInt32(num)
@@ -379,6 +445,81 @@ class CollectionBase(Generic[TYPE]):
             server=self._server,
         ).__dict__()
 
+    def get_entries_and_label_spaces(self):
+        """Retrieve all the entries of the collection together with their label spaces.
+
+        With a gRPC server, all the entries are retrieved in a single request instead of
+        one request per entry and per label space, so walking a large collection
+        scales with its data volume rather than with its number of entries.
+
+        Returns
+        -------
+        entries_and_label_spaces : list[tuple[Field | Scoping | MeshedRegion, dict[str,int]]]
+            Entries in index order, each paired with its label space. For example,
+            ``[(field, {"time": 1, "complex": 0}), ...]``.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.download_transient_result())
+        >>> fc = model.results.displacement.on_all_time_freqs.eval()
+        >>> for field, label_space in fc.get_entries_and_label_spaces():
+        ...     time_id = label_space["time"]
+
+        """
+        size = len(self)
+        entries = self._get_entries_batch(size)
+        if entries is not None:
+            self._label_index = _LabelSpaceIndex(
+                self.labels, [label_space for _, label_space in entries]
+            )
+            return [(self.create_subtype(entry), label_space) for entry, label_space in entries]
+        return [(self._get_entries(i), self.get_label_space(i)) for i in range(size)]
+
+    def _get_entries_batch(self, size):
+        """Return the internal entries and the label spaces retrieved in a single request.
+
+        Returns ``None`` when the server API does not provide the batch retrieval.
+        """
+        if not hasattr(self._api, "collection_get_entries_and_label_spaces"):
+            return None
+        with suppress(NotImplementedError, DPFServerException):
+            entries = self._api.collection_get_entries_and_label_spaces(self)
+            if len(entries) == size:
+                return entries
+        return None
+
+    def _get_label_index(self) -> _LabelSpaceIndex:
+        """Return the index of the label spaces of the entries, built on first use.
+
+        The label spaces of all the entries are retrieved at once. The index is dropped when
+        labels or entries are added through this collection, and rebuilt when the number of
+        entries or of labels of the collection changed otherwise, for example through another
+        collection object or on the server.
+        """
+        size = len(self)
+        label_index = self._label_index
+        if (
+            label_index is None
+            or len(label_index.values) != size
+            or len(label_index.labels) != self._api.collection_get_num_labels(self)
+        ):
+            label_spaces = None
+            if hasattr(self._api, "collection_get_label_spaces"):
+                with suppress(NotImplementedError, DPFServerException):
+                    label_spaces = self._api.collection_get_label_spaces(self)
+            if label_spaces is None or len(label_spaces) != size:
+                label_spaces = [
+                    LabelSpace(
+                        label_space=self._api.collection_get_obj_label_space_by_index(self, i),
+                        server=self._server,
+                    ).__dict__()
+                    for i in range(size)
+                ]
+            self._label_index = _LabelSpaceIndex(self.labels, label_spaces)
+        return self._label_index
+
     def get_available_ids_for_label(self, label="time"):
         """Retrieve the IDs assigned to an input label.
 
@@ -460,6 +601,7 @@ class CollectionBase(Generic[TYPE]):
         entry : Field or Scoping
             DPF entry to add.
         """
+        self._label_index = None
         client_label_space = LabelSpace(label_space=label_space, obj=self, server=self._server)
         self._api.collection_add_entry(self, client_label_space, entry)
 
@@ -586,17 +728,35 @@ class CollectionBase(Generic[TYPE]):
         return self._internal_obj
 
     def __iter__(self):
-        """Return iterator."""
+        """Return an iterator over the entries.
+
+        With a gRPC server, the entries are retrieved together in a single batch. Otherwise,
+        each entry is retrieved when the iteration reaches it.
+        """
         self._loop_index = 0
-        return self
+        self._loop_iterator = None
+        return self._iter_entries()
+
+    def _iter_entries(self):
+        size = len(self)
+        entries = self._get_entries_batch(size)
+        if entries is not None:
+            for entry, _ in entries:
+                yield self.create_subtype(entry)
+            return
+        for i in range(size):
+            yield self._get_entries(i)
 
     def __next__(self) -> TYPE:
-        """Return next element in iteration."""
-        if self._loop_index < len(self):
-            self._loop_index += 1
-            return self[self._loop_index - 1]
-        else:
-            raise StopIteration
+        """Return next element in iteration.
+
+        Kept for backward compatibility, the entries are retrieved as by :meth:`__iter__`.
+        """
+        if self._loop_iterator is None:
+            self._loop_iterator = self._iter_entries()
+        entry = next(self._loop_iterator)
+        self._loop_index += 1
+        return entry
 
 
 class IntegralCollection(CollectionBase):
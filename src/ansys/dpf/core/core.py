@@ -444,6 +444,10 @@ class BaseService:
             self._internal_obj = self._api.data_processing_load_library(
                 name=name, dllPath=file_path, symbol=symbol
             )
+        # the new plugin may record operators or change the specifications of the loaded ones
+        from ansys.dpf.core.operator_specification import _specification_cache
+
+        _specification_cache.invalidate(self._server())
         if generate_operators:
             # TODO: fix code generation upload posix
             # https://github.com/ansys/pydpf-core/issues/1984, todo was added in this PR
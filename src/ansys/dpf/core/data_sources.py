@@ -104,10 +104,15 @@ class DataSources:
         # step3: init environment
         self._api.init_data_sources_environment(self)  # creates stub when gRPC
 
+        # upstream data sources added through this object, None when they are unknown
+        self._upstreams = []
+
         # step4: if object exists: take instance, else create it:
         # object_name -> protobuf.message, DPFObject*
         if data_sources is not None:
             if isinstance(data_sources, DataSources):
+                upstreams = getattr(data_sources, "_upstreams", None)
+                self._upstreams = None if upstreams is None else list(upstreams)
                 # Make a Copy
                 core_api = self._server.get_api_for_type(
                     capi=data_processing_capi.DataProcessingCAPI,
@@ -120,6 +125,7 @@ class DataSources:
             elif hasattr(data_sources, "DESCRIPTOR") or isinstance(data_sources, int):
                 # It should be a message (usually from a call to operator_getoutput_data_sources)
                 self._internal_obj = data_sources
+                self._upstreams = None
             else:
                 self._internal_obj = None
                 raise errors.DpfValueError("Data source must be gRPC data sources message type")
@@ -488,6 +494,8 @@ class DataSources:
             self._api.data_sources_add_upstream_data_sources_for_specified_result(
                 self, upstream_data_sources, result_key
             )
+        if self._upstreams is not None:
+            self._upstreams.append(upstream_data_sources)
 
     def add_upstream_for_domain(self, upstream_data_sources: DataSources, domain_id: int) -> None:
         """Add an upstream data sources to the main DataSources object for a given domain.
@@ -539,6 +547,8 @@ class DataSources:
         self._api.data_sources_add_upstream_domain_data_sources(
             self, upstream_data_sources, domain_id
         )
+        if self._upstreams is not None:
+            self._upstreams.append(upstream_data_sources)
 
     @property
     def result_key(self) -> str:
@@ -646,6 +656,16 @@ class DataSources:
                         response.append(path)
             return response
 
+    def _paths(self) -> list[tuple[str, str]]:
+        """Return the key and path of every file of the data sources, upstreams excluded."""
+        paths = []
+        for i_key in range(self._api.data_sources_get_num_keys(self)):
+            num_paths = integral_types.MutableInt32()
+            key = self._api.data_sources_get_key(self, i_key, num_paths)
+            for i_path in range(int(num_paths)):
+                paths.append((key, self._api.data_sources_get_path(self, key, i_path)))
+        return paths
+
     @version_requires("7.0")
     def register_namespace(self, result_key: str, namespace: str):
         """Associate a ``result_key`` to a ``namespace`` for this `DataSources`` instance.
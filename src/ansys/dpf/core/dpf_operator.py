@@ -24,6 +24,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from enum import Enum
 import os
 import traceback
@@ -33,7 +34,7 @@ import warnings
 import numpy
 from packaging.version import Version
 
-from ansys.dpf.core import server as server_module
+from ansys.dpf.core import _concurrency, server as server_module
 from ansys.dpf.core.changelog import Changelog
 from ansys.dpf.core.check_version import (
     server_meet_version,
@@ -152,6 +153,7 @@ class Operator:
         self._inputs_class = inputs_type
         self._outputs_class = outputs_type
         self._id = None
+        self._connected_pins = set()
 
         # step 1: get server
         self._server = server_module.get_or_create_server(
@@ -308,7 +310,8 @@ class Operator:
         """
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
-        elif isinstance(inpt, Operator):
+        self._connected_pins.add(pin)
+        if isinstance(inpt, Operator):
             self._api.operator_connect_operator_output(self, pin, inpt, pin_out)
         elif isinstance(inpt, Output):
             self._api.operator_connect_operator_output(self, pin, inpt._operator, inpt._pin)
@@ -351,6 +354,7 @@ class Operator:
         op : :class:`ansys.dpf.core.dpf_operator.Operator`
             Requested type of the output. The default is ``None``.
         """
+        self._connected_pins.add(pin)
         self._api.operator_connect_operator_as_input(self, pin, op)
 
     @staticmethod
@@ -854,6 +858,53 @@ class Operator:
                 if output._pin == pin:
                     return output()
 
+    def run_async(self) -> Future:
+        """Evaluate this operator in the background.
+
+        Background requests run concurrently up to the limit of the server, set with
+        :func:`ansys.dpf.core.settings.set_max_concurrent_requests`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future completed when the operator is evaluated. Its ``cancel`` method
+            prevents the evaluation if it is still queued.
+        """
+        return _concurrency.submit(self._server, self.run)
+
+    def eval_async(self, pin=None) -> Future:
+        """Evaluate this operator in the background and return a future of its output.
+
+        Inputs must be connected before the call. Background requests run concurrently up
+        to the limit of the server, set with
+        :func:`ansys.dpf.core.settings.set_max_concurrent_requests`.
+
+        Parameters
+        ----------
+        pin : int
+            Number of the output pin. The default is ``None``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the output returned by :meth:`eval`. Its ``cancel`` method
+            prevents the evaluation if it is still queued. Use ``asyncio.wrap_future``
+            to await it in a coroutine.
+
+        Examples
+        --------
+        Evaluate two operators concurrently.
+
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> data_src = dpf.DataSources(examples.find_multishells_rst())
+        >>> disp_future = dpf.operators.result.displacement(data_sources=data_src).eval_async()
+        >>> stress_future = dpf.operators.result.stress(data_sources=data_src).eval_async()
+        >>> disp_fc, stress_fc = disp_future.result(), stress_future.result()
+
+        """
+        return _concurrency.submit(self._server, self.eval, pin)
+
     def _find_outputs_corresponding_pins(  # noqa: PLR0912, C901
         self, type_names, inpt, pin, corresponding_pins, input_type_name
     ):
@@ -57,6 +57,10 @@ class Element:
         Fortran-based (1-based) index of the element in the result.
     nodes : list
         List of DPF nodes belonging to the element.
+    arrays : ElementsArrays, optional
+        Bulk arrays of the mesh's elements. When given, the element is a
+        lightweight view into these arrays and ``nodes`` can be ``None``,
+        in which case the nodes are built on demand without any server call.
 
     Examples
     --------
@@ -75,11 +79,12 @@ class Element:
 
     """
 
-    def __init__(self, mesh, elementid, index, nodes):
+    def __init__(self, mesh, elementid, index, nodes, arrays=None):
         self._id = elementid
         self._index = index
         self._nodes = nodes
         self._mesh = mesh
+        self._arrays = arrays
 
     @property
     def node_ids(self):
@@ -102,6 +107,8 @@ class Element:
         [1, 26, 14, 12, 2, 27, 15, 13, 33, 64, 59, 30, 37, 65, 61, 34, 28, 81, 63, 58]
 
         """
+        if self._nodes is None:
+            return self._arrays.node_ids_of(self._index).tolist()
         return [node.id for node in self._nodes]
 
     @property
@@ -150,6 +157,8 @@ class Element:
         >>> first_node = element.nodes[0]
 
         """
+        if self._nodes is None:
+            self._nodes = self._arrays.nodes_of(self._index)
         return self._nodes
 
     @property
@@ -163,6 +172,8 @@ class Element:
             Number of nodes.
 
         """
+        if self._nodes is None:
+            return len(self._arrays.connectivity_of(self._index))
         return len(self._nodes)
 
     def __str__(self):
@@ -200,6 +211,8 @@ class Element:
 
     def _get_type(self):
         """Retrieve the Ansys element type."""
+        if self._arrays is not None:
+            return element_types(int(self._arrays.types[self._index]))
         type = integral_types.MutableInt32()
         self._mesh._api.meshed_region_get_element_type(self._mesh, self.id, type, self.index)
         return element_types(int(type))
@@ -230,6 +243,8 @@ class Element:
 
     def _get_shape(self):
         """Retrieve the element shape."""
+        if self._arrays is not None:
+            return self._arrays.shapes[self._index]
         shape = integral_types.MutableInt32()
         self._mesh._api.meshed_region_get_element_shape(self._mesh, self.id, shape, self.index)
         for name in _element_shapes_legacy:
@@ -247,12 +262,178 @@ class Element:
             Ordered list of node indices.
 
         """
+        if self._nodes is None:
+            return self._arrays.connectivity_of(self._index).tolist()
         list = []
         for node in self._nodes:
             list.append(node.index)
         return list
 
 
+class ElementsArrays:
+    """
+    Bulk arrays describing all the elements of a meshed region.
+
+    All the arrays are fetched from the server once, with one request for each of
+    the elements scoping, the element types field, the connectivities field, the
+    nodes scoping and the coordinates field. Accessing, iterating or slicing the
+    elements afterward only reads these arrays and does not call the server.
+
+    The connectivity is stored in compressed sparse row (CSR) format: the node
+    indices of the element at index ``i`` are
+    ``connectivity[offsets[i]:offsets[i + 1]]``.
+
+    Parameters
+    ----------
+    mesh : :class:`ansys.dpf.core.meshed_region.MeshedRegion`
+        Mesh containing the elements.
+
+    Examples
+    --------
+    >>> import ansys.dpf.core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.find_static_rst())
+    >>> arrays = model.metadata.meshed_region.elements.as_arrays()
+    >>> arrays.node_ids_of(0).tolist()
+    [1, 26, 14, 12, 2, 27, 15, 13, 33, 64, 59, 30, 37, 65, 61, 34, 28, 81, 63, 58]
+    >>> arrays[0].type
+    <element_types.Hex20: 1>
+
+    """
+
+    def __init__(self, mesh):
+        self._mesh = mesh
+        elements = Elements(mesh)
+        elements_scoping = elements.scoping
+        self._ids = (
+            np.asarray(elements_scoping.ids, dtype=np.int32)
+            if elements_scoping is not None
+            else np.empty(0, dtype=np.int32)
+        )
+        n_elements = self._ids.size
+
+        self._types = np.asarray(elements.element_types_field.data, dtype=np.int32).reshape(-1)
+
+        connectivities_field = elements.connectivities_field
+        self._connectivity = np.asarray(connectivities_field.data, dtype=np.int32).reshape(-1)
+        data_pointer = np.asarray(connectivities_field._data_pointer, dtype=np.int64)
+        if data_pointer.size == 0 and n_elements > 0:
+            # All elements have the same number of nodes
+            data_pointer = np.arange(n_elements, dtype=np.int64) * (
+                self._connectivity.size // n_elements
+            )
+        self._offsets = np.append(data_pointer, self._connectivity.size).astype(np.int64)
+
+        mesh_nodes = nodes.Nodes(mesh)
+        nodes_scoping = mesh_nodes.scoping
+        self._node_ids = (
+            np.asarray(nodes_scoping.ids, dtype=np.int32)
+            if nodes_scoping is not None
+            else np.empty(0, dtype=np.int32)
+        )
+        self._coordinates = np.asarray(mesh_nodes.coordinates_field.data).reshape(-1, 3)
+        self._shapes = None
+
+    @property
+    def ids(self) -> np.ndarray:
+        """IDs of the elements, ordered by element index."""
+        return self._ids
+
+    @property
+    def types(self) -> np.ndarray:
+        """Element type of each element as defined by :class:`element_types`."""
+        return self._types
+
+    @property
+    def shapes(self) -> np.ndarray:
+        """
+        Shape of each element.
+
+        Shapes are ``"solid"``, ``"shell"``, ``"beam"`` or ``"unknown_shape"``, as
+        returned by :attr:`Element.shape`.
+        """
+        if self._shapes is None:
+            unique_types, inverse = np.unique(self._types, return_inverse=True)
+            unique_shapes = []
+            for element_type in unique_types:
+                descriptor = element_types.descriptor(int(element_type))
+                shape = descriptor.shape if descriptor is not None else None
+                if shape not in ("solid", "shell", "beam"):
+                    shape = "unknown_shape"
+                unique_shapes.append(shape)
+            self._shapes = np.asarray(unique_shapes, dtype=object)[inverse.reshape(-1)]
+        return self._shapes
+
+    @property
+    def connectivity(self) -> np.ndarray:
+        """Node indices of all the elements, concatenated in element index order."""
+        return self._connectivity
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Start of each element in :attr:`connectivity`, with the total size appended."""
+        return self._offsets
+
+    @property
+    def n_nodes_per_element(self) -> np.ndarray:
+        """Number of nodes of each element."""
+        return np.diff(self._offsets)
+
+    @property
+    def node_ids(self) -> np.ndarray:
+        """IDs of the mesh's nodes, ordered by node index."""
+        return self._node_ids
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Coordinates of the mesh's nodes as an array of shape ``(n_nodes, 3)``."""
+        return self._coordinates
+
+    def connectivity_of(self, index) -> np.ndarray:
+        """Node indices of the element at a given index, without negative (missing) nodes."""
+        connectivity = self._connectivity[self._offsets[index] : self._offsets[index + 1]]
+        return connectivity[connectivity >= 0]
+
+    def node_ids_of(self, index) -> np.ndarray:
+        """Node IDs of the element at a given index."""
+        return self._node_ids[self.connectivity_of(index)]
+
+    def coordinates_of(self, index) -> np.ndarray:
+        """Coordinates of the nodes of the element at a given index."""
+        return self._coordinates[self.connectivity_of(index)]
+
+    def nodes_of(self, index) -> list:
+        """List of :class:`ansys.dpf.core.nodes.Node` of the element at a given index."""
+        connectivity = self.connectivity_of(index)
+        node_ids = self._node_ids[connectivity].tolist()
+        coordinates = self._coordinates[connectivity].tolist()
+        return [
+            nodes.Node(self._mesh, node_id, node_index, node_coordinates)
+            for node_id, node_index, node_coordinates in zip(
+                node_ids, connectivity.tolist(), coordinates
+            )
+        ]
+
+    def __len__(self):
+        """Retrieve the number of elements."""
+        return self._ids.size
+
+    def __getitem__(self, index):
+        """Retrieve an element view, or a list of element views for a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Element index {index} is out of range.")
+        return Element(self._mesh, int(self._ids[index]), index, None, arrays=self)
+
+    def __iter__(self):
+        """Iterate over element views."""
+        for index in range(len(self)):
+            yield self[index]
+
+
 class Elements:
     """
     Contains elements belonging to a meshed region.
@@ -275,13 +456,16 @@ class Elements:
         self._mesh = mesh
         self._server = mesh._server
         self._mapping_id_to_index = None
+        self._arrays = None
 
     def __str__(self):
         """Provide a custom string representation."""
         return "DPF Elements object with %d elements" % len(self)
 
     def __getitem__(self, index):
-        """Retrieve element based on an index."""
+        """Retrieve element based on an index, or a list of elements for a slice."""
+        if isinstance(index, slice):
+            return self.as_arrays()[index]
         return self.element_by_index(index)
 
     def __len__(self):
@@ -289,9 +473,39 @@ class Elements:
         return self.n_elements
 
     def __iter__(self):
-        """Provide for looping through the elements in loops."""
-        for i in range(len(self)):
-            yield self[i]
+        """Provide for looping through the elements in loops.
+
+        The elements' data is fetched in bulk with :meth:`as_arrays` and each
+        yielded element is a view into these arrays.
+        """
+        return iter(self.as_arrays())
+
+    def as_arrays(self) -> ElementsArrays:
+        """
+        Retrieve the data of all the elements as bulk arrays.
+
+        The arrays are fetched once and kept on this ``Elements`` instance until
+        elements or elemental property fields are added or set through it.
+
+        Returns
+        -------
+        ElementsArrays
+            IDs, types, shapes, connectivity (CSR offsets and node indices) and
+            node coordinates of all the elements.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> elements = model.metadata.meshed_region.elements
+        >>> arrays = elements.as_arrays()
+        >>> first_elements = elements[:10]
+
+        """
+        if self._arrays is None:
+            self._arrays = ElementsArrays(self._mesh)
+        return self._arrays
 
     def element_by_id(self, id) -> Element:
         """
@@ -333,6 +547,8 @@ class Elements:
         This is equivalent to ``elements[0]``
 
         """
+        if self._arrays is not None:
+            return self._arrays[index]
         return self.__get_element(elementindex=index)
 
     def add_elements(self, num):
@@ -366,6 +582,9 @@ class Elements:
         ...     i=i+1
 
         """
+        self._arrays = None
+        self._mesh._id_to_index_maps.pop(locations.elemental, None)
+        self._mesh._vtk_grids.clear()
         for i in range(0, num):
             add = ElementAdder()
             yield add
@@ -445,6 +664,9 @@ class Elements:
             List of the node indices to connect to the new element.
 
         """
+        self._arrays = None
+        self._mesh._id_to_index_maps.pop(locations.elemental, None)
+        self._mesh._vtk_grids.clear()
         shape_id = _element_shapes_legacy[shape.upper()].value
         self._mesh._api.meshed_region_add_element_by_shape(
             self._mesh, id, len(connectivity), connectivity, shape_id
@@ -545,6 +767,7 @@ class Elements:
         property_field : PropertyField
             PropertyField that contains element type values
         """
+        self._arrays = None
         self._mesh.set_property_field(elemental_properties.element_type, property_field)
 
     @property
@@ -619,6 +842,7 @@ class Elements:
         property_field : PropertyField
             PropertyField that contains connectivity value
         """
+        self._arrays = None
         self._mesh.set_property_field(elemental_properties.connectivity, property_field)
 
     def _get_connectivities_field(self):
@@ -632,7 +856,8 @@ class Elements:
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self.scoping.ids
+        return dict(zip(np.asarray(ids).tolist(), range(len(ids))))
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -686,10 +911,7 @@ class Elements:
         """
         if external_scope.location in ["Nodal", "NodalElemental"]:
             raise ValueError('Input scope location must be "Elemental"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        return self._mesh._id_to_index_map(locations.elemental).map(external_scope.ids)
 
     @property
     def has_shell_elements(self) -> bool:
@@ -26,7 +26,7 @@ import numpy as np
 
 from ansys.dpf.core import scoping
 from ansys.dpf.core.check_version import version_requires
-from ansys.dpf.core.common import face_properties
+from ansys.dpf.core.common import face_properties, locations
 from ansys.dpf.core.elements import element_types
 
 
@@ -405,7 +405,8 @@ class Faces:
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self.scoping.ids
+        return dict(zip(np.asarray(ids).tolist(), range(len(ids))))
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -459,7 +460,4 @@ class Faces:
         """
         if external_scope.location in ["Nodal", "NodalElemental", "Elemental", "ElementalNodal"]:
             raise ValueError('Input scope location must be "Faces"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        return self._mesh._id_to_index_map(locations.faces).map(external_scope.ids)
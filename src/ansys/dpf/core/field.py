@@ -32,6 +32,7 @@ import numpy as np
 from ansys import dpf
 from ansys.dpf.core import dimensionality, errors, meshed_region, scoping, time_freq_support
 from ansys.dpf.core.available_result import Homogeneity
+from ansys.dpf.core.cache import _cached_read, _invalidate_read_cache
 from ansys.dpf.core.common import (
     _get_size_of_list,
     locations,
@@ -47,6 +48,7 @@ from ansys.dpf.gate import (
     field_abstract_api,
     field_capi,
     field_grpcapi,
+    grpc_stream_helpers,
 )
 from ansys.dpf.gate.errors import DPFServerException
 
@@ -57,6 +59,14 @@ if TYPE_CHECKING:  # pragma: nocover
     from ansys.dpf.core.results import Result
 
 
+def _is_single_precision(dtype) -> bool:
+    """Return whether field data is requested as ``float32``, ``float64`` being the other choice."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Field data can be retrieved as float32 or float64, not as {dtype}.")
+    return dtype == np.float32
+
+
 class Field(_FieldBase):
     """Represents the main simulation data container.
 
@@ -203,6 +213,9 @@ class Field(_FieldBase):
 
     """
 
+    _append_dtype = np.float64
+    _stream_dtype = None
+
     def __init__(
         self,
         nentities=0,
@@ -385,12 +398,19 @@ class Field(_FieldBase):
         return self._api.csfield_get_data_size(self)
 
     def _set_scoping(self, scoping):
+        _invalidate_read_cache(self)
         self._api.csfield_set_cscoping(self, scoping)
 
     def _get_scoping(self):
-        obj = self._api.csfield_get_cscoping(self)
-        if obj is not None:
-            return scoping.Scoping(scoping=obj, server=self._server)
+        def read():
+            obj = self._api.csfield_get_cscoping(self)
+            if obj is not None:
+                return scoping.Scoping(scoping=obj, server=self._server)
+
+        return _cached_read(self, "scoping", self._server_data_size, read)
+
+    def _server_data_size(self):
+        return self._api.csfield_get_data_size(self)
 
     @property
     def shell_layers(self):
@@ -450,8 +470,42 @@ class Field(_FieldBase):
         if isinstance(data, list):
             if isinstance(data[0], list):
                 data = np.array(data)
+        _invalidate_read_cache(self)
         self._api.csfield_push_back(self, scopingid, _get_size_of_list(data), data)
 
+    def copy_data_to(self, out: np.ndarray) -> np.ndarray:
+        """Copy the data of the field into a preallocated array.
+
+        With a gRPC server, the data is received chunk by chunk directly into ``out``.
+        Using a :class:`numpy.memmap` as ``out`` then allows to retrieve fields larger
+        than the available memory, without holding a second copy of the data.
+        Values streamed as 4-byte floats are converted chunk by chunk into ``out``.
+
+        Parameters
+        ----------
+        out:
+            C-contiguous and writeable array of type ``float64`` with at least
+            :attr:`size` values, for example a :class:`numpy.memmap` opened in ``"w+"`` mode.
+
+        Returns
+        -------
+        numpy.ndarray
+            View on ``out`` holding the data, with the same shape as :attr:`data`.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.fields_factory.create_3d_vector_field(2)
+        >>> field.data = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        >>> out = np.empty(6)
+        >>> data = field.copy_data_to(out)
+        >>> data.shape
+        (2, 3)
+
+        """
+        return self._get_data(out=out)
+
     def _get_data_pointer(self):
         try:
             vec = dpf_vector.DPFVectorInt(owner=self)
@@ -461,24 +515,82 @@ class Field(_FieldBase):
             return dpf_array.DPFArray(vec)
 
         except NotImplementedError:
-            return self._api.csfield_get_data_pointer(self, True)
+            return _cached_read(
+                self,
+                "data_pointer",
+                self._server_data_size,
+                lambda: self._api.csfield_get_data_pointer(self, True),
+            )
 
     def _set_data_pointer(self, data):
+        _invalidate_read_cache(self)
         return self._api.csfield_set_data_pointer(self, _get_size_of_list(data), data)
 
     # Keep the private alias for backward compatibility (used in deep_copy and
     # by external code that may already reference _data_pointer directly).
     _data_pointer = property(_get_data_pointer, _set_data_pointer)
 
-    def _get_data(self, np_array=True):
+    def get_data(self, dtype=None) -> np.ndarray:
+        """Retrieve the data of the field with the precision chosen for this request.
+
+        With a gRPC server, ``numpy.float32`` data is converted by the server and streamed as
+        4-byte floats, which halves the data transferred. Use it when the data is only needed
+        for plotting or thresholding, for which single precision is enough.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+            Type of the returned data, ``numpy.float64`` or ``numpy.float32``.
+            The default is ``None``, in which case the type of :attr:`data` is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Data of the field, with the same shape as :attr:`data`.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> field = dpf.fields_factory.create_3d_vector_field(2)
+        >>> field.data = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        >>> field.get_data(dtype=np.float32).dtype
+        dtype('float32')
+
+        """
+        return self._get_data(dtype=dtype)
+
+    def _get_data(self, np_array=True, out=None, dtype=None):
+        if dtype is None:
+            dtype = self._stream_dtype
+        single_precision = dtype is not None and out is None and _is_single_precision(dtype)
         try:
             vec = dpf_vector.DPFVectorDouble(owner=self)
             self._api.csfield_get_data_for_dpf_vector(
                 self, vec, vec.internal_data, vec.internal_size
             )
             data = dpf_array.DPFArray(vec) if np_array else dpf_array.DPFArray(vec).tolist()
+            if out is not None:
+                values = np.asarray(data).reshape(-1)
+                destination = grpc_stream_helpers._data_destination(out, np.float64, values.size)
+                destination[:] = values
+                data = destination if np_array else data
+            elif single_precision and np_array:
+                data = np.asarray(data, dtype=np.float32)
         except NotImplementedError:
-            data = self._api.csfield_get_data(self, np_array)
+            if out is None and np_array:
+                stream_dtype = np.float32 if single_precision else None
+                data = _cached_read(
+                    self,
+                    "data_float32" if single_precision else "data",
+                    self._server_data_size,
+                    lambda: self._api.csfield_get_data(self, np_array, stream_dtype=stream_dtype),
+                )
+            elif out is None:
+                data = self._api.csfield_get_data(self, np_array)
+            else:
+                # Chunks received from the server are written directly into out
+                data = self._api.csfield_get_data(self, np_array, out=out)
         n_comp = self.component_count
         if np_array and n_comp != 1 and data.size != 0:
             data.shape = (data.size // n_comp, n_comp)
@@ -504,6 +616,7 @@ class Field(_FieldBase):
                 copy[:] = data
                 data = copy
         size = _get_size_of_list(data)
+        _invalidate_read_cache(self)
         return self._api.csfield_set_data(self, size, data)
 
     def to_nodal(self):
@@ -592,6 +705,7 @@ class Field(_FieldBase):
             Size of the data vector.
 
         """
+        _invalidate_read_cache(self)
         return self._api.csfield_resize(self, datasize, nentities)
 
     def _load_field_definition(self):
@@ -933,18 +1047,7 @@ class Field(_FieldBase):
         >>> deep_copy = field.deep_copy(server=other_server)
 
         """
-        f = Field(
-            nentities=len(self.scoping),
-            location=self.location,
-            nature=self.field_definition.dimensionality.nature,
-            server=server,
-        )
-        f.scoping = self.scoping.deep_copy(server)
-        f.data = self.data
-        f.location = self.location
-        f.field_definition = self.field_definition.deep_copy(server)
-        with suppress(Exception):
-            f.entity_data_offsets = self.entity_data_offsets
+        f = self._deep_copy_data(server)
 
         # A field can only have ONE support (mesh OR time_freq_support).
         # Setting one overwrites the other, so they must be mutually exclusive.
@@ -967,6 +1070,22 @@ class Field(_FieldBase):
 
         return f
 
+    def _deep_copy_data(self, server=None):
+        """Copy the scoping, data and definition of the field on a server, but not its support."""
+        f = Field(
+            nentities=len(self.scoping),
+            location=self.location,
+            nature=self.field_definition.dimensionality.nature,
+            server=server,
+        )
+        f.scoping = self.scoping.deep_copy(server)
+        f.data = self.data
+        f.location = self.location
+        f.field_definition = self.field_definition.deep_copy(server)
+        with suppress(Exception):
+            f.entity_data_offsets = self.entity_data_offsets
+        return f
+
 
 class _LocalField(_LocalFieldBase, Field):
     """Caches the internal data of a field so that it can be modified locally.
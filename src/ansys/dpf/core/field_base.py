@@ -23,13 +23,14 @@
 """Provide base APIs for DPF's field concept and means of caching field data."""
 
 from abc import abstractmethod
+import hashlib
 import traceback
 import warnings
 
 import numpy as np
 
 from ansys.dpf.core import errors, scoping, server as server_module
-from ansys.dpf.core.cache import _setter
+from ansys.dpf.core.cache import _invalidate_read_cache, _setter
 from ansys.dpf.core.common import locations, natures
 from ansys.dpf.gate import (
     data_processing_capi,
@@ -418,6 +419,64 @@ class _FieldBase:
         """
         pass
 
+    def append_many(self, ids, data):
+        """Add the data of several entities to the existing data.
+
+        The scoping, data and data pointer of the field are each updated in one request,
+        with the same result as calling :meth:`append` for each entity. The entities already
+        in the field are read back and sent again with the new ones, so prefer one call with
+        all the entities, or :meth:`append_buffer`, to many small calls.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs of the entities in the scoping.
+        data : numpy.ndarray, list
+            Data of the entities. Either an array holding the same number of values
+            for each entity, or a sequence holding the data of each entity.
+
+        Examples
+        --------
+        >>> from ansys.dpf.core import fields_factory
+        >>> field = fields_factory.create_3d_vector_field(2)
+        >>> field.append_many([1, 2], [[1.,2.,3.], [4.,5.,6.]])
+        >>> field.data
+        DPFArray([[1., 2., 3.],
+               [4., 5., 6.]]...
+        >>> field.scoping.ids
+        <BLANKLINE>
+        ...[1, 2]...
+
+        """
+        with self.append_buffer() as buffer:
+            buffer.append_many(ids, data)
+
+    def append_buffer(self):
+        """Accumulate the entities appended to the field client-side.
+
+        The entities appended to the buffer are held in NumPy arrays and sent to the
+        server in one update of the scoping, data and data pointer of the field when the
+        buffer is flushed, which happens when leaving the ``with`` statement.
+
+        Returns
+        -------
+        buffer : _AppendBuffer
+            Buffer providing ``append``, ``append_many`` and ``flush``.
+
+        Examples
+        --------
+        >>> from ansys.dpf.core import fields_factory
+        >>> field = fields_factory.create_3d_vector_field(3)
+        >>> with field.append_buffer() as buffer:
+        ...     for i in range(1, 4):
+        ...         buffer.append([0.1*i, 0.2*i, 0.3*i], i)
+        >>> field.scoping.ids
+        <BLANKLINE>
+        ...[1, 2, 3]...
+
+        """
+        return _AppendBuffer(self)
+
     @property
     def _data_pointer(self):
         """First index of each entity data.
@@ -574,10 +633,181 @@ class _FieldBase:
         pass
 
 
+class _LocalBuffer:
+    """Contiguous NumPy buffer growing with an amortized strategy.
+
+    Used by local fields to edit their data and data pointer without going through
+    Python lists.
+
+    Parameters
+    ----------
+    values : list, numpy.ndarray
+        Initial values, copied into the buffer.
+    dtype : numpy.dtype
+        Type of the values stored in the buffer.
+
+    """
+
+    def __init__(self, values, dtype):
+        self._array = np.array(values, dtype=dtype).ravel()
+        self._size = self._array.size
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def view(self):
+        """Used values of the buffer, without copy.
+
+        The view is invalidated when the buffer grows.
+        """
+        return self._array[: self._size]
+
+    def extend(self, values):
+        """Add values at the end of the buffer, doubling its capacity when full."""
+        values = np.asarray(values, dtype=self._array.dtype).ravel()
+        new_size = self._size + values.size
+        if new_size > self._array.size:
+            array = np.empty(max(new_size, 2 * self._array.size), dtype=self._array.dtype)
+            array[: self._size] = self._array[: self._size]
+            self._array = array
+        self._array[self._size : new_size] = values
+        self._size = new_size
+
+
+class _AppendBuffer:
+    """Entities appended to a field, accumulated client-side until flushed.
+
+    Parameters
+    ----------
+    field : _FieldBase
+        Field to append the entities to.
+
+    """
+
+    def __init__(self, field):
+        self._field = field
+        self._dtype = field._append_dtype
+        self._ncomp = field.component_count
+        self._reset()
+
+    def _reset(self):
+        self._ids = _LocalBuffer([], np.int32)
+        self._data = _LocalBuffer([], self._dtype)
+        self._sizes = _LocalBuffer([], np.int64)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def append(self, data, scopingid):
+        """Add the data of an entity to the buffer.
+
+        Parameters
+        ----------
+        data : list of int, double, str or array
+            Data for the entity.
+        scopingid : int
+            ID of the scoping.
+
+        """
+        data = np.asarray(data, dtype=self._dtype).ravel()
+        self._ids.extend(scopingid)
+        self._data.extend(data)
+        self._sizes.extend(data.size)
+
+    def append_many(self, ids, data):
+        """Add the data of several entities to the buffer.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs of the entities in the scoping.
+        data : numpy.ndarray, list
+            Data of the entities. Either an array holding the same number of values
+            for each entity, or a sequence holding the data of each entity.
+
+        """
+        ids = np.asarray(ids, dtype=np.int32).ravel()
+        if not isinstance(data, np.ndarray) and len(data) == ids.size:
+            # One entry per entity, the entities can have different sizes
+            entities = [np.asarray(entity, dtype=self._dtype).ravel() for entity in data]
+            sizes = np.array([entity.size for entity in entities], dtype=np.int64)
+            values = np.concatenate(entities) if entities else np.empty(0, self._dtype)
+        else:
+            values = np.asarray(data, dtype=self._dtype).ravel()
+            if ids.size == 0 or values.size % ids.size != 0:
+                raise ValueError(
+                    f"{values.size} values cannot be split equally between {ids.size} entities."
+                )
+            sizes = np.full(ids.size, values.size // ids.size, dtype=np.int64)
+        self._ids.extend(ids)
+        self._data.extend(values)
+        self._sizes.extend(sizes)
+
+    def flush(self):
+        """Send the buffered entities to the server and empty the buffer.
+
+        The scoping, data and data pointer of the field are each set in one request, with the
+        entities already in the field followed by the buffered ones. When the field already
+        holds entities, they are first read back in one request per property. Each flush
+        therefore transfers the whole field: append all the entities to a single buffer and
+        flush it once rather than flushing after each of them.
+        """
+        if len(self._ids) == 0:
+            return
+        field = self._field
+        field_scoping = field.scoping
+        existing_ids = np.empty(0, dtype=np.int32)
+        if field_scoping is not None and field_scoping.size > 0:
+            existing_ids = np.asarray(field_scoping.ids, dtype=np.int32).ravel()
+        existing_data = np.empty(0, dtype=self._dtype)
+        existing_pointer = np.empty(0, dtype=np.int32)
+        if existing_ids.size > 0:
+            existing_data = np.asarray(
+                list(field._get_data(np_array=False)) if self._dtype is object else field.data,
+                dtype=self._dtype,
+            ).ravel()
+            try:
+                existing_pointer = np.asarray(field._get_data_pointer(), dtype=np.int32).ravel()
+            except NotImplementedError:
+                # the data pointer cannot be retrieved: it is rebuilt from the components
+                pass
+
+        sizes = self._sizes.view
+        ids = np.concatenate((existing_ids, self._ids.view))
+        data = np.concatenate((existing_data, self._data.view))
+        pointer = np.empty(0, dtype=np.int32)
+        if existing_pointer.size > 0 or np.any(sizes != self._ncomp):
+            if existing_pointer.size == 0:
+                # entities without data pointer all hold one value per component
+                existing_pointer = np.arange(existing_ids.size, dtype=np.int32) * self._ncomp
+            new_pointer = existing_data.size + np.cumsum(sizes) - sizes
+            pointer = np.concatenate((existing_pointer, new_pointer.astype(np.int32)))
+
+        if field_scoping is None:
+            field_scoping = scoping.Scoping(location=field.location, server=field._server)
+            field_scoping.ids = ids
+            field._set_scoping(field_scoping)
+        else:
+            field_scoping.ids = ids
+        field._set_data(data.tolist() if self._dtype is object else data)
+        if pointer.size > 0:
+            field._set_data_pointer(pointer)
+        self._reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.flush()
+
+
 class _LocalFieldBase(_FieldBase):
     """Caches the internal data of the field so that it can be modified locally.
 
-    A single update request is sent to the server when the local field is deleted.
+    The data and data pointer are held in contiguous NumPy buffers. A single update request
+    is sent to the server when the local field is deleted.
 
     Parameters
     ----------
@@ -591,11 +821,30 @@ class _LocalFieldBase(_FieldBase):
 
     def __cache_data__(self, field):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
+        self._dtype = np.int32 if self._is_property_field else np.float64
+        self._data_copy = _LocalBuffer(super()._get_data(), self._dtype)
         self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._get_data_pointer().tolist()
+        self._data_pointer_copy = _LocalBuffer(super()._get_data_pointer(), np.int32)
         self._scoping_copy = super().scoping.as_local_scoping()
+        self._owner_field = field
         self._has_data_pointer = len(self._data_pointer_copy) > 0
+        # Digest of the local data taken when arrays sharing its memory are first returned,
+        # to send the data back only if it was modified through them
+        self._exposed_data_digest = None
+
+    def _data_digest(self):
+        return hashlib.blake2b(self._data_copy.view).digest()
+
+    def _expose_data(self):
+        """Return the local data, remembering that it may be modified in place."""
+        if self._exposed_data_digest is None:
+            self._exposed_data_digest = self._data_digest()
+        return self._data_copy.view
+
+    def _shaped(self, array):
+        if self._ncomp > 1:
+            return array.reshape(array.size // self._ncomp, self._ncomp)
+        return array
 
     @property
     def _num_entities(self):
@@ -656,24 +905,17 @@ class _LocalFieldBase(_FieldBase):
                 f"Requested scoping {index} is greater than the number of "
                 f"available indices {len(self._scoping_copy)}"
             )
+        data_pointer = self._data_pointer_copy.view
         if self._has_data_pointer:
-            first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) - 1:
-                last_index = self._data_pointer_copy[index + 1] - 1
+            first_index = data_pointer[index]
+            if index < len(data_pointer) - 1:
+                last_index = data_pointer[index + 1] - 1
             else:
                 last_index = len(self._data_copy) - 1
         else:
             first_index = self._ncomp * index
             last_index = self._ncomp * (index + 1) - 1
-        if self._is_property_field:
-            array = np.array(self._data_copy[first_index : last_index + 1], dtype=np.int32)
-        else:
-            array = np.array(self._data_copy[first_index : last_index + 1])
-
-        if self._ncomp > 1:
-            return array.reshape((array.size // self._ncomp, self._ncomp))
-        else:
-            return array
+        return self._shaped(self._expose_data()[first_index : last_index + 1])
 
     def get_entity_data_by_id(self, id):
         """Retrieve the data of the scoping's ID in the parameter of the field.
@@ -745,24 +987,40 @@ class _LocalFieldBase(_FieldBase):
                 data = np.array(data, dtype=np.int32)
             if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-        if (len(data) > 0 and isinstance(data, list)) or isinstance(data, (np.ndarray, np.generic)):
-            data = np.array(data).flatten().tolist()
+        data = np.asarray(data, dtype=self._dtype).ravel()
 
         data_size = len(self._data_copy)
         self._scoping_copy.append(scopingid)
         if len(self._data_pointer_copy) > 0:
-            self._data_pointer_copy.append(data_size)
+            self._data_pointer_copy.extend(data_size)
 
         self._data_copy.extend(data)
         if self._has_data_pointer == False:
-            if isinstance(data, (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size = len(data)
-            if data_size > self._ncomp:
-                self._data_pointer_copy = [i * self._ncomp for i in range(0, self._num_entities)]
+            if data.size > self._ncomp:
+                self._data_pointer_copy = _LocalBuffer(
+                    np.arange(self._num_entities) * self._ncomp, np.int32
+                )
                 self._has_data_pointer = True
 
+    def append_many(self, ids, data):
+        """Add the data of several entities to the local data.
+
+        Parameters
+        ----------
+        ids : list of int, numpy.ndarray
+            IDs of the entities in the scoping.
+        data : numpy.ndarray, list
+            Data of the entities. Either an array holding the same number of values
+            for each entity, or a sequence holding the data of each entity.
+
+        """
+        buffer = _AppendBuffer(self)
+        buffer.append_many(ids, data)
+        sizes = buffer._sizes.view
+        pointer = np.cumsum(sizes) - sizes
+        for scopingid, first, size in zip(buffer._ids.view, pointer, sizes):
+            self.append(buffer._data.view[first : first + size], int(scopingid))
+
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
 
@@ -784,7 +1042,7 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
 
         """
-        return self._data_copy
+        return self._data_copy.view.tolist()
 
     @property
     def data(self):
@@ -813,13 +1071,14 @@ class _LocalFieldBase(_FieldBase):
          [-3.51074714e-06  2.16872928e-08  6.40738989e-05]
          [ 1.03542516e-02 -3.53018374e-03 -3.98914380e-05]]
 
+        Notes
+        -----
+        The array is a view on the local data: modifications done in place are sent
+        to the server with the rest of the local data. Appending data to the field
+        can invalidate it.
+
         """
-        if self._ncomp > 1:
-            return np.array(self._data_copy).reshape(
-                len(self._data_copy) // self._ncomp, self._ncomp
-            )
-        else:
-            return np.array(self._data_copy)
+        return self._shaped(self._expose_data())
 
     @data.setter
     @_setter
@@ -833,12 +1092,7 @@ class _LocalFieldBase(_FieldBase):
                     f"An array of shape {self.shape} is expected and "
                     f"shape {data.shape} was input"
                 )
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data) > 0 and isinstance(data, list):
-            self._data_copy = np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+        self._data_copy = _LocalBuffer(data, self._dtype)
 
     @property
     def elementary_data_count(self):
@@ -875,7 +1129,7 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.view.copy()
 
     @property
     def _data_pointer_as_list(self):
@@ -886,15 +1140,12 @@ class _LocalFieldBase(_FieldBase):
         List
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.view.tolist()
 
     @_data_pointer.setter
     @_setter
     def _data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
+        self._data_pointer_copy = _LocalBuffer(data, np.int32)
         if self._has_data_pointer == False and len(data) > 0:
             self._has_data_pointer = True
 
@@ -904,15 +1155,12 @@ class _LocalFieldBase(_FieldBase):
 
         See :attr:`_FieldBase.data_pointer` for full documentation.
         """
-        return np.array(self._data_pointer_copy)
+        return self._data_pointer_copy.view.copy()
 
     @data_pointer.setter
     @_setter
     def data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
+        self._data_pointer_copy = _LocalBuffer(data, np.int32)
         if self._has_data_pointer == False and len(data) > 0:
             self._has_data_pointer = True
 
@@ -964,10 +1212,19 @@ class _LocalFieldBase(_FieldBase):
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_data(self._data_copy)
-            super()._set_data_pointer(self._data_pointer_copy)
+            super()._set_data(self._data_copy.view)
+            super()._set_data_pointer(self._data_pointer_copy.view)
             super()._set_scoping(self._scoping_copy)
             self._scoping_copy = None
+        elif (
+            getattr(self, "_exposed_data_digest", None) is not None
+            and self._data_digest() != self._exposed_data_digest
+        ):
+            # The data was modified in place through the returned arrays
+            super()._set_data(self._data_copy.view)
+        else:
+            return
+        _invalidate_read_cache(self._owner_field)
 
     def __enter__(self):
         return self
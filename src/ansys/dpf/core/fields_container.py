@@ -31,16 +31,51 @@ from __future__ import annotations
 from contextlib import suppress
 from typing import TYPE_CHECKING, Sequence, Union
 
+import numpy as np
+
 from ansys import dpf
-from ansys.dpf.core import errors as dpf_errors, field
+from ansys.dpf.core import _concurrency, errors as dpf_errors, field
+from ansys.dpf.core._mapping_helpers import IdToIndexMap
 from ansys.dpf.core.check_version import server_meet_version
 from ansys.dpf.core.collection_base import CollectionBase
 from ansys.dpf.core.common import shell_layers
+from ansys.dpf.core.scoping import Scoping
 
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.dpf.core import Operator, Result
 
 
+def _dense_layout(entry):
+    """Return the entity IDs and the number of components of a field with one value per entity."""
+    ids = np.asarray(entry.scoping.ids, dtype=np.int64).reshape(-1)
+    if entry.elementary_data_count != ids.size:
+        raise ValueError(
+            f"Fields with one elementary data per entity are expected, a field has "
+            f"{entry.elementary_data_count} elementary data for {ids.size} entities."
+        )
+    return ids, entry.component_count
+
+
+def _fill_dense(entry, ids, id_map, target):
+    """Write the data of a field at the rows of ``target`` of its entities, and NaN elsewhere."""
+    positions = id_map.lookup(ids)
+    if (
+        positions.size == target.shape[0]
+        and target.dtype == np.float64
+        and target.flags.c_contiguous
+        and np.array_equal(positions, np.arange(positions.size))
+    ):
+        # the field is already aligned: its data is received directly into target
+        entry.copy_data_to(target)
+        return
+    data = np.asarray(entry.get_data(dtype=target.dtype)).reshape(ids.size, target.shape[1])
+    mapped = positions >= 0
+    covered = np.zeros(target.shape[0], dtype=bool)
+    covered[positions[mapped]] = True
+    target[~covered] = np.nan
+    target[positions[mapped]] = data[mapped]
+
+
 class FieldsContainer(CollectionBase["field.Field"]):
     """Represents a fields container, which contains fields belonging to a common result.
 
@@ -109,10 +144,158 @@ class FieldsContainer(CollectionBase["field.Field"]):
 
         self._component_index = None  # component index
         self._component_info = None  # for norm/max/min
+        self._stream_dtype = None  # type the data of the fields is retrieved with
 
     def create_subtype(self, obj_by_copy):
         """Create a field subtype."""
-        return field.Field(field=obj_by_copy, server=self._server)
+        out = field.Field(field=obj_by_copy, server=self._server)
+        if self._stream_dtype is not None:
+            out._stream_dtype = self._stream_dtype
+        return out
+
+    def get_data(self, dtype=None) -> list:
+        """Retrieve the data of all the fields with the precision chosen for this request.
+
+        The fields are retrieved in one request with :meth:`get_entries_and_label_spaces`.
+        With a gRPC server, ``numpy.float32`` data is converted by the server and streamed as
+        4-byte floats, which halves the data transferred.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+            Type of the returned data, ``numpy.float64`` or ``numpy.float32``.
+            The default is ``None``, in which case the type of :attr:`Field.data` is used.
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            Data of each field, in index order.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_msup_transient())
+        >>> fc = model.results.displacement.on_all_time_freqs.eval()
+        >>> data = fc.get_data(dtype=np.float32)
+        >>> data[0].dtype
+        dtype('float32')
+
+        """
+        if dtype is not None:
+            field._is_single_precision(dtype)
+        return [entry.get_data(dtype=dtype) for entry, _ in self.get_entries_and_label_spaces()]
+
+    def to_numpy(self, label="time", align_to=None, label_space=None, dtype=np.float64, out=None):
+        """Export the data of the fields as a dense array of shape ``(labels, entities, components)``.
+
+        The fields are sorted by their value of ``label`` and the data of each field is
+        placed at the rows of the entities it holds, with vectorized ID mapping. With a gRPC
+        server, the fields are retrieved concurrently, and a field whose IDs are already in
+        the order of ``align_to`` is streamed directly into its slice of the array.
+
+        Parameters
+        ----------
+        label : str, optional
+            Label along the first axis of the array. Each selected field must have a
+            different value for it. The default is ``"time"``.
+        align_to : Scoping, list[int], numpy.ndarray, optional
+            Entity IDs along the second axis. Data of other entities is dropped. The default
+            is ``None``, in which case the IDs of all the fields are used, in their order of
+            appearance.
+        label_space : dict[str,int], optional
+            Selects the fields to export, for example ``{"complex": 0}`` for the real parts
+            of a harmonic result. The default is ``None``, in which case all the fields are
+            exported.
+        dtype : numpy.dtype, optional
+            Type of the array, ``numpy.float64`` or ``numpy.float32``. With a gRPC server,
+            ``numpy.float32`` data is streamed as 4-byte floats.
+        out : numpy.ndarray, optional
+            Preallocated array to fill, of shape ``(labels, entities, components)`` and of type
+            ``float64`` or ``float32``, for example a :class:`numpy.memmap` for containers
+            which do not fit in memory. ``dtype`` is then the type of ``out``.
+
+        Returns
+        -------
+        data : numpy.ndarray
+            Data of the fields. Values of entities missing from a field are NaN.
+        label_ids : numpy.ndarray
+            Sorted values of ``label`` along the first axis.
+        ids : numpy.ndarray
+            Entity IDs along the second axis.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_msup_transient())
+        >>> fc = model.results.displacement.on_all_time_freqs.eval()
+        >>> data, time_ids, node_ids = fc.to_numpy()
+        >>> data.shape == (len(time_ids), len(node_ids), 3)
+        True
+
+        """
+        labels = self.labels
+        if label not in labels:
+            raise ValueError(
+                f"The fields container has no label {label!r}, its labels are {labels}."
+            )
+        dtype = np.dtype(out.dtype if out is not None else dtype)
+        field._is_single_precision(dtype)
+        label_space = label_space or {}
+        fields_by_label = {}
+        for entry, entry_label_space in self.get_entries_and_label_spaces():
+            if any(entry_label_space.get(key) != value for key, value in label_space.items()):
+                continue
+            label_id = entry_label_space[label]
+            if label_id in fields_by_label:
+                raise ValueError(
+                    f"Several fields have the {label} {label_id}, "
+                    f"select one of them with label_space, for example {{'complex': 0}}."
+                )
+            fields_by_label[label_id] = entry
+        label_ids = np.array(sorted(fields_by_label), dtype=np.int64)
+        fields = [fields_by_label[label_id] for label_id in label_ids.tolist()]
+
+        layouts = self._map_requests(_dense_layout, [(entry,) for entry in fields])
+        n_comps = {n_comp for _, n_comp in layouts}
+        if len(n_comps) > 1:
+            raise ValueError(
+                f"All the fields must have the same number of components, got {sorted(n_comps)}."
+            )
+        n_comp = n_comps.pop() if n_comps else 1
+        if align_to is None:
+            all_ids = np.concatenate([ids for ids, _ in layouts] or [np.empty(0, np.int64)])
+            _, first = np.unique(all_ids, return_index=True)
+            ids = all_ids[np.sort(first)]
+        else:
+            if isinstance(align_to, Scoping):
+                align_to = align_to.ids
+            ids = np.asarray(align_to, dtype=np.int64).reshape(-1)
+
+        shape = (len(fields), ids.size, n_comp)
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"The output array must be of shape {shape}, not {out.shape}.")
+        id_map = IdToIndexMap(ids)
+        self._map_requests(
+            _fill_dense,
+            [
+                (entry, entry_ids, id_map, out[i])
+                for i, (entry, (entry_ids, _)) in enumerate(zip(fields, layouts))
+            ],
+        )
+        return out, label_ids, ids
+
+    def _map_requests(self, func, arguments):
+        """Return ``[func(*args) for args in arguments]``, run concurrently on gRPC servers."""
+        uses_grpc_streams = self._server.get_api_for_type(capi=False, grpcapi=True)
+        if not uses_grpc_streams or len(arguments) < 2:  # noqa: PLR2004
+            return [func(*args) for args in arguments]
+        requests = [_concurrency.submit(self._server, func, *args) for args in arguments]
+        return [request.result() for request in requests]
 
     def get_fields_by_time_complex_ids(self, timeid=None, complexid=None):
         """Retrieve fields at a requested time ID or complex ID.
@@ -505,8 +688,8 @@ class FieldsContainer(CollectionBase["field.Field"]):
         """
         fc = FieldsContainer(server=server)
         fc.labels = self.labels
-        for i, f in enumerate(self):
-            fc.add_field(self.get_label_space(i), f.deep_copy(server))
+        for f, label_space in self.get_entries_and_label_spaces():
+            fc.add_field(label_space, f.deep_copy(server))
         with suppress(Exception):
             if server_meet_version("2027.1.0pre0", self._server):
                 self.deep_copy_supports(fc)
@@ -590,7 +773,11 @@ class FieldsContainer(CollectionBase["field.Field"]):
             Additional keyword arguments for the animator.
             Used by :func:`pyvista.Plotter` (off_screen, cpos, ...),
             or by :func:`pyvista.Plotter.open_movie`
-            (framerate, quality, ...)
+            (framerate, quality, ...).
+            A ``meshed_region`` keyword argument can be given when all the fields share the
+            same mesh support, so that it is converted to VTK only once for all the frames.
+            A ``pipeline=True`` keyword argument computes each frame while the previous one is
+            rendered, see :meth:`Animator.animate <ansys.dpf.core.animator.Animator.animate>`.
         """
         from ansys.dpf.core.animator import Animator
 
@@ -28,7 +28,8 @@ Contains functions to simplify creating fields.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Sequence
 
 import numpy as np
 
@@ -60,8 +61,75 @@ def field_from_array(
     field:
         DPF field constructed from the array.
     """
-    from ansys.dpf.core import Field, natures
+    from ansys.dpf.core import Field
 
+    arr, nature = _array_and_nature(arr)
+    field = Field(nentities=arr.shape[0], nature=nature, server=server)
+    _set_field_from_array(field, arr)
+    return field
+
+
+def fields_from_arrays(
+    arrays: Sequence[list | np.ndarray],
+    server: AnyServerType = None,
+    max_workers: int = None,
+) -> list[Field]:
+    """Create DPF vector or scalar fields from several numpy arrays or Python lists.
+
+    With a gRPC server, the data of the fields is uploaded concurrently, each field
+    over its own stream.
+
+    Parameters
+    ----------
+    arrays:
+        Numpy arrays or Python lists containing either 1 or 3 dimensions.
+    server:
+        Server with the channel connected to the remote or local instance.
+        The default is ``None``, in which case an attempt is made to use the
+        global server.
+    max_workers:
+        Maximum number of concurrent uploads. The default is ``None``, in which
+        case the default of :class:`concurrent.futures.ThreadPoolExecutor` is used.
+
+    Returns
+    -------
+    fields:
+        DPF fields constructed from the arrays, in the same order.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ansys.dpf.core import fields_factory
+    >>> fields = fields_factory.fields_from_arrays([np.zeros((10, 3)), np.ones(10)])
+    >>> [field.component_count for field in fields]
+    [3, 1]
+
+    """
+    from ansys.dpf.core import Field
+
+    server = server_module.get_or_create_server(server)
+    arrays_and_natures = [_array_and_nature(arr) for arr in arrays]
+    fields = [
+        Field(nentities=arr.shape[0], nature=nature, server=server)
+        for arr, nature in arrays_and_natures
+    ]
+    uses_grpc_streams = server.get_api_for_type(capi=False, grpcapi=True)
+    if not uses_grpc_streams or len(fields) < 2 or max_workers == 1:  # noqa: PLR2004
+        for field, (arr, _) in zip(fields, arrays_and_natures):
+            _set_field_from_array(field, arr)
+        return fields
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        uploads = [
+            executor.submit(_set_field_from_array, field, arr)
+            for field, (arr, _) in zip(fields, arrays_and_natures)
+        ]
+        for upload in uploads:
+            upload.result()
+    return fields
+
+
+def _array_and_nature(arr):
+    """Return the array to set as data of a field, and the nature of this field."""
     arr = np.asarray(arr)
 
     if not np.issubdtype(arr.dtype, np.number):
@@ -84,12 +152,12 @@ def field_from_array(
             raise shp_err
     else:
         raise shp_err
+    return arr, nature
+
 
-    n_entities = arr.shape[0]
-    field = Field(nentities=n_entities, nature=nature, server=server)
+def _set_field_from_array(field, arr):
     field.data = arr
-    field.scoping.ids = np.arange(1, n_entities + 1)
-    return field
+    field.scoping.ids = np.arange(1, arr.shape[0] + 1)
 
 
 def create_matrix_field(
@@ -22,9 +22,61 @@
 
 """Incremental."""
 
-from typing import Any, Dict
+from dataclasses import dataclass, field as dataclass_field
+import time
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
 
 from ansys.dpf import core
+from ansys.dpf.core import _concurrency
+
+
+@dataclass
+class ChunkStatistics:
+    """Size and evaluation time of the outputs of the first operator for a chunk of the scoping."""
+
+    num_ids: int
+    nbytes: int
+    seconds: float
+
+
+@dataclass
+class IncrementalStatistics:
+    """Statistics of the evaluations run to estimate the chunk size of an incremental workflow."""
+
+    chunks: List[ChunkStatistics] = dataclass_field(default_factory=list)
+    chunk_size: int = None
+
+    @property
+    def peak_bytes(self) -> int:
+        """Largest size of the outputs of a measured chunk, in bytes."""
+        return max((chunk.nbytes for chunk in self.chunks), default=0)
+
+    @property
+    def bytes_per_id(self) -> float:
+        """Size of the outputs for one ID of the scoping, measured on the largest chunk."""
+        if not self.chunks:
+            return 0.0
+        largest = max(self.chunks, key=lambda chunk: chunk.num_ids)
+        return largest.nbytes / largest.num_ids
+
+    @property
+    def seconds_per_id(self) -> float:
+        """Evaluation time for one ID of the scoping, measured on the largest chunk."""
+        if not self.chunks:
+            return 0.0
+        largest = max(self.chunks, key=lambda chunk: chunk.num_ids)
+        return largest.seconds / largest.num_ids
+
+    def __str__(self):
+        """Summarize the measured chunks."""
+        lines = [
+            f"chunk {i}: {chunk.num_ids} ids, {chunk.nbytes} bytes, {chunk.seconds:.3f} s"
+            for i, chunk in enumerate(self.chunks)
+        ]
+        lines.append(f"peak output size: {self.peak_bytes} bytes, chunk_size: {self.chunk_size}")
+        return "\n".join(lines)
 
 
 class IncrementalHelper:
@@ -69,7 +121,9 @@ class IncrementalHelper:
         start_op : Operator
             First operator in the workflow to convert
         end_op : Operator
-            Last operator in the workflow to convert (Operator providing the meaningful output)
+            Last operator in the workflow to convert (Operator providing the meaningful output).
+            Can be ``None`` when the output of the first operator is streamed with
+            :meth:`iter_chunks`.
         scoping : Scoping
             Scoping used to chunk the data
         scoping_pin : int, optional
@@ -80,18 +134,28 @@ class IncrementalHelper:
         # but as we don't have a consistent method to check,
         # it should be permissive in the case the specification isn't up to date
         self._start_op = start_op
-        self._end_op = self._map_to_incremental(end_op)
+        # mapped to its incremental version when the workflow is split
+        self._end_op = end_op
 
         self._scoping = scoping
         self._scoping_pin = self._find_scoping_pin(scoping_pin)
+        self.statistics = IncrementalStatistics()
+
+    def estimate_size(
+        self, max_bytes: int, _dict_inputs: Dict[int, Any] = {}, max_calibrations: int = 1
+    ) -> int:
+        """Estimates the chunk size from the measured number of bytes outputted in one iteration.
 
-    def estimate_size(self, max_bytes: int, _dict_inputs: Dict[int, Any] = {}) -> int:
-        """Estimates the chunk size from the estimated number of bytes outputted in one iteration.
+        The first operator is run for the first ID of the scoping, and the size of its outputs
+        is measured over all the fields with their actual data types, scopings and data
+        pointers. The chunk size is then calibrated by running the first operator on the
+        estimated chunk and adjusting the chunk size to the measured size, up to
+        ``max_calibrations`` times, so that outputs varying with the IDs of the scoping
+        stay within ``max_bytes``.
 
-        Estimation is based on the size of the output for one ID of the given time_scoping,
-        so it will run the operator for only one iteration.
+        The sizes and evaluation times measured are stored in :attr:`statistics`.
 
-        It only supports Field and FieldContainer.
+        It only supports fields and collections of fields.
         For other types, you should specify chunk_size argument in the split() method.
 
         Parameters
@@ -100,39 +164,59 @@ class IncrementalHelper:
                 Max allowed size of an output from the first operator, for one iteration (in bytes).
             _dict_inputs: dict[int,any]
                 Dictionary associating pin number to inputs, for evaluating output of one iteration.
+            max_calibrations : int, optional
+                Maximum number of evaluations of a whole chunk used to adjust the chunk size
+                (default = 1). With ``0``, the estimation relies on the first ID only.
         """
+        ids = np.asarray(self._scoping.ids)
+        self.statistics = IncrementalStatistics()
         # Evaluate for the first element to try to guess memory consumption
-        # It is best to use with a lot of elements
-        first_id = self._scoping.ids[0]
-        srv = self._scoping._server
-        loc = self._scoping.location
-        _dict_inputs[self._scoping_pin] = core.Scoping(server=srv, ids=[first_id], location=loc)
-
-        outputs = self._prerun(_dict_inputs)
-
-        _outputs = outputs._outputs
-        data = map(lambda o: o.get_data(), _outputs)
-        # Output sizes of all inputs for one iteration
-        sizes = map(self._compute_size, data)
-
-        # Total size for one ID in the scoping
-        size_for_one = sum(sizes)
-        # total_size = size_for_one * self._scoping.size
-
-        num_iter = int(max_bytes / size_for_one)
-        num_iter = min(max(num_iter, 1), self._scoping.size)  # clamp(num_iter, 1, scoping size)
-        return num_iter  # math.gcd(num_iter, self._scoping.size)
+        chunk_size = self._chunk_size_for(self._measure(ids[:1], _dict_inputs), max_bytes)
+        for _ in range(max_calibrations):
+            if chunk_size <= 1 or chunk_size >= ids.size:
+                break
+            measured = self._measure(ids[:chunk_size], _dict_inputs)
+            if max_bytes / 2 <= measured.nbytes <= max_bytes:
+                break
+            chunk_size = self._chunk_size_for(measured, max_bytes)
+        self.statistics.chunk_size = chunk_size
+        return chunk_size
+
+    def _chunk_size_for(self, measured: ChunkStatistics, max_bytes: int) -> int:
+        bytes_per_id = measured.nbytes / measured.num_ids
+        num_iter = int(max_bytes / bytes_per_id) if bytes_per_id else self._scoping.size
+        return min(max(num_iter, 1), self._scoping.size)  # clamp(num_iter, 1, scoping size)
+
+    def _measure(self, ids, _dict_inputs: Dict[int, Any]) -> ChunkStatistics:
+        dict_inputs = dict(_dict_inputs)
+        dict_inputs[self._scoping_pin] = core.Scoping(
+            server=self._scoping._server, ids=ids, location=self._scoping.location
+        )
+        start = time.perf_counter()
+        outputs = self._prerun(dict_inputs)
+        nbytes = sum(self._compute_size(output.get_data()) for output in outputs._outputs)
+        chunk = ChunkStatistics(int(len(ids)), nbytes, time.perf_counter() - start)
+        self.statistics.chunks.append(chunk)
+        return chunk
 
     def _compute_size(self, obj):
-        if isinstance(obj, core.FieldsContainer):
-            fc = obj
-            return self._compute_size(fc[0])
+        if isinstance(obj, core.CollectionBase):
+            return sum(self._compute_size(entry) for entry, _ in obj.get_entries_and_label_spaces())
         elif isinstance(obj, core.Field):
-            field = obj
-            # Double = 8 bytes assumption
-            return field.size * 8
-
-        raise NotImplementedError()
+            itemsize = np.dtype(np.float64).itemsize
+        elif isinstance(obj, core.PropertyField):
+            itemsize = np.dtype(np.int32).itemsize
+        elif isinstance(obj, core.CustomTypeField):
+            itemsize = np.dtype(obj._type).itemsize
+        else:
+            raise NotImplementedError()
+        field = obj
+        num_entities = field.scoping.size
+        size = field.size
+        # Entities with varying numbers of values are located through a data pointer
+        has_data_pointer = size != num_entities * field.component_count
+        # int32 scoping ids and data pointer
+        return size * itemsize + num_entities * 4 * (1 + has_data_pointer)
 
     def _prerun(self, _dict_inputs: Dict[int, Any]):
         for pin_idx, val in _dict_inputs.items():
@@ -140,6 +224,78 @@ class IncrementalHelper:
         self._start_op.run()
         return self._start_op.outputs
 
+    def iter_chunks(
+        self,
+        chunk_size: int,
+        end_input_pin: int = 0,
+        output_type=core.types.fields_container,
+        end_output_pin: int = 0,
+    ) -> Iterator:
+        """Evaluate the workflow chunk by chunk and yield the output of each chunk.
+
+        For each chunk, the chunk of the scoping is connected to the first operator and the
+        output of the last operator is evaluated, through all the operators between them. When
+        the helper is created without ``end_op``, the output of the first operator is yielded.
+
+        Each chunk is yielded as soon as it is computed, while the server computes the next
+        one, so that the chunks can be written to disk or reduced on the client with a memory
+        bounded by the size of two chunks.
+
+        Parameters
+        ----------
+            chunk_size : int
+                Number of IDs of the scoping per chunk
+            end_input_pin : int, optional
+                Pin number of the output to yield from the first operator, when there is no
+                last operator (default = 0)
+            output_type : types, optional
+                Type of the output to yield (default = types.fields_container)
+            end_output_pin : int, optional
+                Pin number of the output to yield from the last operator (default = 0)
+
+        Yields
+        ------
+        FieldsContainer
+            Output of the workflow for each chunk of the scoping, in scoping order.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> ds = dpf.DataSources(examples.find_msup_transient())
+        >>> scoping = dpf.time_freq_scoping_factory.scoping_on_all_time_freqs(ds)
+        >>> result_op = dpf.operators.result.displacement(data_sources=ds)
+        >>> helper = dpf.IncrementalHelper(result_op, None, scoping)
+        >>> for fc in helper.iter_chunks(chunk_size=5):
+        ...     num_fields = len(fc)
+        """
+        if self._end_op is None:
+            return self._iter_chunks(chunk_size, self._start_op, end_input_pin, output_type)
+        return self._iter_chunks(chunk_size, self._end_op, end_output_pin, output_type)
+
+    def _iter_chunks(self, chunk_size, output_op, output_pin, output_type):
+        ids = np.asarray(self._scoping.ids)
+        chunk_size = max(int(chunk_size), 1)
+        chunks = [ids[i : i + chunk_size] for i in range(0, ids.size, chunk_size)]
+        if not chunks:
+            return
+        server = self._start_op._server
+
+        def evaluate(chunk_ids):
+            scoping = core.Scoping(
+                server=self._scoping._server, ids=chunk_ids, location=self._scoping.location
+            )
+            self._start_op.connect(self._scoping_pin, scoping)
+            return output_op.get_output(output_pin, output_type)
+
+        future = _concurrency.submit(server, evaluate, chunks[0])
+        for next_ids in chunks[1:]:
+            output = future.result()
+            # The workflow is reconnected once its previous output is retrieved
+            future = _concurrency.submit(server, evaluate, next_ids)
+            yield output
+        yield future.result()
+
     # Transforms a user workflow:
     #
     #           +----------+    +---------------+    +---------+
@@ -180,6 +336,9 @@ class IncrementalHelper:
         # Enables incremental evaluation:
         # Using for_each, chunk_in_for_each_range and incremental version of the last operator
         # by returning two operators with remapped inputs and outputs to other operators
+        if self._end_op is None:
+            raise ValueError("An end_op is required to split a workflow, use iter_chunks instead.")
+        end_op = self._map_to_incremental(self._end_op)
 
         _server = self._start_op._server
 
@@ -197,7 +356,7 @@ class IncrementalHelper:
 
         # connect inputs
         dict_outputs = core.Operator.operator_specification(
-            op_name=self._end_op.name, server=_server
+            op_name=end_op.name, server=_server
         ).outputs
         if not dict_outputs:
             # temporary patch for incremental:: operators
@@ -206,7 +365,7 @@ class IncrementalHelper:
         fe_pin_idx = 3  # see doc of for_each
         for pin_idx in dict_outputs.keys():
             # connect end_op to for_each
-            for_each.connect(fe_pin_idx, self._end_op, pin_idx)
+            for_each.connect(fe_pin_idx, end_op, pin_idx)
             # remap
             forward.connect(pin_idx, for_each, fe_pin_idx)
             fe_pin_idx += 1
@@ -290,6 +449,8 @@ def split_workflow_in_chunks(  # noqa: PLR0913
     chunk_size: int = None,
     scoping_pin: int = None,
     end_input_pin: int = 0,
+    max_calibrations: int = 1,
+    stream: bool = False,
 ):
     """Transform a workflow into an incrementally evaluating one.
 
@@ -297,7 +458,13 @@ def split_workflow_in_chunks(  # noqa: PLR0913
     as the estimation of the chunk size.
 
     If no chunk_size is specified, the function will attempt to estimate the value
-    by calling IncrementalHelper.estimate_size(max_bytes, dict_inputs).
+    by calling IncrementalHelper.estimate_size(max_bytes, dict_inputs, max_calibrations),
+    and print the sizes and evaluation times measured.
+
+    With ``stream=True``, a generator yielding the first output of ``end_op`` for each chunk
+    is returned instead of an operator, see :meth:`IncrementalHelper.iter_chunks`. ``end_op``
+    is then evaluated as is, without mapping it to an incremental operator. Without ``end_op``,
+    the output of the first operator is yielded.
 
     If no scoping_pin is specified, the function will attempt to deduce the correct pin,
     which would be the first input pin matching a scoping type.
@@ -313,7 +480,8 @@ def split_workflow_in_chunks(  # noqa: PLR0913
         rescope : bool, optional
             If enabled, will rescope final outputs with the given scoping (default = False)
         max_bytes : int, optional
-            Max allowed size for the output from the first operator (default = 1024**3)
+            Max allowed size in bytes for the output from the first operator
+            for one chunk (default = 1024**3)
         dict_inputs : dict[int, any], optional
             Inputs to pass to the first operator, used only for the estimation run (default = {})
         chunk_size = int, optional
@@ -322,12 +490,29 @@ def split_workflow_in_chunks(  # noqa: PLR0913
             The pin number on the first operator to bind the scoping (default = None)
         end_input_pin : int, optional
             Pin number of the output to use from the first operator(default = 0)
+        max_calibrations : int, optional
+            Maximum number of chunks evaluated to adjust the estimated chunk size (default = 1)
+        stream : bool, optional
+            Whether to return a generator over the output of each chunk (default = False)
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> ds = dpf.DataSources(examples.find_msup_transient())
+    >>> scoping = dpf.time_freq_scoping_factory.scoping_on_all_time_freqs(ds)
+    >>> result_op = dpf.operators.result.displacement(data_sources=ds)
+    >>> for fc in dpf.split_workflow_in_chunks(result_op, None, scoping, chunk_size=5, stream=True):
+    ...     max_norm = max(abs(field.data).max() for field in fc)
     """
     splitter = IncrementalHelper(start_op, end_op, scoping, scoping_pin)
 
     if chunk_size == None:
         print(f"Estimating chunk_size with max_bytes: {max_bytes}")
-        chunk_size = splitter.estimate_size(max_bytes, dict_inputs)
+        chunk_size = splitter.estimate_size(max_bytes, dict_inputs, max_calibrations)
+        print(splitter.statistics)
         print(f"Done. chunk_size set to {chunk_size} (scoping size: {scoping.size})")
 
+    if stream:
+        return splitter.iter_chunks(chunk_size, end_input_pin)
     return splitter.split(chunk_size, end_input_pin, rescope)
@@ -36,9 +36,11 @@ import warnings
 import numpy as np
 
 from ansys.dpf.core import field, property_field, scoping, server as server_module
+from ansys.dpf.core._mapping_helpers import IdToIndexMap
 from ansys.dpf.core.cache import class_handling_cache
 from ansys.dpf.core.check_version import meets_version, version_requires
 from ansys.dpf.core.common import (
+    elemental_properties,
     locations,
     natures,
     nodal_properties,
@@ -56,13 +58,20 @@ def update_grid(func):
 
     def wrapper(*args, **kwargs):
         mesh = args[0]
-        if mesh._full_grid is not None:
+        if mesh._full_grid is not None or mesh._vtk_grids:
             # Treat each setter separately to improve performance by updating the minimum required.
             if func.__name__ == "set_coordinates_field":
                 # When setting node coordinates
                 from ansys.dpf.core.vtk_helper import vtk_update_coordinates
 
-                vtk_update_coordinates(vtk_grid=mesh._full_grid, coordinates_array=args[1].data)
+                coordinates_array = args[1].data
+                if mesh._full_grid is not None:
+                    vtk_update_coordinates(
+                        vtk_grid=mesh._full_grid, coordinates_array=coordinates_array
+                    )
+                # Cached grids only keep the cells, their points follow the new coordinates
+                for vtk_grid in mesh._vtk_grids.values():
+                    vtk_update_coordinates(vtk_grid=vtk_grid, coordinates_array=coordinates_array)
 
         return func(*args, **kwargs)
 
@@ -143,8 +152,148 @@ class MeshedRegion:
         self._full_grid = None
         self._elements = None
         self._nodes = None
+        self._id_to_index_maps = {}
+        self._vtk_grids = {}
         self.as_linear = None
 
+    @classmethod
+    def from_arrays(  # noqa: PLR0913
+        cls,
+        node_ids,
+        coordinates,
+        element_ids,
+        element_types,
+        connectivity,
+        offsets=None,
+        unit=None,
+        server=None,
+    ):
+        """
+        Create a meshed region from NumPy arrays in a few bulk transfers.
+
+        The coordinates field, the element types and the connectivity property fields
+        are each sent to the server at once, instead of adding the nodes and elements
+        one by one with :meth:`Nodes.add_nodes <ansys.dpf.core.nodes.Nodes.add_nodes>` and
+        :meth:`Elements.add_elements <ansys.dpf.core.elements.Elements.add_elements>`.
+
+        Parameters
+        ----------
+        node_ids : numpy.ndarray, list
+            IDs of the nodes.
+        coordinates : numpy.ndarray, list
+            Coordinates of the nodes, with shape ``(n_nodes, 3)``.
+        element_ids : numpy.ndarray, list
+            IDs of the elements.
+        element_types : numpy.ndarray, list
+            Type of each element, as defined by
+            :class:`ansys.dpf.core.elements.element_types`.
+        connectivity : numpy.ndarray, list
+            Zero-based node indices of the elements. Either a flat array of all
+            the elements' node indices, described by ``offsets``, or a 2D array of shape
+            ``(n_elements, n_nodes_per_element)`` when ``offsets`` is ``None``.
+        offsets : numpy.ndarray, list, optional
+            Start of each element in the flat ``connectivity`` array, optionally
+            followed by the total size of ``connectivity`` (CSR offsets).
+        unit : str, optional
+            Unit of the coordinates.
+        server : ansys.dpf.core.server, optional
+            Server with the channel connected to the remote or local instance.
+            The default is ``None``, in which case an attempt is made to use the
+            global server.
+
+        Returns
+        -------
+        mesh : MeshedRegion
+
+        Examples
+        --------
+        Create a meshed region with two quadrangle shells.
+
+        >>> import numpy as np
+        >>> import ansys.dpf.core as dpf
+        >>> coordinates = np.array(
+        ...     [[0., 0., 0.], [1., 0., 0.], [2., 0., 0.], [0., 1., 0.], [1., 1., 0.], [2., 1., 0.]]
+        ... )
+        >>> mesh = dpf.MeshedRegion.from_arrays(
+        ...     node_ids=np.arange(1, 7),
+        ...     coordinates=coordinates,
+        ...     element_ids=[1, 2],
+        ...     element_types=[dpf.element_types.Quad4.value] * 2,
+        ...     connectivity=[[0, 1, 4, 3], [1, 2, 5, 4]],
+        ... )
+        >>> mesh.elements.n_elements
+        2
+
+        """
+        node_ids = np.asarray(node_ids, dtype=np.int32).reshape(-1)
+        coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 3)
+        element_ids = np.asarray(element_ids, dtype=np.int32).reshape(-1)
+        element_types = np.asarray(element_types, dtype=np.int32).reshape(-1)
+        connectivity = np.asarray(connectivity, dtype=np.int32)
+        n_nodes = node_ids.size
+        n_elements = element_ids.size
+
+        if coordinates.shape[0] != n_nodes:
+            raise ValueError(
+                f"Expected coordinates for {n_nodes} nodes, got {coordinates.shape[0]}."
+            )
+        if element_types.size != n_elements:
+            raise ValueError(
+                f"Expected element types for {n_elements} elements, got {element_types.size}."
+            )
+        if offsets is None:
+            if connectivity.ndim != 2 or connectivity.shape[0] != n_elements:  # noqa: PLR2004
+                raise ValueError(
+                    "Without offsets, the connectivity must be an array of shape "
+                    "(n_elements, n_nodes_per_element)."
+                )
+            data_pointer = np.arange(n_elements, dtype=np.int32) * connectivity.shape[1]
+        else:
+            data_pointer = np.asarray(offsets, dtype=np.int32).reshape(-1)
+            if data_pointer.size == n_elements + 1:
+                data_pointer = data_pointer[:-1]
+            elif data_pointer.size != n_elements:
+                raise ValueError(
+                    f"Expected {n_elements} or {n_elements + 1} offsets, got {data_pointer.size}."
+                )
+        connectivity = connectivity.reshape(-1)
+
+        mesh = cls(num_nodes=n_nodes, num_elements=n_elements, server=server)
+        server = mesh._server
+
+        coordinates_field = field.Field(
+            nentities=n_nodes, nature=natures.vector, location=locations.nodal, server=server
+        )
+        coordinates_field.scoping = scoping.Scoping(
+            ids=node_ids, location=locations.nodal, server=server
+        )
+        coordinates_field.data = coordinates
+        if unit is not None:
+            coordinates_field.unit = unit
+        mesh.set_coordinates_field(coordinates_field)
+
+        elements_scoping = scoping.Scoping(
+            ids=element_ids, location=locations.elemental, server=server
+        )
+        element_types_field = property_field.PropertyField(
+            nentities=n_elements, location=locations.elemental, server=server
+        )
+        element_types_field.scoping = elements_scoping
+        element_types_field.data = element_types
+        mesh.set_property_field(elemental_properties.element_type, element_types_field)
+
+        connectivities_field = property_field.PropertyField(
+            nentities=n_elements, location=locations.elemental, server=server
+        )
+        connectivities_field.scoping = elements_scoping
+        connectivities_field.data = connectivity
+        connectivities_field._data_pointer = data_pointer
+        mesh.set_property_field(elemental_properties.connectivity, connectivities_field)
+
+        if unit is not None:
+            mesh.unit = unit
+        return mesh
+
     def _get_scoping(self, loc=locations.nodal):
         """Return ids of the elements or nodes of the mesh.
 
@@ -179,6 +328,29 @@ class MeshedRegion:
             pass
         return scop_to_return
 
+    def _id_to_index_map(self, location):
+        """Return the cached vectorized map between IDs and indices of the entities at a location.
+
+        Parameters
+        ----------
+        location : str or ansys.dpf.core.common.locations
+            Location of the entities: ``"Nodal"``, ``"Elemental"`` or ``"Faces"``.
+
+        Returns
+        -------
+        id_to_index_map : IdToIndexMap
+        """
+        id_to_index_map = self._id_to_index_maps.get(location)
+        if id_to_index_map is None:
+            if location == locations.faces:
+                entities_scoping = self.faces.scoping
+            else:
+                entities_scoping = self._get_scoping(loc=location)
+            ids = entities_scoping.ids if entities_scoping is not None else []
+            id_to_index_map = IdToIndexMap(ids)
+            self._id_to_index_maps[location] = id_to_index_map
+        return id_to_index_map
+
     @property
     def elements(self):
         """
@@ -397,6 +569,8 @@ class MeshedRegion:
         if property_name is nodal_properties.coordinates:
             self.set_coordinates_field(value)
         else:
+            self._id_to_index_maps.clear()
+            self._vtk_grids.clear()
             self._api.meshed_region_set_property_field(self, property_name, value)
 
     @update_grid
@@ -409,6 +583,7 @@ class MeshedRegion:
         ----------
         coordinates_field : PropertyField or Field
         """
+        self._id_to_index_maps.clear()
         self._api.meshed_region_set_coordinates_field(self, coordinates_field)
 
     @property
@@ -551,13 +726,13 @@ class MeshedRegion:
     def _as_vtk(self, coordinates=None, as_linear=True, include_ids=False):
         """Convert DPF mesh to a PyVista unstructured grid."""
         try:
-            from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+            from ansys.dpf.core.vtk_helper import _cached_dpf_mesh_to_vtk
         except ModuleNotFoundError:
             raise ModuleNotFoundError(
                 "To use plotting capabilities, please install pyvista "
                 "with :\n pip install pyvista>=0.24.0"
             )
-        grid = dpf_mesh_to_vtk(self, coordinates, as_linear)
+        grid = _cached_dpf_mesh_to_vtk(self, coordinates, as_linear)
 
         # consider adding this when scoping request is faster
         if include_ids:
@@ -35,6 +35,10 @@ from ansys.dpf.gate._version import __ansys_version__
 DEFAULT_FILE_CHUNK_SIZE = 524288
 DYNAMIC_RESULTS = True
 RETURN_ARRAYS = True
+SPECIFICATION_CACHE = True
+SPECIFICATION_CACHE_PATH = None
+MAX_CONCURRENT_REQUESTS = 4
+FIELD_DATA_CACHE = False
 
 RUNTIME_CLIENT_CONFIG = None
 
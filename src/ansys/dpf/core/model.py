@@ -38,6 +38,7 @@ if TYPE_CHECKING:  # pragma: nocover
 from ansys import dpf
 from ansys.dpf.core import Operator, misc
 from ansys.dpf.core._model_helpers import DataSourcesOrStreamsConnector
+from ansys.dpf.core.cache import ResultCache
 from ansys.dpf.core.check_version import version_requires
 from ansys.dpf.core.common import types
 from ansys.dpf.core.data_sources import DataSources
@@ -176,7 +177,7 @@ class Model:
         >>> displacements = model.results.displacement.on_all_time_freqs.eval()
 
         """
-        if not self._results:
+        if self._results is None:
             args = [
                 self.metadata._build_connector(),
                 self.metadata.result_info,
@@ -186,7 +187,8 @@ class Model:
             if misc.DYNAMIC_RESULTS:
                 try:
                     self._results = Results(*args)
-                    if len(self._results) == 0:
+                    # fall back when no result operator can be created, stopping at the first one
+                    if not any(map(self._results._is_available, self._results._op_map_rev)):
                         self._results = CommonResults(*args)
                 except Exception as e:
                     self._results = CommonResults(*args)
@@ -195,6 +197,54 @@ class Model:
                 self._results = CommonResults(*args)
         return self._results
 
+    def set_result_cache(self, enabled=True, max_bytes=None, spill_directory=None):
+        """Cache the fields containers evaluated by the results of the model.
+
+        Evaluating a result again with the same time scoping, mesh scoping, location and split
+        returns the fields container evaluated the first time instead of reading the result files
+        again, see :class:`ResultCache <ansys.dpf.core.cache.ResultCache>`. Results with other
+        inputs connected on their operator, for example with ``result().inputs``, are not cached.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            Whether to cache the evaluated results. Disabling clears the current cache.
+        max_bytes : int, optional
+            Maximum number of bytes of field data kept on the server. The least recently used
+            results are evicted beyond it. The default is ``None``, in which case the cache
+            is not bounded.
+        spill_directory : str, os.PathLike, optional
+            Local directory where evicted results are written to be read back later. Only the
+            results of a local server are spilled. The default is ``None``, in which case
+            evicted results are dropped.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_msup_transient())
+        >>> model.set_result_cache(max_bytes=100 * 1024**2)
+        >>> fc = model.results.stress.on_last_time_freq.eval()
+        >>> fc = model.results.stress.on_last_time_freq.eval()
+        >>> model.result_cache.statistics.hits
+        1
+
+        """
+        if self.metadata._result_cache is not None:
+            self.metadata._result_cache.clear()
+        self.metadata._result_cache = ResultCache(max_bytes, spill_directory) if enabled else None
+
+    @property
+    def result_cache(self):
+        """Cache of the evaluated results, enabled with :meth:`set_result_cache`.
+
+        Returns
+        -------
+        ResultCache, None
+            ``None`` if results are not cached.
+        """
+        return self.metadata._result_cache
+
     def operator(self, name):
         """Operator associated with the data sources of this model.
 
@@ -300,6 +350,7 @@ class Metadata:
         self._time_freq_support = None
         self._mesh_selection_manager = None
         self._mesh_provider_cached_instance = None
+        self._result_cache = None
         self._cache_streams_provider()
 
     def _cache_result_info(self):
@@ -459,6 +510,8 @@ class Metadata:
                 raise e
         except:
             return None
+        # reuse the description of the results read by other models on the same files
+        result_info._share_snapshot(self._data_sources)
         return result_info
 
     def _load_mesh_info(self):
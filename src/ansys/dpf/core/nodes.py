@@ -318,7 +318,8 @@ class Nodes:
 
     def _build_mapping_id_to_index(self) -> dict[int, int]:
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        ids = self.scoping.ids
+        return dict(zip(np.asarray(ids).tolist(), range(len(ids))))
 
     @property
     def mapping_id_to_index(self) -> dict[int, int]:
@@ -366,10 +367,7 @@ class Nodes:
         """
         if external_scope.location in ["Elemental", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        return self._mesh._id_to_index_map(locations.nodal).map(external_scope.ids)
 
     def add_node(self, id, coordinates):
         """
@@ -383,6 +381,8 @@ class Nodes:
         coordinates : list[float]
             List of ``[x, y, z]`` coordinates for the node.
         """
+        self._mesh._id_to_index_maps.pop(locations.nodal, None)
+        self._mesh._vtk_grids.clear()
         self._mesh._api.meshed_region_add_node(self._mesh, coordinates, id)
 
     def add_nodes(self, num):
@@ -410,6 +410,8 @@ class Nodes:
         ...     node.coordinates = [float(i), float(i), 0.0]
 
         """
+        self._mesh._id_to_index_maps.pop(locations.nodal, None)
+        self._mesh._vtk_grids.clear()
         for i in range(0, num):
             add = NodeAdder()
             yield add
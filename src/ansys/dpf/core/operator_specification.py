@@ -29,9 +29,17 @@ The OperatorSpecification Provides a documentation for each Operator
 from __future__ import annotations
 
 import abc
+import atexit
+from contextlib import suppress
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+import threading
 from typing import Union
 
-from ansys.dpf.core import common, mapping_types, server as server_module
+from ansys.dpf.core import common, mapping_types, misc, server as server_module
 from ansys.dpf.core.changelog import Changelog
 from ansys.dpf.core.check_version import server_meet_version, version_requires
 from ansys.dpf.gate import (
@@ -251,6 +259,125 @@ class SpecificationBase:
         pass
 
 
+class _SpecificationCache:
+    """Process-wide cache of the operator specifications read from servers.
+
+    Specifications are stored as plain data per server key, made of the server version and of
+    its loaded plugins, and per operator name, so that servers running the same version with the
+    same plugins share them. When ``misc.SPECIFICATION_CACHE_PATH`` is set, the specifications
+    are also persisted in this directory between Python sessions.
+    """
+
+    _session_ids = itertools.count()
+
+    def __init__(self):
+        self._records = {}
+        self._loaded_keys = set()
+        self._dirty_keys = set()
+        self._lock = threading.RLock()
+        atexit.register(self.save)
+
+    @staticmethod
+    def server_key(server) -> tuple:
+        """Return the key identifying the specifications available on a server."""
+        key = getattr(server, "_specification_cache_key", None)
+        if key is None:
+            # When the loaded plugins cannot be identified, only share within this session.
+            # This key is also used by any specification requested while reading the plugins.
+            key = ("session", next(_SpecificationCache._session_ids))
+            server._specification_cache_key = key
+            with suppress(Exception):
+                plugins = json.dumps(server.plugins, sort_keys=True, default=str)
+                key = ("plugins", str(server.version), plugins)
+            server._specification_cache_key = key
+        return key
+
+    @staticmethod
+    def _file(key) -> Union[Path, None]:
+        if misc.SPECIFICATION_CACHE_PATH is None or key[0] != "plugins":
+            return None
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return Path(misc.SPECIFICATION_CACHE_PATH) / f"specifications_{digest}.json"
+
+    def _load(self, key):
+        if key in self._loaded_keys:
+            return
+        self._loaded_keys.add(key)
+        file = self._file(key)
+        if file is not None and file.is_file():
+            with suppress(OSError, ValueError):
+                self._records.update(
+                    {
+                        (key, name): record
+                        for name, record in json.loads(file.read_text(encoding="utf-8")).items()
+                    }
+                )
+
+    def record(self, server, operator_name) -> Union[dict, None]:
+        """Return the cached data of an operator specification, creating it if necessary.
+
+        Returns ``None`` when the cache is disabled.
+        """
+        if not misc.SPECIFICATION_CACHE or not operator_name:
+            return None
+        key = self.server_key(server)
+        with self._lock:
+            self._load(key)
+            return self._records.setdefault((key, operator_name), {})
+
+    def mark_modified(self, server):
+        """Flag the specifications of a server as needing to be saved."""
+        with self._lock:
+            self._dirty_keys.add(self.server_key(server))
+
+    def save(self):
+        """Write the modified specifications to ``misc.SPECIFICATION_CACHE_PATH``, if set."""
+        with self._lock:
+            for key in self._dirty_keys:
+                self._save_key(key)
+            self._dirty_keys.clear()
+
+    def _save_key(self, key):
+        file = self._file(key)
+        if file is None:
+            return
+        records = {name: record for (k, name), record in self._records.items() if k == key}
+        with suppress(OSError):
+            file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(records), encoding="utf-8")
+            tmp_file.replace(file)
+
+    def invalidate(self, server):
+        """Forget the specifications of a server, for example when it loads new plugins.
+
+        The server gets a new key on its next request, made of its new plugins. The
+        specifications persisted for the previous key are kept, for the servers and the
+        sessions which still run with these plugins.
+        """
+        key = getattr(server, "_specification_cache_key", None)
+        if key is None:
+            return
+        server._specification_cache_key = None
+        with self._lock:
+            if key in self._dirty_keys:
+                self._save_key(key)
+                self._dirty_keys.discard(key)
+            for record_key in [k for k in self._records if k[0] == key]:
+                del self._records[record_key]
+            self._loaded_keys.discard(key)
+
+    def clear(self):
+        """Forget all the cached specifications, in memory only."""
+        with self._lock:
+            self._records.clear()
+            self._loaded_keys.clear()
+            self._dirty_keys.clear()
+
+
+_specification_cache = _SpecificationCache()
+
+
 class Specification(SpecificationBase):
     """Documents an Operator with its description (what the Operator does), its inputs and outputs and some properties.
 
@@ -298,16 +425,21 @@ class Specification(SpecificationBase):
         # step3: init environment
         self._api.init_operator_specification_environment(self)  # creates stub when gRPC
 
+        self.operator_name = operator_name
+        self._cache_record = (
+            _specification_cache.record(self._server, operator_name)
+            if specification is None
+            else None
+        )
+
         # step4: if object exists: take instance, else create it (specification)
+        self._internal_obj_instance = None
         if specification is not None:
             self.internal_obj = specification
         elif operator_name:
-            if self._server.has_client():
-                self._internal_obj = self._api.operator_specification_new_on_client(
-                    self._server.client, operator_name
-                )
-            else:
-                self._internal_obj = self._api.operator_specification_new(operator_name)
+            # A cached specification is only created on the server if uncached data is requested
+            if not self._cache_record:
+                self._internal_obj = self._new_internal_obj()
         else:
             if self._server.has_client():
                 raise NotImplementedError(
@@ -315,12 +447,37 @@ class Specification(SpecificationBase):
                 )
             self._internal_obj = self._api.operator_empty_specification_new()
 
-        self.operator_name = operator_name
         self._map_output_pin_spec = None
         self._map_input_pin_spec = None
         self._properties = None
         self._config_specification = None
 
+    def _new_internal_obj(self):
+        if self._server.has_client():
+            return self._api.operator_specification_new_on_client(
+                self._server.client, self.operator_name
+            )
+        return self._api.operator_specification_new(self.operator_name)
+
+    @property
+    def _internal_obj(self):
+        if self._internal_obj_instance is None and self._cache_record is not None:
+            self._internal_obj_instance = self._new_internal_obj()
+        return self._internal_obj_instance
+
+    @_internal_obj.setter
+    def _internal_obj(self, value):
+        self._internal_obj_instance = value
+
+    def _cached(self, name, read):
+        """Return the data read by ``read``, from the specification cache when possible."""
+        if self._cache_record is None:
+            return read()
+        if name not in self._cache_record:
+            self._cache_record[name] = read()
+            _specification_cache.mark_modified(self._server)
+        return self._cache_record[name]
+
     def __str__(self):
         """Provide more details in the string representation of the instance."""
         return "Description:\n" + str(self.description) + "\nProperties:\n" + str(self.properties)
@@ -340,21 +497,24 @@ class Specification(SpecificationBase):
         {'category': '...', 'exposure': '...', 'plugin': '...', 'user_name': '...'}
         """
         if self._properties is None:
-            temp_properties = dict()
-            if self._internal_obj is not None:
-                num_properties = self._api.operator_specification_get_num_properties(self)
-                for i_property in range(num_properties):
-                    property_key = self._api.operator_specification_get_property_key(
-                        self, i_property
-                    )
-                    prop = self._api.operator_specification_get_properties(self, property_key)
-                    temp_properties[property_key] = prop
+            temp_properties = self._cached("properties", self._read_properties)
             # Reorder the properties for consistency
             self._properties = dict()
             for key in sorted(temp_properties.keys()):
                 self._properties[key] = temp_properties[key]
         return self._properties
 
+    def _read_properties(self) -> dict:
+        properties = dict()
+        if self._internal_obj is not None:
+            num_properties = self._api.operator_specification_get_num_properties(self)
+            for i_property in range(num_properties):
+                property_key = self._api.operator_specification_get_property_key(self, i_property)
+                properties[property_key] = self._api.operator_specification_get_properties(
+                    self, property_key
+                )
+        return properties
+
     @property
     def description(self) -> str:
         """Returns a description of the operation applied by the Operator.
@@ -370,6 +530,9 @@ class Specification(SpecificationBase):
         >>> operator.specification.description
         'Computes the element-wise invariants...'
         """
+        return self._cached("description", self._read_description)
+
+    def _read_description(self) -> str:
         if self._internal_obj is not None:
             return self._api.operator_specification_get_description(self)
         return ""
@@ -419,6 +582,22 @@ class Specification(SpecificationBase):
         return self._map_output_pin_spec
 
     def _fill_pins(self, binput, to_fill):
+        pins = self._cached("inputs" if binput else "outputs", lambda: self._read_pins(binput))
+        for i_pin, pin in pins:
+            name, type_names, document, optional, ellipsis, name_derived_class, aliases = pin
+            to_fill[i_pin] = PinSpecification(
+                name,
+                list(type_names),
+                document,
+                optional,
+                ellipsis,
+                name_derived_class,
+                list(aliases),
+            )
+
+    def _read_pins(self, binput) -> list:
+        """Read the pins from the server as ``[pin_number, [name, type_names, ...]]`` items."""
+        to_fill = []
         if self._internal_obj is not None:
             num_pins = self._api.operator_specification_get_num_pins(self, binput)
 
@@ -460,15 +639,21 @@ class Specification(SpecificationBase):
                     )
 
                 pin_ell = self._api.operator_specification_is_pin_ellipsis(self, binput, i_pin)
-                to_fill[i_pin] = PinSpecification(
-                    pin_name,
-                    pin_type_names,
-                    pin_doc,
-                    pin_opt,
-                    pin_ell,
-                    pin_derived_class_type_name,
-                    pin_aliases,
+                to_fill.append(
+                    [
+                        i_pin,
+                        [
+                            pin_name,
+                            pin_type_names,
+                            pin_doc,
+                            pin_opt,
+                            pin_ell,
+                            pin_derived_class_type_name,
+                            pin_aliases,
+                        ],
+                    ]
                 )
+        return to_fill
 
     @property
     def config_specification(self) -> ConfigSpecification:
@@ -480,26 +665,37 @@ class Specification(SpecificationBase):
         """
         if self._config_specification is None:
             self._config_specification = ConfigSpecification()
+        for option_name, option_type_names, option_default_value, option_doc in self._cached(
+            "config_specification", self._read_config_options
+        ):
+            self._config_specification[option_name] = ConfigOptionSpec(
+                name=option_name,
+                type_names=list(option_type_names),
+                default_value_str=option_default_value,
+                document=option_doc,
+            )
+        return self._config_specification
+
+    def _read_config_options(self) -> list:
+        options = []
         if self._internal_obj is not None:
             num_options = self._api.operator_specification_get_num_config_options(self)
             for i in range(num_options):
-                option_name = self._api.operator_specification_get_config_name(self, i)
                 n_types = self._api.operator_specification_get_config_num_type_names(self, i)
-                option_type_names = [
-                    self._api.operator_specification_get_config_type_name(self, i, n_type)
-                    for n_type in range(n_types)
-                ]
-                option_default_value = (
-                    self._api.operator_specification_get_config_printable_default_value(self, i)
+                options.append(
+                    [
+                        self._api.operator_specification_get_config_name(self, i),
+                        [
+                            self._api.operator_specification_get_config_type_name(self, i, n_type)
+                            for n_type in range(n_types)
+                        ],
+                        self._api.operator_specification_get_config_printable_default_value(
+                            self, i
+                        ),
+                        self._api.operator_specification_get_config_description(self, i),
+                    ]
                 )
-                option_doc = self._api.operator_specification_get_config_description(self, i)
-                self._config_specification[option_name] = ConfigOptionSpec(
-                    name=option_name,
-                    type_names=option_type_names,
-                    default_value_str=option_default_value,
-                    document=option_doc,
-                )
-        return self._config_specification
+        return options
 
     @version_requires("11.0")
     def set_changelog(self, changelog: Changelog):
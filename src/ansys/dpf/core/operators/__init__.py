@@ -1,17 +1,45 @@
-from . import averaging
-from . import compression
-from . import filter
-from . import geo
-from . import info
-from . import invariant
-from . import logic
-from . import mapping
-from . import math
-from . import mesh
-from . import metadata
-from . import min_max
-from . import result
-from . import scoping
-from . import serialization
-from . import server
-from . import utility
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import averaging
+    from . import compression
+    from . import filter
+    from . import geo
+    from . import info
+    from . import invariant
+    from . import logic
+    from . import mapping
+    from . import math
+    from . import mesh
+    from . import metadata
+    from . import min_max
+    from . import result
+    from . import scoping
+    from . import serialization
+    from . import server
+    from . import utility
+
+lazy_package(
+    __name__,
+    [
+        "averaging",
+        "compression",
+        "filter",
+        "geo",
+        "info",
+        "invariant",
+        "logic",
+        "mapping",
+        "math",
+        "mesh",
+        "metadata",
+        "min_max",
+        "result",
+        "scoping",
+        "serialization",
+        "server",
+        "utility",
+    ],
+)
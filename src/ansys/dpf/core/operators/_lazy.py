@@ -0,0 +1,61 @@
+"""Load the generated operator modules on first access instead of at import."""
+
+import importlib
+import sys
+import types
+
+
+class _LazyPackage(types.ModuleType):
+    """Package whose submodules are imported when their name is first accessed.
+
+    For a category of operators, accessing an operator name returns the operator class
+    defined in the module of the same name, as the eager ``from .add import add`` did.
+    """
+
+    def __getattr__(self, name):
+        if name not in self.__dict__.get("_lazy_names", ()):
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        module = importlib.import_module(f"{self.__name__}.{name}")
+        if self.__dict__.get(name, module) is module:
+            # the module was already imported, the import system did not bind it again
+            setattr(self, name, module)
+        return self.__dict__[name]
+
+    def __setattr__(self, name, value):
+        # the import system binds each imported submodule on its parent package:
+        # for an operator, bind the class it defines instead
+        if (
+            self.__dict__.get("_lazy_classes", False)
+            and name in self.__dict__.get("_lazy_names", ())
+            and isinstance(value, types.ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self.__dict__.get("_lazy_names", ())))
+
+
+def lazy_package(name, submodules, classes=False):
+    """Make the package ``name`` import its ``submodules`` on first access.
+
+    Parameters
+    ----------
+    name : str
+        Name of the package, usually ``__name__``.
+    submodules : list[str]
+        Names of the submodules exposed by the package.
+    classes : bool, optional
+        Whether each submodule is exposed as the class of the same name it defines.
+    """
+    package = sys.modules[name]
+    package.__dict__["_lazy_names"] = frozenset(submodules)
+    package.__dict__["_lazy_classes"] = classes
+    package.__dict__["__all__"] = list(submodules)
+    package.__class__ = _LazyPackage
+    # submodules imported before the package became lazy
+    for submodule in submodules:
+        module = package.__dict__.get(submodule)
+        if isinstance(module, types.ModuleType):
+            setattr(package, submodule, module)
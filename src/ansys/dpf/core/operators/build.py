@@ -304,6 +304,26 @@ def build_operator(
         raise e
 
 
+def build_lazy_init(names, classes):
+    """Write a package init importing its submodules, or their classes, on first access."""
+    lines = [
+        "from typing import TYPE_CHECKING",
+        "",
+        "from ansys.dpf.core.operators._lazy import lazy_package",
+        "",
+        "if TYPE_CHECKING:  # pragma: no cover",
+    ]
+    for name in names:
+        lines.append(f"    from .{name} import {name}" if classes else f"    from . import {name}")
+    lines += ["", "lazy_package(", "    __name__,", "    ["]
+    lines += [f'        "{name}",' for name in names]
+    lines.append("    ],")
+    if classes:
+        lines.append("    classes=True,")
+    lines += [")", ""]
+    return "\n".join(lines)
+
+
 def build_operators():
     print(f"Generating operators for server {dpf.SERVER.version} ({dpf.SERVER.ansys_path})")
     time_0 = time.time()
@@ -403,20 +423,22 @@ def build_operators():
     with open(
         os.path.join(this_path, "__init__.py"), "w", encoding="utf-8", newline="\u000a"
     ) as main_init:
-        for category in sorted(categories):
-            # Add category to main init file imports
-            main_init.write(f"from . import {category}\n")
-            # Create category init file
-            category_operators = os.listdir(os.path.join(this_path, category.split(".")[0]))
-            with open(
-                os.path.join(this_path, category, "__init__.py"),
-                "w",
-                encoding="utf-8",
-                newline="\u000a",
-            ) as category_init:
-                for category_operator in sorted(category_operators):
-                    operator_name = category_operator.split(".")[0]
-                    category_init.write(f"from .{operator_name} import {operator_name}\n")
+        main_init.write(build_lazy_init(sorted(categories), classes=False))
+    for category in sorted(categories):
+        # Create category init file
+        category_operators = os.listdir(os.path.join(this_path, category.split(".")[0]))
+        operator_names = sorted(
+            category_operator.split(".")[0]
+            for category_operator in category_operators
+            if category_operator.endswith(".py") and category_operator != "__init__.py"
+        )
+        with open(
+            os.path.join(this_path, category, "__init__.py"),
+            "w",
+            encoding="utf-8",
+            newline="\u000a",
+        ) as category_init:
+            category_init.write(build_lazy_init(operator_names, classes=True))
 
     if succeeded == len(available_operators) - hidden:
         print("Success")
@@ -1,10 +1,32 @@
-from .apply_svd import apply_svd
-from .apply_zfp import apply_zfp
-from .kmeans_clustering import kmeans_clustering
-from .quantization import quantization
-from .quantization_fc import quantization_fc
-from .zfp_decompress import zfp_decompress
-from .zstd_compress import zstd_compress
-from .zstd_compress_fc import zstd_compress_fc
-from .zstd_decompress import zstd_decompress
-from .zstd_decompress_fc import zstd_decompress_fc
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .apply_svd import apply_svd
+    from .apply_zfp import apply_zfp
+    from .kmeans_clustering import kmeans_clustering
+    from .quantization import quantization
+    from .quantization_fc import quantization_fc
+    from .zfp_decompress import zfp_decompress
+    from .zstd_compress import zstd_compress
+    from .zstd_compress_fc import zstd_compress_fc
+    from .zstd_decompress import zstd_decompress
+    from .zstd_decompress_fc import zstd_decompress_fc
+
+lazy_package(
+    __name__,
+    [
+        "apply_svd",
+        "apply_zfp",
+        "kmeans_clustering",
+        "quantization",
+        "quantization_fc",
+        "zfp_decompress",
+        "zstd_compress",
+        "zstd_compress_fc",
+        "zstd_decompress",
+        "zstd_decompress_fc",
+    ],
+    classes=True,
+)
@@ -1,22 +1,56 @@
-from .abc_weightings import abc_weightings
-from .field_band_pass import field_band_pass
-from .field_band_pass_fc import field_band_pass_fc
-from .field_high_pass import field_high_pass
-from .field_high_pass_fc import field_high_pass_fc
-from .field_low_pass import field_low_pass
-from .field_low_pass_fc import field_low_pass_fc
-from .field_signed_high_pass import field_signed_high_pass
-from .field_signed_high_pass_fc import field_signed_high_pass_fc
-from .filtering_max_over_time import filtering_max_over_time
-from .scoping_band_pass import scoping_band_pass
-from .scoping_high_pass import scoping_high_pass
-from .scoping_low_pass import scoping_low_pass
-from .scoping_signed_high_pass import scoping_signed_high_pass
-from .timefreq_band_pass import timefreq_band_pass
-from .timefreq_high_pass import timefreq_high_pass
-from .timefreq_low_pass import timefreq_low_pass
-from .timefreq_signed_high_pass import timefreq_signed_high_pass
-from .timescoping_band_pass import timescoping_band_pass
-from .timescoping_high_pass import timescoping_high_pass
-from .timescoping_low_pass import timescoping_low_pass
-from .timescoping_signed_high_pass import timescoping_signed_high_pass
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .abc_weightings import abc_weightings
+    from .field_band_pass import field_band_pass
+    from .field_band_pass_fc import field_band_pass_fc
+    from .field_high_pass import field_high_pass
+    from .field_high_pass_fc import field_high_pass_fc
+    from .field_low_pass import field_low_pass
+    from .field_low_pass_fc import field_low_pass_fc
+    from .field_signed_high_pass import field_signed_high_pass
+    from .field_signed_high_pass_fc import field_signed_high_pass_fc
+    from .filtering_max_over_time import filtering_max_over_time
+    from .scoping_band_pass import scoping_band_pass
+    from .scoping_high_pass import scoping_high_pass
+    from .scoping_low_pass import scoping_low_pass
+    from .scoping_signed_high_pass import scoping_signed_high_pass
+    from .timefreq_band_pass import timefreq_band_pass
+    from .timefreq_high_pass import timefreq_high_pass
+    from .timefreq_low_pass import timefreq_low_pass
+    from .timefreq_signed_high_pass import timefreq_signed_high_pass
+    from .timescoping_band_pass import timescoping_band_pass
+    from .timescoping_high_pass import timescoping_high_pass
+    from .timescoping_low_pass import timescoping_low_pass
+    from .timescoping_signed_high_pass import timescoping_signed_high_pass
+
+lazy_package(
+    __name__,
+    [
+        "abc_weightings",
+        "field_band_pass",
+        "field_band_pass_fc",
+        "field_high_pass",
+        "field_high_pass_fc",
+        "field_low_pass",
+        "field_low_pass_fc",
+        "field_signed_high_pass",
+        "field_signed_high_pass_fc",
+        "filtering_max_over_time",
+        "scoping_band_pass",
+        "scoping_high_pass",
+        "scoping_low_pass",
+        "scoping_signed_high_pass",
+        "timefreq_band_pass",
+        "timefreq_high_pass",
+        "timefreq_low_pass",
+        "timefreq_signed_high_pass",
+        "timescoping_band_pass",
+        "timescoping_high_pass",
+        "timescoping_low_pass",
+        "timescoping_signed_high_pass",
+    ],
+    classes=True,
+)
@@ -1,18 +1,48 @@
-from .cartesian_to_spherical import cartesian_to_spherical
-from .cartesian_to_spherical_fc import cartesian_to_spherical_fc
-from .element_nodal_contribution import element_nodal_contribution
-from .elements_facets_surfaces_over_time import elements_facets_surfaces_over_time
-from .elements_volume import elements_volume
-from .elements_volumes_over_time import elements_volumes_over_time
-from .faces_area import faces_area
-from .gauss_to_node import gauss_to_node
-from .integrate_over_elements import integrate_over_elements
-from .normals import normals
-from .normals_provider_nl import normals_provider_nl
-from .rotate import rotate
-from .rotate_fc import rotate_fc
-from .rotate_in_cylindrical_cs import rotate_in_cylindrical_cs
-from .rotate_in_cylindrical_cs_fc import rotate_in_cylindrical_cs_fc
-from .spherical_to_cartesian import spherical_to_cartesian
-from .spherical_to_cartesian_fc import spherical_to_cartesian_fc
-from .to_polar_coordinates import to_polar_coordinates
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cartesian_to_spherical import cartesian_to_spherical
+    from .cartesian_to_spherical_fc import cartesian_to_spherical_fc
+    from .element_nodal_contribution import element_nodal_contribution
+    from .elements_facets_surfaces_over_time import elements_facets_surfaces_over_time
+    from .elements_volume import elements_volume
+    from .elements_volumes_over_time import elements_volumes_over_time
+    from .faces_area import faces_area
+    from .gauss_to_node import gauss_to_node
+    from .integrate_over_elements import integrate_over_elements
+    from .normals import normals
+    from .normals_provider_nl import normals_provider_nl
+    from .rotate import rotate
+    from .rotate_fc import rotate_fc
+    from .rotate_in_cylindrical_cs import rotate_in_cylindrical_cs
+    from .rotate_in_cylindrical_cs_fc import rotate_in_cylindrical_cs_fc
+    from .spherical_to_cartesian import spherical_to_cartesian
+    from .spherical_to_cartesian_fc import spherical_to_cartesian_fc
+    from .to_polar_coordinates import to_polar_coordinates
+
+lazy_package(
+    __name__,
+    [
+        "cartesian_to_spherical",
+        "cartesian_to_spherical_fc",
+        "element_nodal_contribution",
+        "elements_facets_surfaces_over_time",
+        "elements_volume",
+        "elements_volumes_over_time",
+        "faces_area",
+        "gauss_to_node",
+        "integrate_over_elements",
+        "normals",
+        "normals_provider_nl",
+        "rotate",
+        "rotate_fc",
+        "rotate_in_cylindrical_cs",
+        "rotate_in_cylindrical_cs_fc",
+        "spherical_to_cartesian",
+        "spherical_to_cartesian_fc",
+        "to_polar_coordinates",
+    ],
+    classes=True,
+)
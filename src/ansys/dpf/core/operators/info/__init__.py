@@ -1 +1,14 @@
-from .markdown_latex_example import markdown_latex_example
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .markdown_latex_example import markdown_latex_example
+
+lazy_package(
+    __name__,
+    [
+        "markdown_latex_example",
+    ],
+    classes=True,
+)
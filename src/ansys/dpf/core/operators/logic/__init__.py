@@ -1,26 +1,64 @@
-from .ascending_sort import ascending_sort
-from .ascending_sort_fc import ascending_sort_fc
-from .component_selector import component_selector
-from .component_selector_fc import component_selector_fc
-from .component_transformer import component_transformer
-from .component_transformer_fc import component_transformer_fc
-from .descending_sort import descending_sort
-from .descending_sort_fc import descending_sort_fc
-from .elementary_data_selector import elementary_data_selector
-from .elementary_data_selector_fc import elementary_data_selector_fc
-from .enrich_materials import enrich_materials
-from .identical_anys import identical_anys
-from .identical_fc import identical_fc
-from .identical_fields import identical_fields
-from .identical_generic_data_containers import identical_generic_data_containers
-from .identical_mc import identical_mc
-from .identical_meshes import identical_meshes
-from .identical_pfc import identical_pfc
-from .identical_property_fields import identical_property_fields
-from .identical_sc import identical_sc
-from .identical_scopings import identical_scopings
-from .identical_string_fields import identical_string_fields
-from .included_fields import included_fields
-from .solid_shell_fields import solid_shell_fields
-from .split_data_sources import split_data_sources
-from .split_streams import split_streams
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .ascending_sort import ascending_sort
+    from .ascending_sort_fc import ascending_sort_fc
+    from .component_selector import component_selector
+    from .component_selector_fc import component_selector_fc
+    from .component_transformer import component_transformer
+    from .component_transformer_fc import component_transformer_fc
+    from .descending_sort import descending_sort
+    from .descending_sort_fc import descending_sort_fc
+    from .elementary_data_selector import elementary_data_selector
+    from .elementary_data_selector_fc import elementary_data_selector_fc
+    from .enrich_materials import enrich_materials
+    from .identical_anys import identical_anys
+    from .identical_fc import identical_fc
+    from .identical_fields import identical_fields
+    from .identical_generic_data_containers import identical_generic_data_containers
+    from .identical_mc import identical_mc
+    from .identical_meshes import identical_meshes
+    from .identical_pfc import identical_pfc
+    from .identical_property_fields import identical_property_fields
+    from .identical_sc import identical_sc
+    from .identical_scopings import identical_scopings
+    from .identical_string_fields import identical_string_fields
+    from .included_fields import included_fields
+    from .solid_shell_fields import solid_shell_fields
+    from .split_data_sources import split_data_sources
+    from .split_streams import split_streams
+
+lazy_package(
+    __name__,
+    [
+        "ascending_sort",
+        "ascending_sort_fc",
+        "component_selector",
+        "component_selector_fc",
+        "component_transformer",
+        "component_transformer_fc",
+        "descending_sort",
+        "descending_sort_fc",
+        "elementary_data_selector",
+        "elementary_data_selector_fc",
+        "enrich_materials",
+        "identical_anys",
+        "identical_fc",
+        "identical_fields",
+        "identical_generic_data_containers",
+        "identical_mc",
+        "identical_meshes",
+        "identical_pfc",
+        "identical_property_fields",
+        "identical_sc",
+        "identical_scopings",
+        "identical_string_fields",
+        "included_fields",
+        "solid_shell_fields",
+        "split_data_sources",
+        "split_streams",
+    ],
+    classes=True,
+)
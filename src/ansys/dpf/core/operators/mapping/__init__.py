@@ -1,9 +1,30 @@
-from .fft import fft
-from .find_reduced_coordinates import find_reduced_coordinates
-from .on_coordinates import on_coordinates
-from .on_reduced_coordinates import on_reduced_coordinates
-from .prep_sampling_fft import prep_sampling_fft
-from .prepare_mapping_workflow import prepare_mapping_workflow
-from .scoping_on_coordinates import scoping_on_coordinates
-from .solid_to_skin import solid_to_skin
-from .solid_to_skin_fc import solid_to_skin_fc
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .fft import fft
+    from .find_reduced_coordinates import find_reduced_coordinates
+    from .on_coordinates import on_coordinates
+    from .on_reduced_coordinates import on_reduced_coordinates
+    from .prep_sampling_fft import prep_sampling_fft
+    from .prepare_mapping_workflow import prepare_mapping_workflow
+    from .scoping_on_coordinates import scoping_on_coordinates
+    from .solid_to_skin import solid_to_skin
+    from .solid_to_skin_fc import solid_to_skin_fc
+
+lazy_package(
+    __name__,
+    [
+        "fft",
+        "find_reduced_coordinates",
+        "on_coordinates",
+        "on_reduced_coordinates",
+        "prep_sampling_fft",
+        "prepare_mapping_workflow",
+        "scoping_on_coordinates",
+        "solid_to_skin",
+        "solid_to_skin_fc",
+    ],
+    classes=True,
+)
@@ -1,105 +1,222 @@
-from .absolute_value_by_component import absolute_value_by_component
-from .absolute_value_by_component_fc import absolute_value_by_component_fc
-from .accumulate import accumulate
-from .accumulate_fc import accumulate_fc
-from .accumulate_level_over_label_fc import accumulate_level_over_label_fc
-from .accumulate_min_over_label_fc import accumulate_min_over_label_fc
-from .accumulate_over_label_fc import accumulate_over_label_fc
-from .accumulation_per_scoping import accumulation_per_scoping
-from .add import add
-from .add_constant import add_constant
-from .add_constant_fc import add_constant_fc
-from .add_fc import add_fc
-from .amplitude import amplitude
-from .amplitude_fc import amplitude_fc
-from .average_over_label_fc import average_over_label_fc
-from .centroid import centroid
-from .centroid_fc import centroid_fc
-from .component_wise_divide import component_wise_divide
-from .component_wise_divide_fc import component_wise_divide_fc
-from .component_wise_product import component_wise_product
-from .component_wise_product_fc import component_wise_product_fc
-from .compute_residual_and_error import compute_residual_and_error
-from .conjugate import conjugate
-from .correlation import correlation
-from .cos import cos
-from .cos_fc import cos_fc
-from .cplx_derive import cplx_derive
-from .cplx_divide import cplx_divide
-from .cplx_dot import cplx_dot
-from .cplx_multiply import cplx_multiply
-from .cross_product import cross_product
-from .cross_product_fc import cross_product_fc
-from .dot import dot
-from .dot_tensor import dot_tensor
-from .entity_extractor import entity_extractor
-from .expansion_psd import expansion_psd
-from .exponential import exponential
-from .exponential_fc import exponential_fc
-from .fft_approx import fft_approx
-from .fft_eval import fft_eval
-from .fft_gradient_eval import fft_gradient_eval
-from .fft_multi_harmonic_minmax import fft_multi_harmonic_minmax
-from .generalized_inner_product import generalized_inner_product
-from .generalized_inner_product_fc import generalized_inner_product_fc
-from .img_part import img_part
-from .invert import invert
-from .invert_fc import invert_fc
-from .kronecker_prod import kronecker_prod
-from .linear_combination import linear_combination
-from .linearized_stress import linearized_stress
-from .ln import ln
-from .ln_fc import ln_fc
-from .mac import mac
-from .make_one_on_comp import make_one_on_comp
-from .matrix_inverse import matrix_inverse
-from .matrix_product import matrix_product
-from .matrix_product_fc import matrix_product_fc
-from .mechanical_min_max_over_time import mechanical_min_max_over_time
-from .minus import minus
-from .minus_fc import minus_fc
-from .modal_damping_ratio import modal_damping_ratio
-from .modal_superposition import modal_superposition
-from .modulus import modulus
-from .norm import norm
-from .norm_fc import norm_fc
-from .outer_product import outer_product
-from .overall_dot import overall_dot
-from .phase import phase
-from .phase_fc import phase_fc
-from .polar_to_cplx import polar_to_cplx
-from .pow import pow
-from .pow_fc import pow_fc
-from .qr_solve import qr_solve
-from .real_part import real_part
-from .relative_error import relative_error
-from .scale import scale
-from .scale_by_field import scale_by_field
-from .scale_by_field_fc import scale_by_field_fc
-from .scale_fc import scale_fc
-from .sin import sin
-from .sin_fc import sin_fc
-from .sqr import sqr
-from .sqr_fc import sqr_fc
-from .sqrt import sqrt
-from .sqrt_fc import sqrt_fc
-from .svd import svd
-from .sweeping_phase import sweeping_phase
-from .sweeping_phase_fc import sweeping_phase_fc
-from .time_derivation import time_derivation
-from .time_freq_interpolation import time_freq_interpolation
-from .time_integration import time_integration
-from .unit_convert import unit_convert
-from .unit_convert_fc import unit_convert_fc
-from .window_bartlett import window_bartlett
-from .window_bartlett_fc import window_bartlett_fc
-from .window_blackman import window_blackman
-from .window_blackman_fc import window_blackman_fc
-from .window_hamming import window_hamming
-from .window_hamming_fc import window_hamming_fc
-from .window_hanning import window_hanning
-from .window_hanning_fc import window_hanning_fc
-from .window_triangular import window_triangular
-from .window_triangular_fc import window_triangular_fc
-from .window_welch import window_welch
-from .window_welch_fc import window_welch_fc
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .absolute_value_by_component import absolute_value_by_component
+    from .absolute_value_by_component_fc import absolute_value_by_component_fc
+    from .accumulate import accumulate
+    from .accumulate_fc import accumulate_fc
+    from .accumulate_level_over_label_fc import accumulate_level_over_label_fc
+    from .accumulate_min_over_label_fc import accumulate_min_over_label_fc
+    from .accumulate_over_label_fc import accumulate_over_label_fc
+    from .accumulation_per_scoping import accumulation_per_scoping
+    from .add import add
+    from .add_constant import add_constant
+    from .add_constant_fc import add_constant_fc
+    from .add_fc import add_fc
+    from .amplitude import amplitude
+    from .amplitude_fc import amplitude_fc
+    from .average_over_label_fc import average_over_label_fc
+    from .centroid import centroid
+    from .centroid_fc import centroid_fc
+    from .component_wise_divide import component_wise_divide
+    from .component_wise_divide_fc import component_wise_divide_fc
+    from .component_wise_product import component_wise_product
+    from .component_wise_product_fc import component_wise_product_fc
+    from .compute_residual_and_error import compute_residual_and_error
+    from .conjugate import conjugate
+    from .correlation import correlation
+    from .cos import cos
+    from .cos_fc import cos_fc
+    from .cplx_derive import cplx_derive
+    from .cplx_divide import cplx_divide
+    from .cplx_dot import cplx_dot
+    from .cplx_multiply import cplx_multiply
+    from .cross_product import cross_product
+    from .cross_product_fc import cross_product_fc
+    from .dot import dot
+    from .dot_tensor import dot_tensor
+    from .entity_extractor import entity_extractor
+    from .expansion_psd import expansion_psd
+    from .exponential import exponential
+    from .exponential_fc import exponential_fc
+    from .fft_approx import fft_approx
+    from .fft_eval import fft_eval
+    from .fft_gradient_eval import fft_gradient_eval
+    from .fft_multi_harmonic_minmax import fft_multi_harmonic_minmax
+    from .generalized_inner_product import generalized_inner_product
+    from .generalized_inner_product_fc import generalized_inner_product_fc
+    from .img_part import img_part
+    from .invert import invert
+    from .invert_fc import invert_fc
+    from .kronecker_prod import kronecker_prod
+    from .linear_combination import linear_combination
+    from .linearized_stress import linearized_stress
+    from .ln import ln
+    from .ln_fc import ln_fc
+    from .mac import mac
+    from .make_one_on_comp import make_one_on_comp
+    from .matrix_inverse import matrix_inverse
+    from .matrix_product import matrix_product
+    from .matrix_product_fc import matrix_product_fc
+    from .mechanical_min_max_over_time import mechanical_min_max_over_time
+    from .minus import minus
+    from .minus_fc import minus_fc
+    from .modal_damping_ratio import modal_damping_ratio
+    from .modal_superposition import modal_superposition
+    from .modulus import modulus
+    from .norm import norm
+    from .norm_fc import norm_fc
+    from .outer_product import outer_product
+    from .overall_dot import overall_dot
+    from .phase import phase
+    from .phase_fc import phase_fc
+    from .polar_to_cplx import polar_to_cplx
+    from .pow import pow
+    from .pow_fc import pow_fc
+    from .qr_solve import qr_solve
+    from .real_part import real_part
+    from .relative_error import relative_error
+    from .scale import scale
+    from .scale_by_field import scale_by_field
+    from .scale_by_field_fc import scale_by_field_fc
+    from .scale_fc import scale_fc
+    from .sin import sin
+    from .sin_fc import sin_fc
+    from .sqr import sqr
+    from .sqr_fc import sqr_fc
+    from .sqrt import sqrt
+    from .sqrt_fc import sqrt_fc
+    from .svd import svd
+    from .sweeping_phase import sweeping_phase
+    from .sweeping_phase_fc import sweeping_phase_fc
+    from .time_derivation import time_derivation
+    from .time_freq_interpolation import time_freq_interpolation
+    from .time_integration import time_integration
+    from .unit_convert import unit_convert
+    from .unit_convert_fc import unit_convert_fc
+    from .window_bartlett import window_bartlett
+    from .window_bartlett_fc import window_bartlett_fc
+    from .window_blackman import window_blackman
+    from .window_blackman_fc import window_blackman_fc
+    from .window_hamming import window_hamming
+    from .window_hamming_fc import window_hamming_fc
+    from .window_hanning import window_hanning
+    from .window_hanning_fc import window_hanning_fc
+    from .window_triangular import window_triangular
+    from .window_triangular_fc import window_triangular_fc
+    from .window_welch import window_welch
+    from .window_welch_fc import window_welch_fc
+
+lazy_package(
+    __name__,
+    [
+        "absolute_value_by_component",
+        "absolute_value_by_component_fc",
+        "accumulate",
+        "accumulate_fc",
+        "accumulate_level_over_label_fc",
+        "accumulate_min_over_label_fc",
+        "accumulate_over_label_fc",
+        "accumulation_per_scoping",
+        "add",
+        "add_constant",
+        "add_constant_fc",
+        "add_fc",
+        "amplitude",
+        "amplitude_fc",
+        "average_over_label_fc",
+        "centroid",
+        "centroid_fc",
+        "component_wise_divide",
+        "component_wise_divide_fc",
+        "component_wise_product",
+        "component_wise_product_fc",
+        "compute_residual_and_error",
+        "conjugate",
+        "correlation",
+        "cos",
+        "cos_fc",
+        "cplx_derive",
+        "cplx_divide",
+        "cplx_dot",
+        "cplx_multiply",
+        "cross_product",
+        "cross_product_fc",
+        "dot",
+        "dot_tensor",
+        "entity_extractor",
+        "expansion_psd",
+        "exponential",
+        "exponential_fc",
+        "fft_approx",
+        "fft_eval",
+        "fft_gradient_eval",
+        "fft_multi_harmonic_minmax",
+        "generalized_inner_product",
+        "generalized_inner_product_fc",
+        "img_part",
+        "invert",
+        "invert_fc",
+        "kronecker_prod",
+        "linear_combination",
+        "linearized_stress",
+        "ln",
+        "ln_fc",
+        "mac",
+        "make_one_on_comp",
+        "matrix_inverse",
+        "matrix_product",
+        "matrix_product_fc",
+        "mechanical_min_max_over_time",
+        "minus",
+        "minus_fc",
+        "modal_damping_ratio",
+        "modal_superposition",
+        "modulus",
+        "norm",
+        "norm_fc",
+        "outer_product",
+        "overall_dot",
+        "phase",
+        "phase_fc",
+        "polar_to_cplx",
+        "pow",
+        "pow_fc",
+        "qr_solve",
+        "real_part",
+        "relative_error",
+        "scale",
+        "scale_by_field",
+        "scale_by_field_fc",
+        "scale_fc",
+        "sin",
+        "sin_fc",
+        "sqr",
+        "sqr_fc",
+        "sqrt",
+        "sqrt_fc",
+        "svd",
+        "sweeping_phase",
+        "sweeping_phase_fc",
+        "time_derivation",
+        "time_freq_interpolation",
+        "time_integration",
+        "unit_convert",
+        "unit_convert_fc",
+        "window_bartlett",
+        "window_bartlett_fc",
+        "window_blackman",
+        "window_blackman_fc",
+        "window_hamming",
+        "window_hamming_fc",
+        "window_hanning",
+        "window_hanning_fc",
+        "window_triangular",
+        "window_triangular_fc",
+        "window_welch",
+        "window_welch_fc",
+    ],
+    classes=True,
+)
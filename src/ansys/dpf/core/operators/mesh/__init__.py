@@ -1,33 +1,78 @@
-from .acmo_mesh_provider import acmo_mesh_provider
-from .beam_properties import beam_properties
-from .change_cs import change_cs
-from .combine_levelset import combine_levelset
-from .decimate_mesh import decimate_mesh
-from .edge_decimation import edge_decimation
-from .exclude_levelset import exclude_levelset
-from .external_layer import external_layer
-from .from_field import from_field
-from .from_scoping import from_scoping
-from .from_scopings import from_scopings
-from .iso_surfaces import iso_surfaces
-from .make_plane_levelset import make_plane_levelset
-from .make_sphere_levelset import make_sphere_levelset
-from .mesh_clip import mesh_clip
-from .mesh_cut import mesh_cut
-from .mesh_extraction import mesh_extraction
-from .mesh_get_attribute import mesh_get_attribute
-from .mesh_plan_clip import mesh_plan_clip
-from .mesh_provider import mesh_provider
-from .mesh_to_graphics import mesh_to_graphics
-from .mesh_to_graphics_edges import mesh_to_graphics_edges
-from .mesh_to_pyvista import mesh_to_pyvista
-from .mesh_to_tetra import mesh_to_tetra
-from .meshes_provider import meshes_provider
-from .node_coordinates import node_coordinates
-from .points_from_coordinates import points_from_coordinates
-from .skin import skin
-from .split_fields import split_fields
-from .split_mesh import split_mesh
-from .stl_export import stl_export
-from .tri_mesh_skin import tri_mesh_skin
-from .wireframe import wireframe
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .acmo_mesh_provider import acmo_mesh_provider
+    from .beam_properties import beam_properties
+    from .change_cs import change_cs
+    from .combine_levelset import combine_levelset
+    from .decimate_mesh import decimate_mesh
+    from .edge_decimation import edge_decimation
+    from .exclude_levelset import exclude_levelset
+    from .external_layer import external_layer
+    from .from_field import from_field
+    from .from_scoping import from_scoping
+    from .from_scopings import from_scopings
+    from .iso_surfaces import iso_surfaces
+    from .make_plane_levelset import make_plane_levelset
+    from .make_sphere_levelset import make_sphere_levelset
+    from .mesh_clip import mesh_clip
+    from .mesh_cut import mesh_cut
+    from .mesh_extraction import mesh_extraction
+    from .mesh_get_attribute import mesh_get_attribute
+    from .mesh_plan_clip import mesh_plan_clip
+    from .mesh_provider import mesh_provider
+    from .mesh_to_graphics import mesh_to_graphics
+    from .mesh_to_graphics_edges import mesh_to_graphics_edges
+    from .mesh_to_pyvista import mesh_to_pyvista
+    from .mesh_to_tetra import mesh_to_tetra
+    from .meshes_provider import meshes_provider
+    from .node_coordinates import node_coordinates
+    from .points_from_coordinates import points_from_coordinates
+    from .skin import skin
+    from .split_fields import split_fields
+    from .split_mesh import split_mesh
+    from .stl_export import stl_export
+    from .tri_mesh_skin import tri_mesh_skin
+    from .wireframe import wireframe
+
+lazy_package(
+    __name__,
+    [
+        "acmo_mesh_provider",
+        "beam_properties",
+        "change_cs",
+        "combine_levelset",
+        "decimate_mesh",
+        "edge_decimation",
+        "exclude_levelset",
+        "external_layer",
+        "from_field",
+        "from_scoping",
+        "from_scopings",
+        "iso_surfaces",
+        "make_plane_levelset",
+        "make_sphere_levelset",
+        "mesh_clip",
+        "mesh_cut",
+        "mesh_extraction",
+        "mesh_get_attribute",
+        "mesh_plan_clip",
+        "mesh_provider",
+        "mesh_to_graphics",
+        "mesh_to_graphics_edges",
+        "mesh_to_pyvista",
+        "mesh_to_tetra",
+        "meshes_provider",
+        "node_coordinates",
+        "points_from_coordinates",
+        "skin",
+        "split_fields",
+        "split_mesh",
+        "stl_export",
+        "tri_mesh_skin",
+        "wireframe",
+    ],
+    classes=True,
+)
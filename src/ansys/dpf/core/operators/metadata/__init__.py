@@ -1,19 +1,50 @@
-from .boundary_condition_provider import boundary_condition_provider
-from .coordinate_system_data_provider import coordinate_system_data_provider
-from .cyclic_mesh_expansion import cyclic_mesh_expansion
-from .cyclic_support_provider import cyclic_support_provider
-from .datasources_provider import datasources_provider
-from .element_types_provider import element_types_provider
-from .integrate_over_time_freq import integrate_over_time_freq
-from .is_cyclic import is_cyclic
-from .material_support_provider import material_support_provider
-from .mesh_info_provider import mesh_info_provider
-from .mesh_property_provider import mesh_property_provider
-from .mesh_selection_manager_provider import mesh_selection_manager_provider
-from .mesh_support_provider import mesh_support_provider
-from .property_field_provider_by_name import property_field_provider_by_name
-from .real_constants_provider import real_constants_provider
-from .result_info_provider import result_info_provider
-from .streams_provider import streams_provider
-from .time_freq_provider import time_freq_provider
-from .time_freq_support_get_attribute import time_freq_support_get_attribute
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .boundary_condition_provider import boundary_condition_provider
+    from .coordinate_system_data_provider import coordinate_system_data_provider
+    from .cyclic_mesh_expansion import cyclic_mesh_expansion
+    from .cyclic_support_provider import cyclic_support_provider
+    from .datasources_provider import datasources_provider
+    from .element_types_provider import element_types_provider
+    from .integrate_over_time_freq import integrate_over_time_freq
+    from .is_cyclic import is_cyclic
+    from .material_support_provider import material_support_provider
+    from .mesh_info_provider import mesh_info_provider
+    from .mesh_property_provider import mesh_property_provider
+    from .mesh_selection_manager_provider import mesh_selection_manager_provider
+    from .mesh_support_provider import mesh_support_provider
+    from .property_field_provider_by_name import property_field_provider_by_name
+    from .real_constants_provider import real_constants_provider
+    from .result_info_provider import result_info_provider
+    from .streams_provider import streams_provider
+    from .time_freq_provider import time_freq_provider
+    from .time_freq_support_get_attribute import time_freq_support_get_attribute
+
+lazy_package(
+    __name__,
+    [
+        "boundary_condition_provider",
+        "coordinate_system_data_provider",
+        "cyclic_mesh_expansion",
+        "cyclic_support_provider",
+        "datasources_provider",
+        "element_types_provider",
+        "integrate_over_time_freq",
+        "is_cyclic",
+        "material_support_provider",
+        "mesh_info_provider",
+        "mesh_property_provider",
+        "mesh_selection_manager_provider",
+        "mesh_support_provider",
+        "property_field_provider_by_name",
+        "real_constants_provider",
+        "result_info_provider",
+        "streams_provider",
+        "time_freq_provider",
+        "time_freq_support_get_attribute",
+    ],
+    classes=True,
+)
@@ -1,409 +1,830 @@
-from .acceleration import acceleration
-from .acceleration_X import acceleration_X
-from .acceleration_Y import acceleration_Y
-from .acceleration_Z import acceleration_Z
-from .accu_eqv_creep_strain import accu_eqv_creep_strain
-from .accu_eqv_plastic_strain import accu_eqv_plastic_strain
-from .acoustic_energy_density import acoustic_energy_density
-from .acoustic_pressure import acoustic_pressure
-from .add_rigid_body_motion import add_rigid_body_motion
-from .add_rigid_body_motion_fc import add_rigid_body_motion_fc
-from .artificial_hourglass_energy import artificial_hourglass_energy
-from .average_velocity import average_velocity
-from .beam_axial_force import beam_axial_force
-from .beam_axial_plastic_strain import beam_axial_plastic_strain
-from .beam_axial_stress import beam_axial_stress
-from .beam_axial_total_strain import beam_axial_total_strain
-from .beam_rs_shear_stress import beam_rs_shear_stress
-from .beam_s_bending_moment import beam_s_bending_moment
-from .beam_s_shear_force import beam_s_shear_force
-from .beam_t_bending_moment import beam_t_bending_moment
-from .beam_t_shear_force import beam_t_shear_force
-from .beam_torsional_moment import beam_torsional_moment
-from .beam_tr_shear_stress import beam_tr_shear_stress
-from .cgns_result_provider import cgns_result_provider
-from .cms_dst_table_provider import cms_dst_table_provider
-from .cms_matrices_provider import cms_matrices_provider
-from .cms_subfile_info_provider import cms_subfile_info_provider
-from .co_energy import co_energy
-from .compute_invariant_terms_motion import compute_invariant_terms_motion
-from .compute_invariant_terms_rbd import compute_invariant_terms_rbd
-from .compute_stress import compute_stress
-from .compute_stress_1 import compute_stress_1
-from .compute_stress_2 import compute_stress_2
-from .compute_stress_3 import compute_stress_3
-from .compute_stress_X import compute_stress_X
-from .compute_stress_XY import compute_stress_XY
-from .compute_stress_XZ import compute_stress_XZ
-from .compute_stress_Y import compute_stress_Y
-from .compute_stress_YZ import compute_stress_YZ
-from .compute_stress_Z import compute_stress_Z
-from .compute_stress_von_mises import compute_stress_von_mises
-from .compute_total_strain import compute_total_strain
-from .compute_total_strain_1 import compute_total_strain_1
-from .compute_total_strain_2 import compute_total_strain_2
-from .compute_total_strain_3 import compute_total_strain_3
-from .compute_total_strain_X import compute_total_strain_X
-from .compute_total_strain_XY import compute_total_strain_XY
-from .compute_total_strain_XZ import compute_total_strain_XZ
-from .compute_total_strain_Y import compute_total_strain_Y
-from .compute_total_strain_YZ import compute_total_strain_YZ
-from .compute_total_strain_Z import compute_total_strain_Z
-from .contact_element_heat_flow import contact_element_heat_flow
-from .contact_fluid_penetration_pressure import contact_fluid_penetration_pressure
-from .contact_friction_stress import contact_friction_stress
-from .contact_gap_distance import contact_gap_distance
-from .contact_penetration import contact_penetration
-from .contact_pressure import contact_pressure
-from .contact_sliding_distance import contact_sliding_distance
-from .contact_status import contact_status
-from .contact_surface_heat_flux import contact_surface_heat_flux
-from .contact_total_stress import contact_total_stress
-from .convection_heat_flow_rate import convection_heat_flow_rate
-from .coordinate_system import coordinate_system
-from .coordinates import coordinates
-from .creep_strain import creep_strain
-from .creep_strain_X import creep_strain_X
-from .creep_strain_XY import creep_strain_XY
-from .creep_strain_XZ import creep_strain_XZ
-from .creep_strain_Y import creep_strain_Y
-from .creep_strain_YZ import creep_strain_YZ
-from .creep_strain_Z import creep_strain_Z
-from .creep_strain_energy_density import creep_strain_energy_density
-from .creep_strain_eqv import creep_strain_eqv
-from .creep_strain_intensity import creep_strain_intensity
-from .creep_strain_max_shear import creep_strain_max_shear
-from .creep_strain_principal_1 import creep_strain_principal_1
-from .creep_strain_principal_2 import creep_strain_principal_2
-from .creep_strain_principal_3 import creep_strain_principal_3
-from .current_density import current_density
-from .cyclic_analytic_seqv_max import cyclic_analytic_seqv_max
-from .cyclic_analytic_usum_max import cyclic_analytic_usum_max
-from .cyclic_expansion import cyclic_expansion
-from .density import density
-from .displacement import displacement
-from .displacement_X import displacement_X
-from .displacement_Y import displacement_Y
-from .displacement_Z import displacement_Z
-from .div_lighthill_tensor import div_lighthill_tensor
-from .dynamic_viscosity import dynamic_viscosity
-from .elastic_strain import elastic_strain
-from .elastic_strain_X import elastic_strain_X
-from .elastic_strain_XY import elastic_strain_XY
-from .elastic_strain_XZ import elastic_strain_XZ
-from .elastic_strain_Y import elastic_strain_Y
-from .elastic_strain_YZ import elastic_strain_YZ
-from .elastic_strain_Z import elastic_strain_Z
-from .elastic_strain_energy_density import elastic_strain_energy_density
-from .elastic_strain_eqv import elastic_strain_eqv
-from .elastic_strain_intensity import elastic_strain_intensity
-from .elastic_strain_max_shear import elastic_strain_max_shear
-from .elastic_strain_principal_1 import elastic_strain_principal_1
-from .elastic_strain_principal_2 import elastic_strain_principal_2
-from .elastic_strain_principal_3 import elastic_strain_principal_3
-from .elastic_strain_rotation_by_euler_nodes import elastic_strain_rotation_by_euler_nodes
-from .electric_field import electric_field
-from .electric_field_X import electric_field_X
-from .electric_field_Y import electric_field_Y
-from .electric_field_Z import electric_field_Z
-from .electric_flux_density import electric_flux_density
-from .electric_flux_density_X import electric_flux_density_X
-from .electric_flux_density_Y import electric_flux_density_Y
-from .electric_flux_density_Z import electric_flux_density_Z
-from .electric_potential import electric_potential
-from .element_centroids import element_centroids
-from .element_nodal_forces import element_nodal_forces
-from .element_nodal_heat import element_nodal_heat
-from .element_nodal_moments import element_nodal_moments
-from .element_orientations import element_orientations
-from .element_orientations_X import element_orientations_X
-from .element_orientations_Y import element_orientations_Y
-from .element_orientations_Z import element_orientations_Z
-from .elemental_heat_generation import elemental_heat_generation
-from .elemental_mass import elemental_mass
-from .elemental_volume import elemental_volume
-from .emissivity import emissivity
-from .emitted_radiation_heat_flux import emitted_radiation_heat_flux
-from .enclosure_number import enclosure_number
-from .enf_rotation_by_euler_nodes import enf_rotation_by_euler_nodes
-from .enthalpy import enthalpy
-from .entropy import entropy
-from .epsilon import epsilon
-from .equivalent_mass import equivalent_mass
-from .equivalent_radiated_power import equivalent_radiated_power
-from .eqv_stress_parameter import eqv_stress_parameter
-from .erp_radiation_efficiency import erp_radiation_efficiency
-from .euler_load_buckling import euler_load_buckling
-from .euler_nodes import euler_nodes
-from .film_coefficient import film_coefficient
-from .flow_rate import flow_rate
-from .fluid_velocity import fluid_velocity
-from .gasket_deformation import gasket_deformation
-from .gasket_deformation_X import gasket_deformation_X
-from .gasket_deformation_XY import gasket_deformation_XY
-from .gasket_deformation_XZ import gasket_deformation_XZ
-from .gasket_inelastic_closure import gasket_inelastic_closure
-from .gasket_inelastic_closure_X import gasket_inelastic_closure_X
-from .gasket_inelastic_closure_XY import gasket_inelastic_closure_XY
-from .gasket_inelastic_closure_XZ import gasket_inelastic_closure_XZ
-from .gasket_stress import gasket_stress
-from .gasket_stress_X import gasket_stress_X
-from .gasket_stress_XY import gasket_stress_XY
-from .gasket_stress_XZ import gasket_stress_XZ
-from .gasket_thermal_closure import gasket_thermal_closure
-from .gasket_thermal_closure_X import gasket_thermal_closure_X
-from .gasket_thermal_closure_XY import gasket_thermal_closure_XY
-from .gasket_thermal_closure_XZ import gasket_thermal_closure_XZ
-from .gasket_total_closure import gasket_total_closure
-from .gasket_total_closure_X import gasket_total_closure_X
-from .gasket_total_closure_XY import gasket_total_closure_XY
-from .gasket_total_closure_XZ import gasket_total_closure_XZ
-from .global_added_mass import global_added_mass
-from .global_added_mass_pct import global_added_mass_pct
-from .global_center_mass import global_center_mass
-from .global_energy_ratio import global_energy_ratio
-from .global_energy_ratio_wo_eroded import global_energy_ratio_wo_eroded
-from .global_eroded_hourglass_energy import global_eroded_hourglass_energy
-from .global_eroded_internal_energy import global_eroded_internal_energy
-from .global_eroded_kinetic_energy import global_eroded_kinetic_energy
-from .global_external_work import global_external_work
-from .global_hourglass_energy import global_hourglass_energy
-from .global_internal_energy import global_internal_energy
-from .global_joint_internal_energy import global_joint_internal_energy
-from .global_kinetic_energy import global_kinetic_energy
-from .global_rigid_body_stopper_energy import global_rigid_body_stopper_energy
-from .global_sliding_interface_energy import global_sliding_interface_energy
-from .global_spring_damper_energy import global_spring_damper_energy
-from .global_system_damping_energy import global_system_damping_energy
-from .global_time_step import global_time_step
-from .global_to_nodal import global_to_nodal
-from .global_total_energy import global_total_energy
-from .global_total_mass import global_total_mass
-from .global_velocity import global_velocity
-from .heat_conductivity_rate import heat_conductivity_rate
-from .heat_flux import heat_flux
-from .heat_flux_X import heat_flux_X
-from .heat_flux_Y import heat_flux_Y
-from .heat_flux_Z import heat_flux_Z
-from .heat_transport_rate import heat_transport_rate
-from .hydrostatic_pressure import hydrostatic_pressure
-from .incident_radiation_heat_flux import incident_radiation_heat_flux
-from .incremental_energy import incremental_energy
-from .initial_coordinates import initial_coordinates
-from .input_sound_power import input_sound_power
-from .interface_contact_area import interface_contact_area
-from .interface_contact_force import interface_contact_force
-from .interface_contact_mass import interface_contact_mass
-from .interface_contact_moment import interface_contact_moment
-from .interface_resultant_contact_force import interface_resultant_contact_force
-from .joint_force_reaction import joint_force_reaction
-from .joint_moment_reaction import joint_moment_reaction
-from .joint_relative_acceleration import joint_relative_acceleration
-from .joint_relative_angular_acceleration import joint_relative_angular_acceleration
-from .joint_relative_angular_velocity import joint_relative_angular_velocity
-from .joint_relative_displacement import joint_relative_displacement
-from .joint_relative_rotation import joint_relative_rotation
-from .joint_relative_velocity import joint_relative_velocity
-from .kinetic_energy import kinetic_energy
-from .layer_orientation_provider import layer_orientation_provider
-from .mach_number import mach_number
-from .magnetic_field import magnetic_field
-from .magnetic_field_X import magnetic_field_X
-from .magnetic_field_Y import magnetic_field_Y
-from .magnetic_field_Z import magnetic_field_Z
-from .magnetic_flux_density import magnetic_flux_density
-from .magnetic_flux_density_X import magnetic_flux_density_X
-from .magnetic_flux_density_Y import magnetic_flux_density_Y
-from .magnetic_flux_density_Z import magnetic_flux_density_Z
-from .magnetic_scalar_potential import magnetic_scalar_potential
-from .magnetic_vector_potential import magnetic_vector_potential
-from .mapdl_material_properties import mapdl_material_properties
-from .mapdl_section import mapdl_section
-from .mapdl_split_to_acmo_facet_indices import mapdl_split_to_acmo_facet_indices
-from .mass_flow_rate import mass_flow_rate
-from .mass_fraction import mass_fraction
-from .material_property_of_element import material_property_of_element
-from .mean_static_pressure import mean_static_pressure
-from .mean_temperature import mean_temperature
-from .mean_velocity import mean_velocity
-from .members_in_bending_not_certified import members_in_bending_not_certified
-from .members_in_compression_not_certified import members_in_compression_not_certified
-from .members_in_linear_compression_bending_not_certified import members_in_linear_compression_bending_not_certified
-from .migrate_to_h5dpf import migrate_to_h5dpf
-from .modal_acceleration import modal_acceleration
-from .modal_basis import modal_basis
-from .modal_coordinate import modal_coordinate
-from .modal_velocity import modal_velocity
-from .net_radiation_heat_flux import net_radiation_heat_flux
-from .nmisc import nmisc
-from .nodal_force import nodal_force
-from .nodal_rotation import nodal_rotation
-from .nodal_rotation_X import nodal_rotation_X
-from .nodal_rotation_Y import nodal_rotation_Y
-from .nodal_rotation_Z import nodal_rotation_Z
-from .nodal_rotational_acceleration import nodal_rotational_acceleration
-from .nodal_rotational_acceleration_X import nodal_rotational_acceleration_X
-from .nodal_rotational_acceleration_Y import nodal_rotational_acceleration_Y
-from .nodal_rotational_acceleration_Z import nodal_rotational_acceleration_Z
-from .nodal_rotational_velocity import nodal_rotational_velocity
-from .nodal_rotational_velocity_X import nodal_rotational_velocity_X
-from .nodal_rotational_velocity_Y import nodal_rotational_velocity_Y
-from .nodal_rotational_velocity_Z import nodal_rotational_velocity_Z
-from .nodal_to_global import nodal_to_global
-from .node_orientations import node_orientations
-from .node_orientations_X import node_orientations_X
-from .node_orientations_Y import node_orientations_Y
-from .node_orientations_Z import node_orientations_Z
-from .normal_contact_force import normal_contact_force
-from .normal_contact_moment import normal_contact_moment
-from .num_surface_status_changes import num_surface_status_changes
-from .nusselt_number import nusselt_number
-from .omega import omega
-from .output_sound_power import output_sound_power
-from .part_added_mass import part_added_mass
-from .part_eroded_internal_energy import part_eroded_internal_energy
-from .part_eroded_kinetic_energy import part_eroded_kinetic_energy
-from .part_hourglass_energy import part_hourglass_energy
-from .part_internal_energy import part_internal_energy
-from .part_kinetic_energy import part_kinetic_energy
-from .part_momentum import part_momentum
-from .part_rigid_body_velocity import part_rigid_body_velocity
-from .plastic_state_variable import plastic_state_variable
-from .plastic_strain import plastic_strain
-from .plastic_strain_X import plastic_strain_X
-from .plastic_strain_XY import plastic_strain_XY
-from .plastic_strain_XZ import plastic_strain_XZ
-from .plastic_strain_Y import plastic_strain_Y
-from .plastic_strain_YZ import plastic_strain_YZ
-from .plastic_strain_Z import plastic_strain_Z
-from .plastic_strain_energy_density import plastic_strain_energy_density
-from .plastic_strain_eqv import plastic_strain_eqv
-from .plastic_strain_intensity import plastic_strain_intensity
-from .plastic_strain_max_shear import plastic_strain_max_shear
-from .plastic_strain_principal_1 import plastic_strain_principal_1
-from .plastic_strain_principal_2 import plastic_strain_principal_2
-from .plastic_strain_principal_3 import plastic_strain_principal_3
-from .plastic_strain_rotation_by_euler_nodes import plastic_strain_rotation_by_euler_nodes
-from .poynting_vector import poynting_vector
-from .poynting_vector_surface import poynting_vector_surface
-from .prandtl_number import prandtl_number
-from .pres_to_field import pres_to_field
-from .pressure import pressure
-from .pretension import pretension
-from .prns_to_field import prns_to_field
-from .radiation_area import radiation_area
-from .radiation_heat_flow_rate import radiation_heat_flow_rate
-from .raw_acceleration import raw_acceleration
-from .raw_displacement import raw_displacement
-from .raw_reaction_force import raw_reaction_force
-from .raw_velocity import raw_velocity
-from .reaction_force import reaction_force
-from .reaction_force_X import reaction_force_X
-from .reaction_force_Y import reaction_force_Y
-from .reaction_force_Z import reaction_force_Z
-from .reaction_heat import reaction_heat
-from .reaction_moment import reaction_moment
-from .reaction_moment_X import reaction_moment_X
-from .reaction_moment_Y import reaction_moment_Y
-from .reaction_moment_Z import reaction_moment_Z
-from .read_cms_rbd_file import read_cms_rbd_file
-from .recombine_harmonic_indeces_cyclic import recombine_harmonic_indeces_cyclic
-from .record_reader import record_reader
-from .reflected_radiation_heat_flux import reflected_radiation_heat_flux
-from .remove_rigid_body_motion import remove_rigid_body_motion
-from .remove_rigid_body_motion_fc import remove_rigid_body_motion_fc
-from .result_provider import result_provider
-from .reynolds_number import reynolds_number
-from .rigid_transformation import rigid_transformation
-from .rigid_transformation_provider import rigid_transformation_provider
-from .rms_static_pressure import rms_static_pressure
-from .rms_temperature import rms_temperature
-from .rms_velocity import rms_velocity
-from .rom_data_provider import rom_data_provider
-from .run import run
-from .smisc import smisc
-from .specific_heat import specific_heat
-from .spectrum_data import spectrum_data
-from .squared_l2norm_pressure import squared_l2norm_pressure
-from .state_variable import state_variable
-from .static_pressure import static_pressure
-from .stiffness_matrix_energy import stiffness_matrix_energy
-from .strain_eqv_as_mechanical import strain_eqv_as_mechanical
-from .strain_eqv_as_mechanical_workflow import strain_eqv_as_mechanical_workflow
-from .stress import stress
-from .stress_X import stress_X
-from .stress_XY import stress_XY
-from .stress_XZ import stress_XZ
-from .stress_Y import stress_Y
-from .stress_YZ import stress_YZ
-from .stress_Z import stress_Z
-from .stress_eqv_as_mechanical import stress_eqv_as_mechanical
-from .stress_eqv_as_mechanical_workflow import stress_eqv_as_mechanical_workflow
-from .stress_intensity import stress_intensity
-from .stress_max_shear import stress_max_shear
-from .stress_principal_1 import stress_principal_1
-from .stress_principal_2 import stress_principal_2
-from .stress_principal_3 import stress_principal_3
-from .stress_ratio import stress_ratio
-from .stress_rotation_by_euler_nodes import stress_rotation_by_euler_nodes
-from .stress_von_mises import stress_von_mises
-from .structural_temperature import structural_temperature
-from .superficial_velocity import superficial_velocity
-from .surface_heat_rate import surface_heat_rate
-from .swelling_strains import swelling_strains
-from .tangential_contact_force import tangential_contact_force
-from .tangential_contact_moment import tangential_contact_moment
-from .temperature import temperature
-from .temperature_grad import temperature_grad
-from .temperature_grad_X import temperature_grad_X
-from .temperature_grad_Y import temperature_grad_Y
-from .temperature_grad_Z import temperature_grad_Z
-from .thermal_conductivity import thermal_conductivity
-from .thermal_dissipation_energy import thermal_dissipation_energy
-from .thermal_strain import thermal_strain
-from .thermal_strain_X import thermal_strain_X
-from .thermal_strain_XY import thermal_strain_XY
-from .thermal_strain_XZ import thermal_strain_XZ
-from .thermal_strain_Y import thermal_strain_Y
-from .thermal_strain_YZ import thermal_strain_YZ
-from .thermal_strain_Z import thermal_strain_Z
-from .thermal_strain_principal_1 import thermal_strain_principal_1
-from .thermal_strain_principal_2 import thermal_strain_principal_2
-from .thermal_strain_principal_3 import thermal_strain_principal_3
-from .thermal_strains_eqv import thermal_strains_eqv
-from .thickness import thickness
-from .torque import torque
-from .total_contact_force import total_contact_force
-from .total_contact_moment import total_contact_moment
-from .total_mass import total_mass
-from .total_pressure import total_pressure
-from .total_strain import total_strain
-from .total_strain_X import total_strain_X
-from .total_strain_XY import total_strain_XY
-from .total_strain_XZ import total_strain_XZ
-from .total_strain_Y import total_strain_Y
-from .total_strain_YZ import total_strain_YZ
-from .total_strain_Z import total_strain_Z
-from .total_strain_eqv import total_strain_eqv
-from .total_strain_intensity import total_strain_intensity
-from .total_strain_max_shear import total_strain_max_shear
-from .total_strain_principal_1 import total_strain_principal_1
-from .total_strain_principal_2 import total_strain_principal_2
-from .total_strain_principal_3 import total_strain_principal_3
-from .total_temperature import total_temperature
-from .transform_invariant_terms_rbd import transform_invariant_terms_rbd
-from .transient_rayleigh_integration import transient_rayleigh_integration
-from .turbulent_kinetic_energy import turbulent_kinetic_energy
-from .turbulent_viscosity import turbulent_viscosity
-from .velocity import velocity
-from .velocity_X import velocity_X
-from .velocity_Y import velocity_Y
-from .velocity_Z import velocity_Z
-from .view_factor_sum import view_factor_sum
-from .volume_fraction import volume_fraction
-from .wall_shear_stress import wall_shear_stress
-from .workflow_energy_per_component import workflow_energy_per_component
-from .workflow_energy_per_harmonic import workflow_energy_per_harmonic
-from .write_cms_rbd_file import write_cms_rbd_file
-from .write_motion_dfmf_file import write_motion_dfmf_file
-from .y_plus import y_plus
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .acceleration import acceleration
+    from .acceleration_X import acceleration_X
+    from .acceleration_Y import acceleration_Y
+    from .acceleration_Z import acceleration_Z
+    from .accu_eqv_creep_strain import accu_eqv_creep_strain
+    from .accu_eqv_plastic_strain import accu_eqv_plastic_strain
+    from .acoustic_energy_density import acoustic_energy_density
+    from .acoustic_pressure import acoustic_pressure
+    from .add_rigid_body_motion import add_rigid_body_motion
+    from .add_rigid_body_motion_fc import add_rigid_body_motion_fc
+    from .artificial_hourglass_energy import artificial_hourglass_energy
+    from .average_velocity import average_velocity
+    from .beam_axial_force import beam_axial_force
+    from .beam_axial_plastic_strain import beam_axial_plastic_strain
+    from .beam_axial_stress import beam_axial_stress
+    from .beam_axial_total_strain import beam_axial_total_strain
+    from .beam_rs_shear_stress import beam_rs_shear_stress
+    from .beam_s_bending_moment import beam_s_bending_moment
+    from .beam_s_shear_force import beam_s_shear_force
+    from .beam_t_bending_moment import beam_t_bending_moment
+    from .beam_t_shear_force import beam_t_shear_force
+    from .beam_torsional_moment import beam_torsional_moment
+    from .beam_tr_shear_stress import beam_tr_shear_stress
+    from .cgns_result_provider import cgns_result_provider
+    from .cms_dst_table_provider import cms_dst_table_provider
+    from .cms_matrices_provider import cms_matrices_provider
+    from .cms_subfile_info_provider import cms_subfile_info_provider
+    from .co_energy import co_energy
+    from .compute_invariant_terms_motion import compute_invariant_terms_motion
+    from .compute_invariant_terms_rbd import compute_invariant_terms_rbd
+    from .compute_stress import compute_stress
+    from .compute_stress_1 import compute_stress_1
+    from .compute_stress_2 import compute_stress_2
+    from .compute_stress_3 import compute_stress_3
+    from .compute_stress_X import compute_stress_X
+    from .compute_stress_XY import compute_stress_XY
+    from .compute_stress_XZ import compute_stress_XZ
+    from .compute_stress_Y import compute_stress_Y
+    from .compute_stress_YZ import compute_stress_YZ
+    from .compute_stress_Z import compute_stress_Z
+    from .compute_stress_von_mises import compute_stress_von_mises
+    from .compute_total_strain import compute_total_strain
+    from .compute_total_strain_1 import compute_total_strain_1
+    from .compute_total_strain_2 import compute_total_strain_2
+    from .compute_total_strain_3 import compute_total_strain_3
+    from .compute_total_strain_X import compute_total_strain_X
+    from .compute_total_strain_XY import compute_total_strain_XY
+    from .compute_total_strain_XZ import compute_total_strain_XZ
+    from .compute_total_strain_Y import compute_total_strain_Y
+    from .compute_total_strain_YZ import compute_total_strain_YZ
+    from .compute_total_strain_Z import compute_total_strain_Z
+    from .contact_element_heat_flow import contact_element_heat_flow
+    from .contact_fluid_penetration_pressure import contact_fluid_penetration_pressure
+    from .contact_friction_stress import contact_friction_stress
+    from .contact_gap_distance import contact_gap_distance
+    from .contact_penetration import contact_penetration
+    from .contact_pressure import contact_pressure
+    from .contact_sliding_distance import contact_sliding_distance
+    from .contact_status import contact_status
+    from .contact_surface_heat_flux import contact_surface_heat_flux
+    from .contact_total_stress import contact_total_stress
+    from .convection_heat_flow_rate import convection_heat_flow_rate
+    from .coordinate_system import coordinate_system
+    from .coordinates import coordinates
+    from .creep_strain import creep_strain
+    from .creep_strain_X import creep_strain_X
+    from .creep_strain_XY import creep_strain_XY
+    from .creep_strain_XZ import creep_strain_XZ
+    from .creep_strain_Y import creep_strain_Y
+    from .creep_strain_YZ import creep_strain_YZ
+    from .creep_strain_Z import creep_strain_Z
+    from .creep_strain_energy_density import creep_strain_energy_density
+    from .creep_strain_eqv import creep_strain_eqv
+    from .creep_strain_intensity import creep_strain_intensity
+    from .creep_strain_max_shear import creep_strain_max_shear
+    from .creep_strain_principal_1 import creep_strain_principal_1
+    from .creep_strain_principal_2 import creep_strain_principal_2
+    from .creep_strain_principal_3 import creep_strain_principal_3
+    from .current_density import current_density
+    from .cyclic_analytic_seqv_max import cyclic_analytic_seqv_max
+    from .cyclic_analytic_usum_max import cyclic_analytic_usum_max
+    from .cyclic_expansion import cyclic_expansion
+    from .density import density
+    from .displacement import displacement
+    from .displacement_X import displacement_X
+    from .displacement_Y import displacement_Y
+    from .displacement_Z import displacement_Z
+    from .div_lighthill_tensor import div_lighthill_tensor
+    from .dynamic_viscosity import dynamic_viscosity
+    from .elastic_strain import elastic_strain
+    from .elastic_strain_X import elastic_strain_X
+    from .elastic_strain_XY import elastic_strain_XY
+    from .elastic_strain_XZ import elastic_strain_XZ
+    from .elastic_strain_Y import elastic_strain_Y
+    from .elastic_strain_YZ import elastic_strain_YZ
+    from .elastic_strain_Z import elastic_strain_Z
+    from .elastic_strain_energy_density import elastic_strain_energy_density
+    from .elastic_strain_eqv import elastic_strain_eqv
+    from .elastic_strain_intensity import elastic_strain_intensity
+    from .elastic_strain_max_shear import elastic_strain_max_shear
+    from .elastic_strain_principal_1 import elastic_strain_principal_1
+    from .elastic_strain_principal_2 import elastic_strain_principal_2
+    from .elastic_strain_principal_3 import elastic_strain_principal_3
+    from .elastic_strain_rotation_by_euler_nodes import elastic_strain_rotation_by_euler_nodes
+    from .electric_field import electric_field
+    from .electric_field_X import electric_field_X
+    from .electric_field_Y import electric_field_Y
+    from .electric_field_Z import electric_field_Z
+    from .electric_flux_density import electric_flux_density
+    from .electric_flux_density_X import electric_flux_density_X
+    from .electric_flux_density_Y import electric_flux_density_Y
+    from .electric_flux_density_Z import electric_flux_density_Z
+    from .electric_potential import electric_potential
+    from .element_centroids import element_centroids
+    from .element_nodal_forces import element_nodal_forces
+    from .element_nodal_heat import element_nodal_heat
+    from .element_nodal_moments import element_nodal_moments
+    from .element_orientations import element_orientations
+    from .element_orientations_X import element_orientations_X
+    from .element_orientations_Y import element_orientations_Y
+    from .element_orientations_Z import element_orientations_Z
+    from .elemental_heat_generation import elemental_heat_generation
+    from .elemental_mass import elemental_mass
+    from .elemental_volume import elemental_volume
+    from .emissivity import emissivity
+    from .emitted_radiation_heat_flux import emitted_radiation_heat_flux
+    from .enclosure_number import enclosure_number
+    from .enf_rotation_by_euler_nodes import enf_rotation_by_euler_nodes
+    from .enthalpy import enthalpy
+    from .entropy import entropy
+    from .epsilon import epsilon
+    from .equivalent_mass import equivalent_mass
+    from .equivalent_radiated_power import equivalent_radiated_power
+    from .eqv_stress_parameter import eqv_stress_parameter
+    from .erp_radiation_efficiency import erp_radiation_efficiency
+    from .euler_load_buckling import euler_load_buckling
+    from .euler_nodes import euler_nodes
+    from .film_coefficient import film_coefficient
+    from .flow_rate import flow_rate
+    from .fluid_velocity import fluid_velocity
+    from .gasket_deformation import gasket_deformation
+    from .gasket_deformation_X import gasket_deformation_X
+    from .gasket_deformation_XY import gasket_deformation_XY
+    from .gasket_deformation_XZ import gasket_deformation_XZ
+    from .gasket_inelastic_closure import gasket_inelastic_closure
+    from .gasket_inelastic_closure_X import gasket_inelastic_closure_X
+    from .gasket_inelastic_closure_XY import gasket_inelastic_closure_XY
+    from .gasket_inelastic_closure_XZ import gasket_inelastic_closure_XZ
+    from .gasket_stress import gasket_stress
+    from .gasket_stress_X import gasket_stress_X
+    from .gasket_stress_XY import gasket_stress_XY
+    from .gasket_stress_XZ import gasket_stress_XZ
+    from .gasket_thermal_closure import gasket_thermal_closure
+    from .gasket_thermal_closure_X import gasket_thermal_closure_X
+    from .gasket_thermal_closure_XY import gasket_thermal_closure_XY
+    from .gasket_thermal_closure_XZ import gasket_thermal_closure_XZ
+    from .gasket_total_closure import gasket_total_closure
+    from .gasket_total_closure_X import gasket_total_closure_X
+    from .gasket_total_closure_XY import gasket_total_closure_XY
+    from .gasket_total_closure_XZ import gasket_total_closure_XZ
+    from .global_added_mass import global_added_mass
+    from .global_added_mass_pct import global_added_mass_pct
+    from .global_center_mass import global_center_mass
+    from .global_energy_ratio import global_energy_ratio
+    from .global_energy_ratio_wo_eroded import global_energy_ratio_wo_eroded
+    from .global_eroded_hourglass_energy import global_eroded_hourglass_energy
+    from .global_eroded_internal_energy import global_eroded_internal_energy
+    from .global_eroded_kinetic_energy import global_eroded_kinetic_energy
+    from .global_external_work import global_external_work
+    from .global_hourglass_energy import global_hourglass_energy
+    from .global_internal_energy import global_internal_energy
+    from .global_joint_internal_energy import global_joint_internal_energy
+    from .global_kinetic_energy import global_kinetic_energy
+    from .global_rigid_body_stopper_energy import global_rigid_body_stopper_energy
+    from .global_sliding_interface_energy import global_sliding_interface_energy
+    from .global_spring_damper_energy import global_spring_damper_energy
+    from .global_system_damping_energy import global_system_damping_energy
+    from .global_time_step import global_time_step
+    from .global_to_nodal import global_to_nodal
+    from .global_total_energy import global_total_energy
+    from .global_total_mass import global_total_mass
+    from .global_velocity import global_velocity
+    from .heat_conductivity_rate import heat_conductivity_rate
+    from .heat_flux import heat_flux
+    from .heat_flux_X import heat_flux_X
+    from .heat_flux_Y import heat_flux_Y
+    from .heat_flux_Z import heat_flux_Z
+    from .heat_transport_rate import heat_transport_rate
+    from .hydrostatic_pressure import hydrostatic_pressure
+    from .incident_radiation_heat_flux import incident_radiation_heat_flux
+    from .incremental_energy import incremental_energy
+    from .initial_coordinates import initial_coordinates
+    from .input_sound_power import input_sound_power
+    from .interface_contact_area import interface_contact_area
+    from .interface_contact_force import interface_contact_force
+    from .interface_contact_mass import interface_contact_mass
+    from .interface_contact_moment import interface_contact_moment
+    from .interface_resultant_contact_force import interface_resultant_contact_force
+    from .joint_force_reaction import joint_force_reaction
+    from .joint_moment_reaction import joint_moment_reaction
+    from .joint_relative_acceleration import joint_relative_acceleration
+    from .joint_relative_angular_acceleration import joint_relative_angular_acceleration
+    from .joint_relative_angular_velocity import joint_relative_angular_velocity
+    from .joint_relative_displacement import joint_relative_displacement
+    from .joint_relative_rotation import joint_relative_rotation
+    from .joint_relative_velocity import joint_relative_velocity
+    from .kinetic_energy import kinetic_energy
+    from .layer_orientation_provider import layer_orientation_provider
+    from .mach_number import mach_number
+    from .magnetic_field import magnetic_field
+    from .magnetic_field_X import magnetic_field_X
+    from .magnetic_field_Y import magnetic_field_Y
+    from .magnetic_field_Z import magnetic_field_Z
+    from .magnetic_flux_density import magnetic_flux_density
+    from .magnetic_flux_density_X import magnetic_flux_density_X
+    from .magnetic_flux_density_Y import magnetic_flux_density_Y
+    from .magnetic_flux_density_Z import magnetic_flux_density_Z
+    from .magnetic_scalar_potential import magnetic_scalar_potential
+    from .magnetic_vector_potential import magnetic_vector_potential
+    from .mapdl_material_properties import mapdl_material_properties
+    from .mapdl_section import mapdl_section
+    from .mapdl_split_to_acmo_facet_indices import mapdl_split_to_acmo_facet_indices
+    from .mass_flow_rate import mass_flow_rate
+    from .mass_fraction import mass_fraction
+    from .material_property_of_element import material_property_of_element
+    from .mean_static_pressure import mean_static_pressure
+    from .mean_temperature import mean_temperature
+    from .mean_velocity import mean_velocity
+    from .members_in_bending_not_certified import members_in_bending_not_certified
+    from .members_in_compression_not_certified import members_in_compression_not_certified
+    from .members_in_linear_compression_bending_not_certified import members_in_linear_compression_bending_not_certified
+    from .migrate_to_h5dpf import migrate_to_h5dpf
+    from .modal_acceleration import modal_acceleration
+    from .modal_basis import modal_basis
+    from .modal_coordinate import modal_coordinate
+    from .modal_velocity import modal_velocity
+    from .net_radiation_heat_flux import net_radiation_heat_flux
+    from .nmisc import nmisc
+    from .nodal_force import nodal_force
+    from .nodal_rotation import nodal_rotation
+    from .nodal_rotation_X import nodal_rotation_X
+    from .nodal_rotation_Y import nodal_rotation_Y
+    from .nodal_rotation_Z import nodal_rotation_Z
+    from .nodal_rotational_acceleration import nodal_rotational_acceleration
+    from .nodal_rotational_acceleration_X import nodal_rotational_acceleration_X
+    from .nodal_rotational_acceleration_Y import nodal_rotational_acceleration_Y
+    from .nodal_rotational_acceleration_Z import nodal_rotational_acceleration_Z
+    from .nodal_rotational_velocity import nodal_rotational_velocity
+    from .nodal_rotational_velocity_X import nodal_rotational_velocity_X
+    from .nodal_rotational_velocity_Y import nodal_rotational_velocity_Y
+    from .nodal_rotational_velocity_Z import nodal_rotational_velocity_Z
+    from .nodal_to_global import nodal_to_global
+    from .node_orientations import node_orientations
+    from .node_orientations_X import node_orientations_X
+    from .node_orientations_Y import node_orientations_Y
+    from .node_orientations_Z import node_orientations_Z
+    from .normal_contact_force import normal_contact_force
+    from .normal_contact_moment import normal_contact_moment
+    from .num_surface_status_changes import num_surface_status_changes
+    from .nusselt_number import nusselt_number
+    from .omega import omega
+    from .output_sound_power import output_sound_power
+    from .part_added_mass import part_added_mass
+    from .part_eroded_internal_energy import part_eroded_internal_energy
+    from .part_eroded_kinetic_energy import part_eroded_kinetic_energy
+    from .part_hourglass_energy import part_hourglass_energy
+    from .part_internal_energy import part_internal_energy
+    from .part_kinetic_energy import part_kinetic_energy
+    from .part_momentum import part_momentum
+    from .part_rigid_body_velocity import part_rigid_body_velocity
+    from .plastic_state_variable import plastic_state_variable
+    from .plastic_strain import plastic_strain
+    from .plastic_strain_X import plastic_strain_X
+    from .plastic_strain_XY import plastic_strain_XY
+    from .plastic_strain_XZ import plastic_strain_XZ
+    from .plastic_strain_Y import plastic_strain_Y
+    from .plastic_strain_YZ import plastic_strain_YZ
+    from .plastic_strain_Z import plastic_strain_Z
+    from .plastic_strain_energy_density import plastic_strain_energy_density
+    from .plastic_strain_eqv import plastic_strain_eqv
+    from .plastic_strain_intensity import plastic_strain_intensity
+    from .plastic_strain_max_shear import plastic_strain_max_shear
+    from .plastic_strain_principal_1 import plastic_strain_principal_1
+    from .plastic_strain_principal_2 import plastic_strain_principal_2
+    from .plastic_strain_principal_3 import plastic_strain_principal_3
+    from .plastic_strain_rotation_by_euler_nodes import plastic_strain_rotation_by_euler_nodes
+    from .poynting_vector import poynting_vector
+    from .poynting_vector_surface import poynting_vector_surface
+    from .prandtl_number import prandtl_number
+    from .pres_to_field import pres_to_field
+    from .pressure import pressure
+    from .pretension import pretension
+    from .prns_to_field import prns_to_field
+    from .radiation_area import radiation_area
+    from .radiation_heat_flow_rate import radiation_heat_flow_rate
+    from .raw_acceleration import raw_acceleration
+    from .raw_displacement import raw_displacement
+    from .raw_reaction_force import raw_reaction_force
+    from .raw_velocity import raw_velocity
+    from .reaction_force import reaction_force
+    from .reaction_force_X import reaction_force_X
+    from .reaction_force_Y import reaction_force_Y
+    from .reaction_force_Z import reaction_force_Z
+    from .reaction_heat import reaction_heat
+    from .reaction_moment import reaction_moment
+    from .reaction_moment_X import reaction_moment_X
+    from .reaction_moment_Y import reaction_moment_Y
+    from .reaction_moment_Z import reaction_moment_Z
+    from .read_cms_rbd_file import read_cms_rbd_file
+    from .recombine_harmonic_indeces_cyclic import recombine_harmonic_indeces_cyclic
+    from .record_reader import record_reader
+    from .reflected_radiation_heat_flux import reflected_radiation_heat_flux
+    from .remove_rigid_body_motion import remove_rigid_body_motion
+    from .remove_rigid_body_motion_fc import remove_rigid_body_motion_fc
+    from .result_provider import result_provider
+    from .reynolds_number import reynolds_number
+    from .rigid_transformation import rigid_transformation
+    from .rigid_transformation_provider import rigid_transformation_provider
+    from .rms_static_pressure import rms_static_pressure
+    from .rms_temperature import rms_temperature
+    from .rms_velocity import rms_velocity
+    from .rom_data_provider import rom_data_provider
+    from .run import run
+    from .smisc import smisc
+    from .specific_heat import specific_heat
+    from .spectrum_data import spectrum_data
+    from .squared_l2norm_pressure import squared_l2norm_pressure
+    from .state_variable import state_variable
+    from .static_pressure import static_pressure
+    from .stiffness_matrix_energy import stiffness_matrix_energy
+    from .strain_eqv_as_mechanical import strain_eqv_as_mechanical
+    from .strain_eqv_as_mechanical_workflow import strain_eqv_as_mechanical_workflow
+    from .stress import stress
+    from .stress_X import stress_X
+    from .stress_XY import stress_XY
+    from .stress_XZ import stress_XZ
+    from .stress_Y import stress_Y
+    from .stress_YZ import stress_YZ
+    from .stress_Z import stress_Z
+    from .stress_eqv_as_mechanical import stress_eqv_as_mechanical
+    from .stress_eqv_as_mechanical_workflow import stress_eqv_as_mechanical_workflow
+    from .stress_intensity import stress_intensity
+    from .stress_max_shear import stress_max_shear
+    from .stress_principal_1 import stress_principal_1
+    from .stress_principal_2 import stress_principal_2
+    from .stress_principal_3 import stress_principal_3
+    from .stress_ratio import stress_ratio
+    from .stress_rotation_by_euler_nodes import stress_rotation_by_euler_nodes
+    from .stress_von_mises import stress_von_mises
+    from .structural_temperature import structural_temperature
+    from .superficial_velocity import superficial_velocity
+    from .surface_heat_rate import surface_heat_rate
+    from .swelling_strains import swelling_strains
+    from .tangential_contact_force import tangential_contact_force
+    from .tangential_contact_moment import tangential_contact_moment
+    from .temperature import temperature
+    from .temperature_grad import temperature_grad
+    from .temperature_grad_X import temperature_grad_X
+    from .temperature_grad_Y import temperature_grad_Y
+    from .temperature_grad_Z import temperature_grad_Z
+    from .thermal_conductivity import thermal_conductivity
+    from .thermal_dissipation_energy import thermal_dissipation_energy
+    from .thermal_strain import thermal_strain
+    from .thermal_strain_X import thermal_strain_X
+    from .thermal_strain_XY import thermal_strain_XY
+    from .thermal_strain_XZ import thermal_strain_XZ
+    from .thermal_strain_Y import thermal_strain_Y
+    from .thermal_strain_YZ import thermal_strain_YZ
+    from .thermal_strain_Z import thermal_strain_Z
+    from .thermal_strain_principal_1 import thermal_strain_principal_1
+    from .thermal_strain_principal_2 import thermal_strain_principal_2
+    from .thermal_strain_principal_3 import thermal_strain_principal_3
+    from .thermal_strains_eqv import thermal_strains_eqv
+    from .thickness import thickness
+    from .torque import torque
+    from .total_contact_force import total_contact_force
+    from .total_contact_moment import total_contact_moment
+    from .total_mass import total_mass
+    from .total_pressure import total_pressure
+    from .total_strain import total_strain
+    from .total_strain_X import total_strain_X
+    from .total_strain_XY import total_strain_XY
+    from .total_strain_XZ import total_strain_XZ
+    from .total_strain_Y import total_strain_Y
+    from .total_strain_YZ import total_strain_YZ
+    from .total_strain_Z import total_strain_Z
+    from .total_strain_eqv import total_strain_eqv
+    from .total_strain_intensity import total_strain_intensity
+    from .total_strain_max_shear import total_strain_max_shear
+    from .total_strain_principal_1 import total_strain_principal_1
+    from .total_strain_principal_2 import total_strain_principal_2
+    from .total_strain_principal_3 import total_strain_principal_3
+    from .total_temperature import total_temperature
+    from .transform_invariant_terms_rbd import transform_invariant_terms_rbd
+    from .transient_rayleigh_integration import transient_rayleigh_integration
+    from .turbulent_kinetic_energy import turbulent_kinetic_energy
+    from .turbulent_viscosity import turbulent_viscosity
+    from .velocity import velocity
+    from .velocity_X import velocity_X
+    from .velocity_Y import velocity_Y
+    from .velocity_Z import velocity_Z
+    from .view_factor_sum import view_factor_sum
+    from .volume_fraction import volume_fraction
+    from .wall_shear_stress import wall_shear_stress
+    from .workflow_energy_per_component import workflow_energy_per_component
+    from .workflow_energy_per_harmonic import workflow_energy_per_harmonic
+    from .write_cms_rbd_file import write_cms_rbd_file
+    from .write_motion_dfmf_file import write_motion_dfmf_file
+    from .y_plus import y_plus
+
+lazy_package(
+    __name__,
+    [
+        "acceleration",
+        "acceleration_X",
+        "acceleration_Y",
+        "acceleration_Z",
+        "accu_eqv_creep_strain",
+        "accu_eqv_plastic_strain",
+        "acoustic_energy_density",
+        "acoustic_pressure",
+        "add_rigid_body_motion",
+        "add_rigid_body_motion_fc",
+        "artificial_hourglass_energy",
+        "average_velocity",
+        "beam_axial_force",
+        "beam_axial_plastic_strain",
+        "beam_axial_stress",
+        "beam_axial_total_strain",
+        "beam_rs_shear_stress",
+        "beam_s_bending_moment",
+        "beam_s_shear_force",
+        "beam_t_bending_moment",
+        "beam_t_shear_force",
+        "beam_torsional_moment",
+        "beam_tr_shear_stress",
+        "cgns_result_provider",
+        "cms_dst_table_provider",
+        "cms_matrices_provider",
+        "cms_subfile_info_provider",
+        "co_energy",
+        "compute_invariant_terms_motion",
+        "compute_invariant_terms_rbd",
+        "compute_stress",
+        "compute_stress_1",
+        "compute_stress_2",
+        "compute_stress_3",
+        "compute_stress_X",
+        "compute_stress_XY",
+        "compute_stress_XZ",
+        "compute_stress_Y",
+        "compute_stress_YZ",
+        "compute_stress_Z",
+        "compute_stress_von_mises",
+        "compute_total_strain",
+        "compute_total_strain_1",
+        "compute_total_strain_2",
+        "compute_total_strain_3",
+        "compute_total_strain_X",
+        "compute_total_strain_XY",
+        "compute_total_strain_XZ",
+        "compute_total_strain_Y",
+        "compute_total_strain_YZ",
+        "compute_total_strain_Z",
+        "contact_element_heat_flow",
+        "contact_fluid_penetration_pressure",
+        "contact_friction_stress",
+        "contact_gap_distance",
+        "contact_penetration",
+        "contact_pressure",
+        "contact_sliding_distance",
+        "contact_status",
+        "contact_surface_heat_flux",
+        "contact_total_stress",
+        "convection_heat_flow_rate",
+        "coordinate_system",
+        "coordinates",
+        "creep_strain",
+        "creep_strain_X",
+        "creep_strain_XY",
+        "creep_strain_XZ",
+        "creep_strain_Y",
+        "creep_strain_YZ",
+        "creep_strain_Z",
+        "creep_strain_energy_density",
+        "creep_strain_eqv",
+        "creep_strain_intensity",
+        "creep_strain_max_shear",
+        "creep_strain_principal_1",
+        "creep_strain_principal_2",
+        "creep_strain_principal_3",
+        "current_density",
+        "cyclic_analytic_seqv_max",
+        "cyclic_analytic_usum_max",
+        "cyclic_expansion",
+        "density",
+        "displacement",
+        "displacement_X",
+        "displacement_Y",
+        "displacement_Z",
+        "div_lighthill_tensor",
+        "dynamic_viscosity",
+        "elastic_strain",
+        "elastic_strain_X",
+        "elastic_strain_XY",
+        "elastic_strain_XZ",
+        "elastic_strain_Y",
+        "elastic_strain_YZ",
+        "elastic_strain_Z",
+        "elastic_strain_energy_density",
+        "elastic_strain_eqv",
+        "elastic_strain_intensity",
+        "elastic_strain_max_shear",
+        "elastic_strain_principal_1",
+        "elastic_strain_principal_2",
+        "elastic_strain_principal_3",
+        "elastic_strain_rotation_by_euler_nodes",
+        "electric_field",
+        "electric_field_X",
+        "electric_field_Y",
+        "electric_field_Z",
+        "electric_flux_density",
+        "electric_flux_density_X",
+        "electric_flux_density_Y",
+        "electric_flux_density_Z",
+        "electric_potential",
+        "element_centroids",
+        "element_nodal_forces",
+        "element_nodal_heat",
+        "element_nodal_moments",
+        "element_orientations",
+        "element_orientations_X",
+        "element_orientations_Y",
+        "element_orientations_Z",
+        "elemental_heat_generation",
+        "elemental_mass",
+        "elemental_volume",
+        "emissivity",
+        "emitted_radiation_heat_flux",
+        "enclosure_number",
+        "enf_rotation_by_euler_nodes",
+        "enthalpy",
+        "entropy",
+        "epsilon",
+        "equivalent_mass",
+        "equivalent_radiated_power",
+        "eqv_stress_parameter",
+        "erp_radiation_efficiency",
+        "euler_load_buckling",
+        "euler_nodes",
+        "film_coefficient",
+        "flow_rate",
+        "fluid_velocity",
+        "gasket_deformation",
+        "gasket_deformation_X",
+        "gasket_deformation_XY",
+        "gasket_deformation_XZ",
+        "gasket_inelastic_closure",
+        "gasket_inelastic_closure_X",
+        "gasket_inelastic_closure_XY",
+        "gasket_inelastic_closure_XZ",
+        "gasket_stress",
+        "gasket_stress_X",
+        "gasket_stress_XY",
+        "gasket_stress_XZ",
+        "gasket_thermal_closure",
+        "gasket_thermal_closure_X",
+        "gasket_thermal_closure_XY",
+        "gasket_thermal_closure_XZ",
+        "gasket_total_closure",
+        "gasket_total_closure_X",
+        "gasket_total_closure_XY",
+        "gasket_total_closure_XZ",
+        "global_added_mass",
+        "global_added_mass_pct",
+        "global_center_mass",
+        "global_energy_ratio",
+        "global_energy_ratio_wo_eroded",
+        "global_eroded_hourglass_energy",
+        "global_eroded_internal_energy",
+        "global_eroded_kinetic_energy",
+        "global_external_work",
+        "global_hourglass_energy",
+        "global_internal_energy",
+        "global_joint_internal_energy",
+        "global_kinetic_energy",
+        "global_rigid_body_stopper_energy",
+        "global_sliding_interface_energy",
+        "global_spring_damper_energy",
+        "global_system_damping_energy",
+        "global_time_step",
+        "global_to_nodal",
+        "global_total_energy",
+        "global_total_mass",
+        "global_velocity",
+        "heat_conductivity_rate",
+        "heat_flux",
+        "heat_flux_X",
+        "heat_flux_Y",
+        "heat_flux_Z",
+        "heat_transport_rate",
+        "hydrostatic_pressure",
+        "incident_radiation_heat_flux",
+        "incremental_energy",
+        "initial_coordinates",
+        "input_sound_power",
+        "interface_contact_area",
+        "interface_contact_force",
+        "interface_contact_mass",
+        "interface_contact_moment",
+        "interface_resultant_contact_force",
+        "joint_force_reaction",
+        "joint_moment_reaction",
+        "joint_relative_acceleration",
+        "joint_relative_angular_acceleration",
+        "joint_relative_angular_velocity",
+        "joint_relative_displacement",
+        "joint_relative_rotation",
+        "joint_relative_velocity",
+        "kinetic_energy",
+        "layer_orientation_provider",
+        "mach_number",
+        "magnetic_field",
+        "magnetic_field_X",
+        "magnetic_field_Y",
+        "magnetic_field_Z",
+        "magnetic_flux_density",
+        "magnetic_flux_density_X",
+        "magnetic_flux_density_Y",
+        "magnetic_flux_density_Z",
+        "magnetic_scalar_potential",
+        "magnetic_vector_potential",
+        "mapdl_material_properties",
+        "mapdl_section",
+        "mapdl_split_to_acmo_facet_indices",
+        "mass_flow_rate",
+        "mass_fraction",
+        "material_property_of_element",
+        "mean_static_pressure",
+        "mean_temperature",
+        "mean_velocity",
+        "members_in_bending_not_certified",
+        "members_in_compression_not_certified",
+        "members_in_linear_compression_bending_not_certified",
+        "migrate_to_h5dpf",
+        "modal_acceleration",
+        "modal_basis",
+        "modal_coordinate",
+        "modal_velocity",
+        "net_radiation_heat_flux",
+        "nmisc",
+        "nodal_force",
+        "nodal_rotation",
+        "nodal_rotation_X",
+        "nodal_rotation_Y",
+        "nodal_rotation_Z",
+        "nodal_rotational_acceleration",
+        "nodal_rotational_acceleration_X",
+        "nodal_rotational_acceleration_Y",
+        "nodal_rotational_acceleration_Z",
+        "nodal_rotational_velocity",
+        "nodal_rotational_velocity_X",
+        "nodal_rotational_velocity_Y",
+        "nodal_rotational_velocity_Z",
+        "nodal_to_global",
+        "node_orientations",
+        "node_orientations_X",
+        "node_orientations_Y",
+        "node_orientations_Z",
+        "normal_contact_force",
+        "normal_contact_moment",
+        "num_surface_status_changes",
+        "nusselt_number",
+        "omega",
+        "output_sound_power",
+        "part_added_mass",
+        "part_eroded_internal_energy",
+        "part_eroded_kinetic_energy",
+        "part_hourglass_energy",
+        "part_internal_energy",
+        "part_kinetic_energy",
+        "part_momentum",
+        "part_rigid_body_velocity",
+        "plastic_state_variable",
+        "plastic_strain",
+        "plastic_strain_X",
+        "plastic_strain_XY",
+        "plastic_strain_XZ",
+        "plastic_strain_Y",
+        "plastic_strain_YZ",
+        "plastic_strain_Z",
+        "plastic_strain_energy_density",
+        "plastic_strain_eqv",
+        "plastic_strain_intensity",
+        "plastic_strain_max_shear",
+        "plastic_strain_principal_1",
+        "plastic_strain_principal_2",
+        "plastic_strain_principal_3",
+        "plastic_strain_rotation_by_euler_nodes",
+        "poynting_vector",
+        "poynting_vector_surface",
+        "prandtl_number",
+        "pres_to_field",
+        "pressure",
+        "pretension",
+        "prns_to_field",
+        "radiation_area",
+        "radiation_heat_flow_rate",
+        "raw_acceleration",
+        "raw_displacement",
+        "raw_reaction_force",
+        "raw_velocity",
+        "reaction_force",
+        "reaction_force_X",
+        "reaction_force_Y",
+        "reaction_force_Z",
+        "reaction_heat",
+        "reaction_moment",
+        "reaction_moment_X",
+        "reaction_moment_Y",
+        "reaction_moment_Z",
+        "read_cms_rbd_file",
+        "recombine_harmonic_indeces_cyclic",
+        "record_reader",
+        "reflected_radiation_heat_flux",
+        "remove_rigid_body_motion",
+        "remove_rigid_body_motion_fc",
+        "result_provider",
+        "reynolds_number",
+        "rigid_transformation",
+        "rigid_transformation_provider",
+        "rms_static_pressure",
+        "rms_temperature",
+        "rms_velocity",
+        "rom_data_provider",
+        "run",
+        "smisc",
+        "specific_heat",
+        "spectrum_data",
+        "squared_l2norm_pressure",
+        "state_variable",
+        "static_pressure",
+        "stiffness_matrix_energy",
+        "strain_eqv_as_mechanical",
+        "strain_eqv_as_mechanical_workflow",
+        "stress",
+        "stress_X",
+        "stress_XY",
+        "stress_XZ",
+        "stress_Y",
+        "stress_YZ",
+        "stress_Z",
+        "stress_eqv_as_mechanical",
+        "stress_eqv_as_mechanical_workflow",
+        "stress_intensity",
+        "stress_max_shear",
+        "stress_principal_1",
+        "stress_principal_2",
+        "stress_principal_3",
+        "stress_ratio",
+        "stress_rotation_by_euler_nodes",
+        "stress_von_mises",
+        "structural_temperature",
+        "superficial_velocity",
+        "surface_heat_rate",
+        "swelling_strains",
+        "tangential_contact_force",
+        "tangential_contact_moment",
+        "temperature",
+        "temperature_grad",
+        "temperature_grad_X",
+        "temperature_grad_Y",
+        "temperature_grad_Z",
+        "thermal_conductivity",
+        "thermal_dissipation_energy",
+        "thermal_strain",
+        "thermal_strain_X",
+        "thermal_strain_XY",
+        "thermal_strain_XZ",
+        "thermal_strain_Y",
+        "thermal_strain_YZ",
+        "thermal_strain_Z",
+        "thermal_strain_principal_1",
+        "thermal_strain_principal_2",
+        "thermal_strain_principal_3",
+        "thermal_strains_eqv",
+        "thickness",
+        "torque",
+        "total_contact_force",
+        "total_contact_moment",
+        "total_mass",
+        "total_pressure",
+        "total_strain",
+        "total_strain_X",
+        "total_strain_XY",
+        "total_strain_XZ",
+        "total_strain_Y",
+        "total_strain_YZ",
+        "total_strain_Z",
+        "total_strain_eqv",
+        "total_strain_intensity",
+        "total_strain_max_shear",
+        "total_strain_principal_1",
+        "total_strain_principal_2",
+        "total_strain_principal_3",
+        "total_temperature",
+        "transform_invariant_terms_rbd",
+        "transient_rayleigh_integration",
+        "turbulent_kinetic_energy",
+        "turbulent_viscosity",
+        "velocity",
+        "velocity_X",
+        "velocity_Y",
+        "velocity_Z",
+        "view_factor_sum",
+        "volume_fraction",
+        "wall_shear_stress",
+        "workflow_energy_per_component",
+        "workflow_energy_per_harmonic",
+        "write_cms_rbd_file",
+        "write_motion_dfmf_file",
+        "y_plus",
+    ],
+    classes=True,
+)
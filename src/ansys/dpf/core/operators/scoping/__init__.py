@@ -1,21 +1,54 @@
-from .adapt_with_scopings_container import adapt_with_scopings_container
-from .adapt_with_scopings_container_pfc import adapt_with_scopings_container_pfc
-from .change_fc import change_fc
-from .compute_element_centroids import compute_element_centroids
-from .connectivity_ids import connectivity_ids
-from .elemental_from_mesh import elemental_from_mesh
-from .extend_midside_nodal_scoping import extend_midside_nodal_scoping
-from .from_mesh import from_mesh
-from .intersect import intersect
-from .nodal_from_mesh import nodal_from_mesh
-from .on_mesh_property import on_mesh_property
-from .on_named_selection import on_named_selection
-from .on_property import on_property
-from .reduce_sampling import reduce_sampling
-from .rescope import rescope
-from .rescope_custom_type_field import rescope_custom_type_field
-from .rescope_fc import rescope_fc
-from .rescope_property_field import rescope_property_field
-from .scoping_get_attribute import scoping_get_attribute
-from .split_on_property_type import split_on_property_type
-from .transpose import transpose
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .adapt_with_scopings_container import adapt_with_scopings_container
+    from .adapt_with_scopings_container_pfc import adapt_with_scopings_container_pfc
+    from .change_fc import change_fc
+    from .compute_element_centroids import compute_element_centroids
+    from .connectivity_ids import connectivity_ids
+    from .elemental_from_mesh import elemental_from_mesh
+    from .extend_midside_nodal_scoping import extend_midside_nodal_scoping
+    from .from_mesh import from_mesh
+    from .intersect import intersect
+    from .nodal_from_mesh import nodal_from_mesh
+    from .on_mesh_property import on_mesh_property
+    from .on_named_selection import on_named_selection
+    from .on_property import on_property
+    from .reduce_sampling import reduce_sampling
+    from .rescope import rescope
+    from .rescope_custom_type_field import rescope_custom_type_field
+    from .rescope_fc import rescope_fc
+    from .rescope_property_field import rescope_property_field
+    from .scoping_get_attribute import scoping_get_attribute
+    from .split_on_property_type import split_on_property_type
+    from .transpose import transpose
+
+lazy_package(
+    __name__,
+    [
+        "adapt_with_scopings_container",
+        "adapt_with_scopings_container_pfc",
+        "change_fc",
+        "compute_element_centroids",
+        "connectivity_ids",
+        "elemental_from_mesh",
+        "extend_midside_nodal_scoping",
+        "from_mesh",
+        "intersect",
+        "nodal_from_mesh",
+        "on_mesh_property",
+        "on_named_selection",
+        "on_property",
+        "reduce_sampling",
+        "rescope",
+        "rescope_custom_type_field",
+        "rescope_fc",
+        "rescope_property_field",
+        "scoping_get_attribute",
+        "split_on_property_type",
+        "transpose",
+    ],
+    classes=True,
+)
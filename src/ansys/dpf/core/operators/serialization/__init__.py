@@ -1,22 +1,56 @@
-from .csv_to_field import csv_to_field
-from .data_tree_to_json import data_tree_to_json
-from .data_tree_to_txt import data_tree_to_txt
-from .deserializer import deserializer
-from .export_symbolic_workflow import export_symbolic_workflow
-from .field_to_csv import field_to_csv
-from .hdf5dpf_custom_read import hdf5dpf_custom_read
-from .hdf5dpf_generate_result_file import hdf5dpf_generate_result_file
-from .import_symbolic_workflow import import_symbolic_workflow
-from .json_to_data_tree import json_to_data_tree
-from .migrate_file_to_vtk import migrate_file_to_vtk
-from .migrate_to_vtu import migrate_to_vtu
-from .serialize_to_hdf5 import serialize_to_hdf5
-from .serializer import serializer
-from .serializer_to_string import serializer_to_string
-from .string_deserializer import string_deserializer
-from .txt_to_data_tree import txt_to_data_tree
-from .vtk_export import vtk_export
-from .vtk_to_fields import vtk_to_fields
-from .vtu_export import vtu_export
-from .workflow_to_pydpf import workflow_to_pydpf
-from .workflow_to_workflow_topology import workflow_to_workflow_topology
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .csv_to_field import csv_to_field
+    from .data_tree_to_json import data_tree_to_json
+    from .data_tree_to_txt import data_tree_to_txt
+    from .deserializer import deserializer
+    from .export_symbolic_workflow import export_symbolic_workflow
+    from .field_to_csv import field_to_csv
+    from .hdf5dpf_custom_read import hdf5dpf_custom_read
+    from .hdf5dpf_generate_result_file import hdf5dpf_generate_result_file
+    from .import_symbolic_workflow import import_symbolic_workflow
+    from .json_to_data_tree import json_to_data_tree
+    from .migrate_file_to_vtk import migrate_file_to_vtk
+    from .migrate_to_vtu import migrate_to_vtu
+    from .serialize_to_hdf5 import serialize_to_hdf5
+    from .serializer import serializer
+    from .serializer_to_string import serializer_to_string
+    from .string_deserializer import string_deserializer
+    from .txt_to_data_tree import txt_to_data_tree
+    from .vtk_export import vtk_export
+    from .vtk_to_fields import vtk_to_fields
+    from .vtu_export import vtu_export
+    from .workflow_to_pydpf import workflow_to_pydpf
+    from .workflow_to_workflow_topology import workflow_to_workflow_topology
+
+lazy_package(
+    __name__,
+    [
+        "csv_to_field",
+        "data_tree_to_json",
+        "data_tree_to_txt",
+        "deserializer",
+        "export_symbolic_workflow",
+        "field_to_csv",
+        "hdf5dpf_custom_read",
+        "hdf5dpf_generate_result_file",
+        "import_symbolic_workflow",
+        "json_to_data_tree",
+        "migrate_file_to_vtk",
+        "migrate_to_vtu",
+        "serialize_to_hdf5",
+        "serializer",
+        "serializer_to_string",
+        "string_deserializer",
+        "txt_to_data_tree",
+        "vtk_export",
+        "vtk_to_fields",
+        "vtu_export",
+        "workflow_to_pydpf",
+        "workflow_to_workflow_topology",
+    ],
+    classes=True,
+)
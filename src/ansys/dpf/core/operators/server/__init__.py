@@ -1,2 +1,16 @@
-from .grpc_shutdown_server import grpc_shutdown_server
-from .grpc_start_server import grpc_start_server
+from typing import TYPE_CHECKING
+
+from ansys.dpf.core.operators._lazy import lazy_package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .grpc_shutdown_server import grpc_shutdown_server
+    from .grpc_start_server import grpc_start_server
+
+lazy_package(
+    __name__,
+    [
+        "grpc_shutdown_server",
+        "grpc_start_server",
+    ],
+    classes=True,
+)
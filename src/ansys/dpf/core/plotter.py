@@ -129,6 +129,8 @@ class _PyVistaPlotter:
         kwargs_in = _sort_supported_kwargs(bound_method=pv.Plotter.__init__, **kwargs)
         # Initiate pyvista Plotter
         self._plotter = pv.Plotter(**kwargs_in)
+        # Actor of the last field added, updated in place by animations
+        self._field_actor = None
 
     def add_scale_factor_legend(self, scale_factor, **kwargs):
         kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_text, **kwargs)
@@ -316,59 +318,22 @@ class _PyVistaPlotter:
         kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_mesh, **kwargs)
         self._plotter.add_mesh(mesh=scoping_mesh, **kwargs_in)
 
-    def add_field(  # noqa: PLR0912, PLR0913, PLR0915, C901
-        self,
-        field,
-        meshed_region=None,
-        show_max=False,
-        show_min=False,
-        label_text_size=30,
-        label_point_size=20,
-        deform_by=None,
-        scale_factor=1.0,
-        scale_factor_legend=None,
-        as_linear=True,
-        shell_layer=eshell_layers.top,
-        **kwargs,
+    def _field_data_on_mesh(  # noqa: PLR0912, C901
+        self, field, meshed_region, shell_layer=eshell_layers.top
     ):
-        # Get the field name
-        name = field.name.split("_")[0]
-        unit = field.unit
-        kwargs.setdefault("stitle", f"{name} ({unit})")
-
-        kwargs = self._set_scalar_bar_title(kwargs)
-
-        kwargs.setdefault("show_edges", True)
-        kwargs.setdefault("nan_color", "grey")
-
-        # show axes
-        show_axes = kwargs.pop("show_axes", None)
-        if show_axes:
-            self._plotter.add_axes()
-
-        # get the meshed region location
-        if meshed_region is None:
-            meshed_region = field.meshed_region
+        """Return the field as plotted and its data on each entity of the meshed region.
 
+        Entities of the meshed region not in the scoping of the field are set to NaN.
+        """
         location = field.location
         if location == locations.nodal:
             mesh_location = meshed_region.nodes
-        elif location == locations.elemental:
+        elif location in [locations.elemental, locations.overall]:
             mesh_location = meshed_region.elements
-            if show_max or show_min:
-                warnings.warn("`show_max` and `show_min` is only supported for Nodal results.")
-                show_max = False
-                show_min = False
         elif location == locations.faces:
             mesh_location = meshed_region.faces
             if len(mesh_location) == 0:
                 raise ValueError("No faces found to plot on")
-            if show_max or show_min:
-                warnings.warn("`show_max` and `show_min` is only supported for Nodal results.")
-                show_max = False
-                show_min = False
-        elif location == locations.overall:
-            mesh_location = meshed_region.elements
         elif location == locations.elemental_nodal:
             mesh_location = meshed_region.elements
             # If ElementalNodal, first extend results to mid-nodes
@@ -415,6 +380,49 @@ class _PyVistaPlotter:
             overall_data[ind] = field.data[mask]
         else:
             overall_data[:] = field.data[0]
+        return field, overall_data
+
+    def add_field(  # noqa: PLR0912, PLR0913, PLR0915, C901
+        self,
+        field,
+        meshed_region=None,
+        show_max=False,
+        show_min=False,
+        label_text_size=30,
+        label_point_size=20,
+        deform_by=None,
+        scale_factor=1.0,
+        scale_factor_legend=None,
+        as_linear=True,
+        shell_layer=eshell_layers.top,
+        **kwargs,
+    ):
+        # Get the field name
+        name = field.name.split("_")[0]
+        unit = field.unit
+        kwargs.setdefault("stitle", f"{name} ({unit})")
+
+        kwargs = self._set_scalar_bar_title(kwargs)
+
+        kwargs.setdefault("show_edges", True)
+        kwargs.setdefault("nan_color", "grey")
+
+        # show axes
+        show_axes = kwargs.pop("show_axes", None)
+        if show_axes:
+            self._plotter.add_axes()
+
+        # get the meshed region location
+        if meshed_region is None:
+            meshed_region = field.meshed_region
+
+        location = field.location
+        if location in [locations.elemental, locations.faces] and (show_max or show_min):
+            warnings.warn("`show_max` and `show_min` is only supported for Nodal results.")
+            show_max = False
+            show_min = False
+        field, overall_data = self._field_data_on_mesh(field, meshed_region, shell_layer)
+
         # Filter kwargs for add_mesh
         kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_mesh, **kwargs)
         # Have to remove any active scalar field from the pre-existing grid object,
@@ -434,7 +442,7 @@ class _PyVistaPlotter:
         if location == locations.elemental_nodal:
             grid = grid.shrink(1.0)
         grid.set_active_scalars(None)
-        self._plotter.add_mesh(grid, scalars=overall_data, **kwargs_in)
+        self._field_actor = self._plotter.add_mesh(grid, scalars=overall_data, **kwargs_in)
 
         # If deformed geometry, print the scale_factor
         if deform_by and scale_factor_legend is not False:
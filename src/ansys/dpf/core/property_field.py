@@ -25,6 +25,7 @@
 import numpy as np
 
 from ansys.dpf.core import dimensionality, scoping
+from ansys.dpf.core.cache import _cached_read, _invalidate_read_cache
 from ansys.dpf.core.check_version import meets_version, version_requires
 from ansys.dpf.core.common import _get_size_of_list, locations, natures
 from ansys.dpf.core.field_base import _FieldBase, _LocalFieldBase
@@ -76,6 +77,8 @@ class PropertyField(_FieldBase):
 
     """
 
+    _append_dtype = np.int32
+
     def __init__(
         self,
         nentities=0,
@@ -236,13 +239,22 @@ class PropertyField(_FieldBase):
         return self._api.csproperty_field_get_data_size(self)
 
     def _set_scoping(self, scoping):
+        _invalidate_read_cache(self)
         self._api.csproperty_field_set_cscoping(self, scoping)
 
     def _get_scoping(self):
-        return scoping.Scoping(
-            scoping=self._api.csproperty_field_get_cscoping(self), server=self._server
+        return _cached_read(
+            self,
+            "scoping",
+            self._server_data_size,
+            lambda: scoping.Scoping(
+                scoping=self._api.csproperty_field_get_cscoping(self), server=self._server
+            ),
         )
 
+    def _server_data_size(self):
+        return self._api.csproperty_field_get_data_size(self)
+
     def get_entity_data(self, index):
         """Return the data associated with the entity by index."""
         try:
@@ -283,6 +295,7 @@ class PropertyField(_FieldBase):
 
         This method appends data to the property field for a specific scoping ID.
         """
+        _invalidate_read_cache(self)
         self._api.csproperty_field_push_back(self, scopingid, _get_size_of_list(data), data)
 
     def _get_data_pointer(self):
@@ -294,9 +307,15 @@ class PropertyField(_FieldBase):
             return dpf_array.DPFArray(vec)
 
         except NotImplementedError:
-            return self._api.csproperty_field_get_data_pointer(self, True)
+            return _cached_read(
+                self,
+                "data_pointer",
+                self._server_data_size,
+                lambda: self._api.csproperty_field_get_data_pointer(self, True),
+            )
 
     def _set_data_pointer(self, data):
+        _invalidate_read_cache(self)
         return self._api.csproperty_field_set_data_pointer(self, _get_size_of_list(data), data)
 
     def _get_data(self, np_array=True):
@@ -307,7 +326,15 @@ class PropertyField(_FieldBase):
             )
             data = dpf_array.DPFArray(vec) if np_array else dpf_array.DPFArray(vec).tolist()
         except NotImplementedError:
-            data = self._api.csproperty_field_get_data(self, np_array)
+            if np_array:
+                data = _cached_read(
+                    self,
+                    "data",
+                    self._server_data_size,
+                    lambda: self._api.csproperty_field_get_data(self, np_array),
+                )
+            else:
+                data = self._api.csproperty_field_get_data(self, np_array)
         n_comp = self.component_count
         if np_array and n_comp != 1 and data.size != 0:
             data.shape = (data.size // n_comp, n_comp)
@@ -329,6 +356,7 @@ class PropertyField(_FieldBase):
                 copy = np.empty_like(data, shape=data.shape, dtype=np.int32)
                 copy[:] = data
                 data = copy
+        _invalidate_read_cache(self)
         return self._api.csproperty_field_set_data(self, _get_size_of_list(data), data)
 
     def as_local_field(self):
@@ -22,14 +22,17 @@
 
 """ResultInfo."""
 
+from collections import OrderedDict
 from enum import Enum, unique
+import threading
 import traceback
-from types import SimpleNamespace
-from typing import List, Union
+from types import MappingProxyType, SimpleNamespace
+from typing import List, NamedTuple, Union
 import warnings
 
 from ansys.dpf.core import available_result, collection_base, server as server_module, support
 from ansys.dpf.core.available_result import Homogeneity
+from ansys.dpf.core.cache import _data_sources_signature, _signature_is_checked
 from ansys.dpf.core.check_version import version_requires
 from ansys.dpf.core.common import locations
 from ansys.dpf.core.cyclic_support import CyclicSupport
@@ -47,6 +50,40 @@ from ansys.dpf.gate import (
 )
 
 
+class _AvailableResultData(NamedTuple):
+    """Description of an available result, read from the server."""
+
+    name: str
+    physicsname: str
+    ncomp: int
+    dimensionality: str
+    homogeneity: str
+    unit: str
+    loc_name: str
+    scripting_name: str
+    sub_res: tuple
+    qualifiers: tuple
+    qualifier_labels: tuple
+
+
+class _ResultInfoSnapshot(NamedTuple):
+    """Description of all the available results of a ResultInfo, read from the server at once."""
+
+    analysis_type: str
+    physics_type: str
+    unit_system: str
+    results: tuple
+    indices: MappingProxyType
+    qualifier_labels: tuple
+
+
+MAX_SHARED_SNAPSHOTS = 32
+"""Maximum number of result file descriptions kept to be reused by the next models."""
+
+_shared_snapshots = OrderedDict()
+_shared_snapshots_lock = threading.Lock()
+
+
 @unique
 class physics_types(Enum):
     """``'Physics_types'`` enumerates the different types of physics that an analysis can have."""
@@ -125,6 +162,8 @@ class ResultInfo:
         physics_type: physics_types = None,
     ):
         """Initialize with a ResultInfo message."""
+        self._snapshot_data = None
+        self._snapshot_key = None
         # ############################
         # step 1: get server
         self._server = server_module.get_or_create_server(
@@ -144,6 +183,7 @@ class ResultInfo:
         if result_info is not None:
             if isinstance(result_info, ResultInfo):
                 self._internal_obj = result_info._internal_obj
+                self._snapshot_data = result_info._snapshot_data
             else:
                 self._internal_obj = result_info
         elif result_info is None:
@@ -161,38 +201,88 @@ class ResultInfo:
 
     def __str__(self):
         """Return a string representation of the instance providing detailed information."""
-        try:
-            txt = (
-                "%s analysis\n" % self.analysis_type.capitalize()
-                + "Unit system: %s\n" % self.unit_system
-                + "Physics Type: %s\n" % self.physics_type.capitalize()
-                + "Available results:\n"
+        snapshot = self._snapshot
+        txt = (
+            "%s analysis\n" % snapshot.analysis_type.capitalize()
+            + "Unit system: %s\n" % snapshot.unit_system
+            + "Physics Type: %s\n" % snapshot.physics_type.capitalize()
+            + "Available results:\n"
+        )
+        for res in snapshot.results:
+            line = [
+                "",
+                "-",
+                f"{res.name}: {res.loc_name} {res.physicsname}",
+            ]
+            txt += "{0:^4} {1:^2} {2:<30}".format(*line) + "\n"
+
+        if len(snapshot.qualifier_labels) > 0:
+            txt += "Available qualifier labels:\n"
+            for label, label_values in snapshot.qualifier_labels:
+                txt += f"     - {label}: "
+                txt += f"{', '.join(label_values)}\n"
+
+        return txt
+
+    @property
+    def _snapshot(self):
+        """Description of the available results, read from the server on first access."""
+        if self._snapshot_data is None:
+            self._snapshot_data = self._read_snapshot()
+            if self._snapshot_key is not None:
+                with _shared_snapshots_lock:
+                    _shared_snapshots[self._snapshot_key] = self._snapshot_data
+                    while len(_shared_snapshots) > MAX_SHARED_SNAPSHOTS:
+                        _shared_snapshots.popitem(last=False)
+        return self._snapshot_data
+
+    def _share_snapshot(self, data_sources):
+        """Reuse the description of the results of ResultInfo objects read from the same files.
+
+        Descriptions are shared between objects of servers of the same version whose data
+        sources hold the same keys and files, upstream data sources included, until the size
+        or modification time of one of the files changes. Files which cannot be checked by the
+        client, such as files of remote servers, are not shared.
+        """
+        signature = _data_sources_signature(data_sources)
+        if not signature or not _signature_is_checked(signature):
+            return
+        self._snapshot_key = (str(self._server.version), signature)
+        with _shared_snapshots_lock:
+            if self._snapshot_key in _shared_snapshots:
+                _shared_snapshots.move_to_end(self._snapshot_key)
+                self._snapshot_data = _shared_snapshots[self._snapshot_key]
+
+    def _read_snapshot(self):
+        label_names = {}
+
+        def names_of(label):
+            if label not in label_names:
+                label_support = self.qualifier_label_support(label)
+                names_field = label_support.string_field_support_by_property("names")
+                label_names[label] = dict(
+                    zip(names_field.scoping.ids.tolist(), names_field.data_as_list)
+                )
+            return label_names[label]
+
+        results = tuple(self._read_result(numres, names_of) for numres in range(len(self)))
+        indices = {}
+        for index, result in enumerate(results):
+            indices.setdefault(result.name, index)
+        qualifier_labels = ()
+        if self._server.meet_version("7.0"):
+            qualifier_labels = tuple(
+                (label, tuple(f"{name} ({value})" for value, name in names_of(label).items()))
+                for label in self.available_qualifier_labels
             )
-            for res in self.available_results:
-                line = [
-                    "",
-                    "-",
-                    f"{res.name}: {res.native_location} {res.physical_name}",
-                ]
-                txt += "{0:^4} {1:^2} {2:<30}".format(*line) + "\n"
-
-            if self._server.meet_version("7.0"):
-                qualifiers_labels = self.available_qualifier_labels
-                if len(qualifiers_labels) > 0:
-                    txt += "Available qualifier labels:\n"
-                    for label in qualifiers_labels:
-                        label_support = self.qualifier_label_support(label)
-                        names_field = label_support.string_field_support_by_property("names")
-                        label_names = names_field.data_as_list
-                        label_values = names_field.scoping.ids.tolist()
-                        txt += f"     - {label}: "
-                        for i, value in enumerate(label_values):
-                            label_values[i] = label_names[i] + f" ({value})"
-                        txt += f"{', '.join(label_values)}\n"
-
-            return txt
-        except Exception as e:
-            raise e
+        return _ResultInfoSnapshot(
+            analysis_type=self.analysis_type,
+            physics_type=self.physics_type,
+            unit_system=self.unit_system,
+            results=results,
+            indices=MappingProxyType(indices),
+            qualifier_labels=qualifier_labels,
+        )
 
     @property
     def _description(self):
@@ -202,11 +292,11 @@ class ResultInfo:
 
     @property
     def _names(self):
-        return [item.name for item in self.available_results]
+        return [item.name for item in self._snapshot.results]
 
     def __contains__(self, value):
         """Check if a given name is present in available results."""
-        return value in self._names
+        return value in self._snapshot.indices
 
     def add_result(  # noqa: PLR0913
         self,
@@ -263,6 +353,8 @@ class ResultInfo:
             homogeneity.name,
             description,
         )
+        self._snapshot_data = None
+        self._snapshot_key = None
 
     @property
     def analysis_type(self):
@@ -429,10 +521,7 @@ class ResultInfo:
         -------
         available_result : list[AvailableResult]
         """
-        out = []
-        for i in range(len(self)):
-            out.append(self._get_result(i))
-        return out
+        return [self._get_result(i) for i in range(len(self._snapshot.results))]
 
     @property
     def _data_processing_core_api(self):
@@ -443,7 +532,7 @@ class ResultInfo:
         core_api.init_data_processing_environment(self)
         return core_api
 
-    def _get_result(self, numres):  # noqa: C901
+    def _get_result(self, numres):
         """Return requested result.
 
         Parameters
@@ -455,11 +544,33 @@ class ResultInfo:
         -------
         result : available_result.AvailableResult
         """
-        if numres >= len(self):
-            raise IndexError("There are only %d results" % len(self))
+        results = self._snapshot.results
+        if numres >= len(results):
+            raise IndexError("There are only %d results" % len(results))
         elif numres < 0:
             raise IndexError("Result index must be greater than 0")
 
+        data = results[numres]
+        availableresult = SimpleNamespace(
+            name=data.name,
+            physicsname=data.physicsname,
+            ncomp=data.ncomp,
+            dimensionality=data.dimensionality,
+            homogeneity=data.homogeneity,
+            unit=data.unit,
+            sub_res={name: list(sub_res) for name, sub_res in data.sub_res},
+            properties={"loc_name": data.loc_name, "scripting_name": data.scripting_name},
+            qualifiers=[dict(qualifier) for qualifier in data.qualifiers],
+            qualifier_labels={key: list(values) for key, values in data.qualifier_labels},
+            server=self._server,
+        )
+        return available_result.AvailableResult(availableresult)
+
+    def _read_result(self, numres, names_of):
+        """Read the description of a result from the server.
+
+        ``names_of`` returns the names of the values of a qualifier label, indexed by value.
+        """
         name = self._api.result_info_get_result_name(self, numres)
         physic_name = self._api.result_info_get_result_physics_name(self, numres)
         dimensionality = self._api.result_info_get_result_dimensionality_nature(self, numres)
@@ -477,7 +588,7 @@ class ResultInfo:
         except AttributeError:
             scripting_name = available_result._remove_spaces(physic_name)
         num_sub_res = self._api.result_info_get_number_of_sub_results(self, numres)
-        sub_res = {}
+        sub_res = []
         for ires in range(num_sub_res):
             sub_res_name = self._api.result_info_get_sub_result_name(self, numres, ires)
             ssub_res_rec_name = integral_types.MutableString(256)
@@ -486,7 +597,7 @@ class ResultInfo:
             )
             ssub_res_rec_name = str(ssub_res_rec_name)
             descr = self._api.result_info_get_sub_result_description(self, numres, ires)
-            sub_res[sub_res_name] = [ssub_res_rec_name, descr]
+            sub_res.append((sub_res_name, (ssub_res_rec_name, descr)))
 
         qualifiers = []
         qualifier_labels = {}
@@ -506,34 +617,30 @@ class ResultInfo:
                     obj=self,
                     server=self._server,
                 )
-                qualifiers.append(label_space)
                 label_space_dict = label_space.__dict__()
-                for key in label_space_dict.keys():
-                    value = label_space_dict[key]
-                    label_support = self.qualifier_label_support(key)
-                    names_field = label_support.string_field_support_by_property("names")
-                    label_value = names_field.data_as_list[
-                        names_field.scoping.ids.tolist().index(value)
-                    ]
-                    label_value = label_value + f" ({value})"
+                qualifiers.append(tuple(label_space_dict.items()))
+                for key, value in label_space_dict.items():
+                    label_value = names_of(key)[value] + f" ({value})"
                     if key not in qualifier_labels.keys():
                         qualifier_labels[key] = [label_value]
                     if label_value not in qualifier_labels[key]:
                         qualifier_labels[key].append(label_value)
 
-        availableresult = SimpleNamespace(
+        return _AvailableResultData(
             name=name,
             physicsname=physic_name,
             ncomp=n_comp,
             dimensionality=dimensionality,
             homogeneity=homogeneity,
             unit=unit_symbol,
-            sub_res=sub_res,
-            properties={"loc_name": loc_name, "scripting_name": scripting_name},
-            qualifiers=qualifiers,
-            qualifier_labels=qualifier_labels,
+            loc_name=loc_name,
+            scripting_name=scripting_name,
+            sub_res=tuple(sub_res),
+            qualifiers=tuple(qualifiers),
+            qualifier_labels=tuple(
+                (key, tuple(values)) for key, values in qualifier_labels.items()
+            ),
         )
-        return available_result.AvailableResult(availableresult)
 
     @property
     @version_requires("5.0")
@@ -611,9 +718,9 @@ class ResultInfo:
         if isinstance(key, int):
             index = key
         elif isinstance(key, str):
-            if key not in self._names:
+            if key not in self._snapshot.indices:
                 raise ValueError('Invalid key "%s"' % key)
-            index = self._names.index(key)
+            index = self._snapshot.indices[key]
         else:
             raise TypeError('"%s" is an invalid keytype' % type(key))
 
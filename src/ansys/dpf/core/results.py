@@ -27,16 +27,85 @@ This module contains the Results and Result classes that are created by the mode
 to easily access results in result files.
 """
 
+from concurrent.futures import Future
 import functools
+import threading
 
-from ansys.dpf.core import Operator, errors
+import numpy as np
+
+from ansys.dpf.core import Operator, _concurrency, errors
+from ansys.dpf.core.cache import _hashable
 from ansys.dpf.core.custom_fields_container import (
     BodyFieldsContainer,
     ElShapeFieldsContainer,
 )
+from ansys.dpf.core.field import _is_single_precision
+from ansys.dpf.core.operator_specification import Specification
 from ansys.dpf.core.scoping import Scoping
 
 
+def _result_docstring(operator_name, server) -> str:
+    """Return the documentation of a result operator, built from its cached specification."""
+    try:
+        specification = Specification(operator_name=operator_name, server=server)
+        lines = [f"DPF {operator_name} Operator:", f"  {specification.description}"]
+        for title, pins in [("Inputs", specification.inputs), ("Outputs", specification.outputs)]:
+            lines.append(f"  {title}:")
+            for pin in pins.values():
+                optional = " (optional)" if pin.optional else ""
+                lines.append(f"     {pin.name} {pin.type_names}{optional}: {pin.document}")
+        return "\n".join(lines)
+    except errors.DPFServerException:
+        return ""
+
+
+def _scoping_key(scoping):
+    """Return a hashable identifier of a time or mesh scoping, ``None`` if it has none."""
+    if scoping is None:
+        return ("all",)
+    try:
+        if isinstance(scoping, Scoping):
+            return ("scoping", scoping.location, _hashable(np.asarray(scoping.ids)))
+        if isinstance(scoping, (int, float, str, list, tuple, np.ndarray)):
+            return _hashable(scoping)
+    except TypeError:
+        pass
+    return None
+
+
+class _DocOnDemand:
+    """Docstring of a class whose instances read their own documentation on first access."""
+
+    def __init__(self, class_doc):
+        self._class_doc = class_doc
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self._class_doc
+        if instance.__dict__.get("_doc") is None:
+            instance.__dict__["_doc"] = instance._read_doc()
+        return instance.__dict__["_doc"]
+
+    def __set__(self, instance, value):
+        instance.__dict__["_doc"] = value
+
+
+class _ResultProperty(property):
+    """Property creating a Result on access, documented by its operator on first request."""
+
+    __doc__ = _DocOnDemand(__doc__)
+
+    def __init__(self, fget, operator_name, server):
+        super().__init__(fget)
+        self._operator_name = operator_name
+        self._server = server
+        # property sets the documentation of fget, read the operator's one instead
+        self._doc = None
+
+    def _read_doc(self):
+        return _result_docstring(self._operator_name, self._server)
+
+
 class Results:
     """Organizes the results from DPF into accessible methods.
 
@@ -116,10 +185,13 @@ class Results:
         self._connector = connector
         self._mesh_by_default = mesh_by_default
         self._server = server
+        self._result_info = result_info
+        self._op_map_rev = {}
+        # whether the operator of each result exists, checked on the first access of the result
+        self._available = {}
         if generate_ops:
             self.__class__ = type(Results.__name__ + str(id(self)), (Results,), {})
             self._connect_operators(result_info)
-        self._str = str(result_info)
 
     def __result__(self, result_type, *args):
         """
@@ -139,11 +211,30 @@ class Results:
         """
         return Result(self._connector, self._mesh_by_default, result_type, self._server)
 
+    def _available_result(self, result_type, *args):
+        """Create the result of the specified type if its operator exists on the server."""
+        result = self.__result__(result_type)
+        self._available[result_type.name] = hasattr(result, "_operator")
+        if not self._available[result_type.name]:
+            raise AttributeError(
+                f"'{Results.__name__}' object has no attribute '{result_type.name}'"
+            )
+        return result
+
+    def _is_available(self, name):
+        if name not in self._available:
+            try:
+                getattr(self, name)
+            except AttributeError:
+                self._available[name] = False
+        return self._available[name]
+
     def _connect_operators(self, result_info):
         """Dynamically add operators for results.
 
         The new operator's subresults are connected to the model's
-        streams.
+        streams. Operators are only created when their result is accessed,
+        and their documentation is read from their specification on demand.
 
         Examples
         --------
@@ -161,20 +252,14 @@ class Results:
         if result_info is None:
             return
         # dynamically add function based on input type
-        self._op_map_rev = {}
         for result_type in result_info:
-            try:
-                doc = Operator(result_type.operator_name, server=self._server).__str__()
-                bound_method = self.__result__
-                method2 = functools.partial(bound_method, result_type)
-                setattr(self.__class__, result_type.name, property(method2, doc=doc))
-
-                self._op_map_rev[result_type.name] = result_type.name
-            except errors.DPFServerException:
-                pass
-            except Exception as e:
-                print(result_type.name)
-                raise e
+            method = functools.partial(self._available_result, result_type)
+            setattr(
+                self.__class__,
+                result_type.name,
+                _ResultProperty(method, result_type.operator_name, self._server),
+            )
+            self._op_map_rev[result_type.name] = result_type.name
 
     def __str__(self):
         """
@@ -185,7 +270,7 @@ class Results:
         str
             String description of the `Results` object.
         """
-        return self._str
+        return str(self._result_info)
 
     def __iter__(self):
         """
@@ -197,7 +282,11 @@ class Results:
             Each result dynamically added to the `Results` object.
         """
         for key in self._op_map_rev:
-            yield self.__class__.__dict__[key].fget()
+            try:
+                result = getattr(self, key)
+            except AttributeError:
+                continue
+            yield result
 
     def __getitem__(self, val):
         """
@@ -213,11 +302,9 @@ class Results:
         Result
             The result at the specified index.
         """
-        n = 0
-        for key in self._op_map_rev:
+        for n, result in enumerate(self):
             if n == val:
-                return self.__class__.__dict__[key].fget()
-            n += 1
+                return result
 
     def __len__(self):
         """
@@ -228,7 +315,7 @@ class Results:
         int
             The number of results.
         """
-        return len(self._op_map_rev)
+        return sum(self._is_available(key) for key in self._op_map_rev)
 
 
 class Result:
@@ -265,6 +352,8 @@ class Result:
 
     """
 
+    __doc__ = _DocOnDemand(__doc__)
+
     def __init__(self, connector, mesh_by_default, result_info, server):
         self._server = server
         self._connector = connector
@@ -274,13 +363,14 @@ class Result:
         self._mesh_by_default = mesh_by_default
         self._result_info = result_info
         self._specific_fc_type = None
+        self._split_mesh_scoping = None
+        # the operator is shared by the evaluations of the result: one at a time uses it
+        self._eval_lock = threading.Lock()
+        # pins connected by the model, the other pins are set by the evaluations or the user
+        self._connector_pins = set()
         from ansys.dpf.core import operators
 
         try:
-            # create the operator to read its documentation
-            # if the operator doesn't exist, the method will not be added
-            doc = Operator(self._result_info.operator_name, server=self._server).__str__()
-            self.__doc__ = doc
             if hasattr(operators, "result") and hasattr(operators.result, self._result_info.name):
                 self._operator = getattr(operators.result, self._result_info.name)(
                     server=self._server
@@ -288,6 +378,7 @@ class Result:
             else:
                 self._operator = Operator(self._result_info.operator_name, server=self._server)
             self._connector.__connect_op__(self._operator, self._mesh_by_default)
+            self._connector_pins = set(self._operator._connected_pins)
             self._operator._add_sub_res_operators(self._result_info.sub_results)
         except errors.DPFServerException:
             pass
@@ -295,27 +386,36 @@ class Result:
             print(self._result_info.name)
             raise e
 
+    def _read_doc(self):
+        return _result_docstring(self._result_info.operator_name, self._server)
+
     def __call__(self, time_scoping=None, mesh_scoping=None):
         """Provide for Result instances to be callable for operator retrieval."""
+        return self._connect_inputs(
+            time_scoping or self._time_scoping, mesh_scoping or self._mesh_scoping, self._location
+        )
+
+    def _connect_inputs(self, time_scoping, mesh_scoping, location):
         op = self._operator
         if time_scoping:
             op.inputs.time_scoping(time_scoping)
-        elif self._time_scoping:
-            op.inputs.time_scoping(self._time_scoping)
-
         if mesh_scoping:
             op.inputs.mesh_scoping(mesh_scoping)
-        elif self._mesh_scoping:
-            op.inputs.mesh_scoping(self._mesh_scoping)
-
-        if self._location:
-            op.inputs.requested_location(self._location)
-
+        if location:
+            op.inputs.requested_location(location)
         return op
 
-    def eval(self):
+    def eval(self, dtype=None):
         """Evaluate the result provider with the previously specified inputs and return the result fields container.
 
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+            Type the data of the returned fields is retrieved with, ``numpy.float64`` or
+            ``numpy.float32``. With a gRPC server, ``numpy.float32`` data is streamed as
+            4-byte floats, see :meth:`Field.get_data <ansys.dpf.core.field.Field.get_data>`.
+            The default is ``None``, in which case the data is retrieved in double precision.
+
         Returns
         -------
         fields_container : FieldsContainer, ElShapeFieldsContainer, BodyFieldsContainer
@@ -331,7 +431,97 @@ class Result:
         >>> fc = disp.on_all_time_freqs.eval()
 
         """
-        outputs = self.__call__().outputs
+        inputs = (self._time_scoping, self._mesh_scoping, self._location)
+        return self._eval_inputs(inputs, dtype, self._cache_key(dtype))
+
+    def eval_async(self, dtype=None) -> Future:
+        """Evaluate the result provider in the background with the previously specified inputs.
+
+        The inputs of the ``Result`` are read before returning, so it can be modified and
+        evaluated again while the request runs. The evaluations of one ``Result`` share its
+        operator and run one after the other, each with its own inputs. Background requests
+        of different results run concurrently up to the limit of the server, set with
+        :func:`ansys.dpf.core.settings.set_max_concurrent_requests`.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype, optional
+            Type the data of the returned fields is retrieved with, see :meth:`eval`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the fields container returned by :meth:`eval`. Its ``cancel`` method
+            prevents the evaluation if it is still queued. Use ``asyncio.wrap_future``
+            to await it in a coroutine.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_msup_transient())
+        >>> disp_future = model.results.displacement.on_all_time_freqs.eval_async()
+        >>> stress_future = model.results.stress.on_all_time_freqs.eval_async()
+        >>> disp, stress = disp_future.result(), stress_future.result()
+
+        """
+        inputs = (self._time_scoping, self._mesh_scoping, self._location)
+        return _concurrency.submit(
+            self._operator._server, self._eval_inputs, inputs, dtype, self._cache_key(dtype)
+        )
+
+    def _eval_inputs(self, inputs, dtype=None, cache_key=None):
+        # the inputs are connected and the operator evaluated without another request between
+        with self._eval_lock:
+            return self._eval(self._connect_inputs(*inputs), dtype, cache_key)
+
+    def _cache_key(self, dtype=None):
+        """Identify the evaluation in the result cache of the model, if it is enabled."""
+        if self._connector.result_cache is None or self._has_extra_inputs():
+            return None
+        mesh_scoping = self._mesh_scoping
+        if self._specific_fc_type and isinstance(mesh_scoping, Operator):
+            # the split scoping operator is identified by the scoping it splits
+            mesh_scoping = self._split_mesh_scoping
+        time_key = _scoping_key(self._time_scoping)
+        mesh_key = _scoping_key(mesh_scoping)
+        if time_key is None or mesh_key is None:
+            return None
+        return (
+            self._result_info.name,
+            time_key,
+            mesh_key,
+            self._location,
+            self._specific_fc_type,
+            None if dtype is None else np.dtype(dtype).str,
+        )
+
+    def _has_extra_inputs(self):
+        """Whether the operator has inputs that the model and the evaluation do not connect."""
+        op = self._operator
+        pins = set(self._connector_pins)
+        for name, value in (
+            ("time_scoping", self._time_scoping),
+            ("mesh_scoping", self._mesh_scoping),
+            ("requested_location", self._location),
+        ):
+            if value:
+                pins.add(getattr(op.inputs, name)._pin)
+        return not op._connected_pins <= pins
+
+    def _eval(self, op, dtype=None, cache_key=None):
+        if cache_key is None:
+            return self._eval_operator(op, dtype)
+        return self._connector.result_cache.get(
+            cache_key,
+            functools.partial(self._eval_operator, op, dtype),
+            self._connector.data_sources,
+        )
+
+    def _eval_operator(self, op, dtype=None):
+        if dtype is not None:
+            _is_single_precision(dtype)
+        outputs = op.outputs
         if hasattr(outputs, "fields_container"):
             fc = outputs.fields_container()
         else:
@@ -341,6 +531,8 @@ class Result:
             fc = ElShapeFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
         elif self._specific_fc_type == "body":
             fc = BodyFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
+        if dtype is not None:
+            fc._stream_dtype = dtype
         return fc
 
     @property
@@ -528,6 +720,7 @@ class Result:
 
     def _add_split_on_property_type(self, prop):
         previous_mesh_scoping = self._mesh_scoping
+        self._split_mesh_scoping = previous_mesh_scoping
         from ansys.dpf.core import operators
 
         if hasattr(operators, "scoping") and hasattr(operators.scoping, "split_on_property_type"):
@@ -633,7 +826,6 @@ class CommonResults(Results):
     """
 
     def __init__(self, connector, result_info, mesh_by_default, server):
-        self._result_info = result_info
         super().__init__(connector, result_info, mesh_by_default, server, False)
         self._op_map_rev = dict(
             displacement="displacement",
@@ -643,6 +835,7 @@ class CommonResults(Results):
             temperature="temperature",
             electric_potential="electric_potential",
         )
+        self._available = dict.fromkeys(self._op_map_rev, True)
 
     @property
     def displacement(self):
@@ -32,7 +32,7 @@ import warnings
 import numpy as np
 
 from ansys.dpf.core import server as server_module, server_types
-from ansys.dpf.core.cache import _setter
+from ansys.dpf.core.cache import _cached_read, _invalidate_read_cache, _setter
 from ansys.dpf.core.check_version import version_requires
 from ansys.dpf.core.common import locations
 from ansys.dpf.gate import (
@@ -202,6 +202,7 @@ class Scoping:
                     f"Accepted dtypes for NumPy arrays when setting scoping IDs are "
                     f"'np.int32' and np.int64' (provided is '{ids.dtype}')."
                 )
+        _invalidate_read_cache(self)
         if isinstance(self._server, server_types.InProcessServer):
             self._api.scoping_resize(self, len(ids))
             ids_ptr = self._api.scoping_get_ids(self, len(ids))
@@ -239,6 +240,10 @@ class Scoping:
             return DPFArray(vec) if np_array else vec.np_array.tolist()
 
         except NotImplementedError:
+            if np_array:
+                return _cached_read(
+                    self, "ids", self._count, lambda: self._api.scoping_get_ids(self, np_array)
+                )
             return self._api.scoping_get_ids(self, np_array)
 
     def get_ids(self, np_array: bool = False) -> Union[list[int], DPFArray]:
@@ -267,6 +272,7 @@ class Scoping:
         scopingid:
             ID of the entity.
         """
+        _invalidate_read_cache(self)
         self._api.scoping_set_entity(self, scopingid, index)
 
     def _get_id(self, index):
@@ -550,6 +556,7 @@ class _LocalScoping(Scoping):
 
     def __cache_data__(self, owner_scoping):
         self._scoping_ids_copy = owner_scoping._get_ids(False)
+        self._owner_scoping = owner_scoping
         self._location = owner_scoping.location
         self.__init_map__()
 
@@ -686,6 +693,7 @@ class _LocalScoping(Scoping):
         if hasattr(self, "_is_set") and self._is_set:
             super()._set_ids(self._scoping_ids_copy)
             super()._set_location(self._location)
+            _invalidate_read_cache(self._owner_scoping)
 
     def __enter__(self):
         return self
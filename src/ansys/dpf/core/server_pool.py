@@ -0,0 +1,369 @@
+# Copyright (C) 2020 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pool of local DPF servers sharing the extraction of results."""
+
+from __future__ import annotations
+
+from concurrent.futures import wait
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ansys.dpf.core import _concurrency, fields_factory
+from ansys.dpf.core.common import locations
+from ansys.dpf.core.core import _deep_copy
+from ansys.dpf.core.custom_fields_container import BodyFieldsContainer, ElShapeFieldsContainer
+from ansys.dpf.core.fields_container import FieldsContainer
+from ansys.dpf.core.scoping import Scoping
+from ansys.dpf.core.server import start_local_server
+from ansys.dpf.core.server_factory import CommunicationProtocols
+from ansys.dpf.core.time_freq_support import TimeFreqSupport
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ansys.dpf.core.results import Result
+    from ansys.dpf.core.server_factory import ServerConfig
+
+
+class ServerPool:
+    """Pool of local gRPC DPF servers sharing the extraction of results.
+
+    The evaluation of a :class:`Result <ansys.dpf.core.results.Result>` is split by time sets
+    or by mesh entities among the servers of the pool, which read their share of the result
+    files concurrently. The partial fields containers are then reassembled on the server of
+    the result's model.
+
+    Parameters
+    ----------
+    n_servers : int, optional
+        Number of servers to start. The default is the number of CPUs.
+    config : ServerConfig, optional
+        Configuration of the servers, which must communicate with gRPC.
+        The default is the default configuration of :func:`start_local_server`.
+    ansys_path : str, os.PathLike, optional
+        Root path of the Ansys installation to start the servers from.
+    context : ServerContext, optional
+        Settings used to load DPF's plugins on the servers.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.find_msup_transient())
+    >>> with dpf.ServerPool(n_servers=2) as pool:
+    ...     fc = pool.eval(model.results.displacement.on_all_time_freqs)
+    >>> len(fc)
+    20
+
+    """
+
+    def __init__(
+        self,
+        n_servers: int = None,
+        config: ServerConfig = None,
+        ansys_path: str | os.PathLike = None,
+        context=None,
+    ):
+        if config is not None and config.protocol == CommunicationProtocols.InProcess:
+            raise ValueError("A ServerPool requires servers communicating with gRPC.")
+        if n_servers is None:
+            n_servers = os.cpu_count() or 1
+        if n_servers < 1:
+            raise ValueError(f"n_servers must be at least 1, got {n_servers}.")
+        self._servers = []
+        self._models = {}
+        try:
+            for _ in range(n_servers):
+                self._servers.append(
+                    start_local_server(
+                        as_global=False, config=config, ansys_path=ansys_path, context=context
+                    )
+                )
+        except Exception:
+            self.shutdown()
+            raise
+
+    @property
+    def servers(self) -> list:
+        """Servers of the pool."""
+        return list(self._servers)
+
+    def __len__(self):
+        """Return the number of servers of the pool."""
+        return len(self._servers)
+
+    def __enter__(self):
+        """Return the pool."""
+        return self
+
+    def __exit__(self, *args):
+        """Shut down the servers of the pool."""
+        self.shutdown()
+
+    def shutdown(self):
+        """Shut down the servers of the pool."""
+        self._models = {}
+        for server in self._servers:
+            server.shutdown()
+        self._servers = []
+
+    def _pool_models(self, data_sources) -> list:
+        """Return a model of the data sources on each server of the pool."""
+        from ansys.dpf.core.model import Model
+
+        key = id(data_sources)
+        if key not in self._models:
+            models = [
+                Model(_deep_copy(data_sources, server=server), server=server)
+                for server in self._servers
+            ]
+            # Keep the data sources alive so that their id is not reused
+            self._models[key] = (data_sources, models)
+        return self._models[key][1]
+
+    def eval(self, result: Result, split_by: str = "time") -> FieldsContainer:
+        """Evaluate a result by splitting its extraction among the servers of the pool.
+
+        Parameters
+        ----------
+        result : Result
+            Result of a :class:`Model <ansys.dpf.core.model.Model>`, with its time scoping,
+            mesh scoping, location and splitting already chosen.
+        split_by : str, optional
+            ``"time"`` to split the time sets of the time scoping among the servers, or
+            ``"mesh"`` to split the mesh entities of the mesh scoping, or of the whole mesh
+            when no mesh scoping is set. The default is ``"time"``.
+
+        Returns
+        -------
+        fields_container : FieldsContainer, ElShapeFieldsContainer, BodyFieldsContainer
+            Fields container on the server of the model, as returned by ``result.eval()``.
+
+        Notes
+        -----
+        When the time scoping holds time or frequency values instead of time set IDs, the
+        time sets of the returned fields container are numbered on the values requested, as
+        ``result.eval()`` does, and its time frequency support holds these values.
+        """
+        connector = result._connector
+        time_values = _is_time_values(result._time_scoping)
+        mesh_scoping = result._mesh_scoping
+        if result._specific_fc_type and not isinstance(mesh_scoping, Scoping):
+            # the splitting operator is created again on each server
+            mesh_scoping = result._split_mesh_scoping
+        if split_by == "time":
+            shards = [
+                (time_scoping, mesh_scoping)
+                for time_scoping in _split_time_scoping(result._time_scoping, len(self))
+            ]
+        elif split_by == "mesh":
+            shards = [
+                (result._time_scoping, scoping)
+                for scoping in _split_mesh_scoping(result, mesh_scoping, len(self))
+            ]
+        else:
+            raise ValueError(f"split_by must be 'time' or 'mesh', got '{split_by}'.")
+
+        target_server = result._server
+        mesh = connector.mesh_provider.outputs.mesh() if connector.mesh_provider else None
+        models = self._pool_models(connector.data_sources)
+        futures = [
+            _concurrency.submit(
+                model._server,
+                _eval_shard,
+                model,
+                result,
+                time_scoping,
+                shard_mesh_scoping,
+                target_server,
+                mesh,
+                time_values,
+            )
+            for model, (time_scoping, shard_mesh_scoping) in zip(models, shards)
+        ]
+        wait(futures)
+        partials = [future.result() for future in futures]
+
+        time_freq_support = connector.time_freq_support
+        if time_values:
+            partials, time_freq_support = _renumber_time_values(
+                partials, split_by == "time", target_server
+            )
+        fc = _assemble([entries for entries, _ in partials], target_server)
+        if time_freq_support is not None:
+            fc.time_freq_support = time_freq_support
+        if result._specific_fc_type == "shape":
+            fc = ElShapeFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
+        elif result._specific_fc_type == "body":
+            fc = BodyFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
+        return fc
+
+
+def _is_time_values(time_scoping) -> bool:
+    """Whether a time scoping holds time or frequency values instead of time set IDs."""
+    if time_scoping is None or isinstance(time_scoping, Scoping):
+        return False
+    return bool(np.issubdtype(np.asarray(time_scoping).dtype, np.floating))
+
+
+def _split_time_scoping(time_scoping, n_shards) -> list:
+    """Split a time scoping in at most ``n_shards`` non-empty time scopings."""
+    if isinstance(time_scoping, Scoping):
+        return [
+            (chunk.tolist(), time_scoping.location)
+            for chunk in np.array_split(time_scoping.ids, n_shards)
+            if len(chunk)
+        ]
+    if isinstance(time_scoping, (list, tuple, np.ndarray)):
+        return [chunk.tolist() for chunk in np.array_split(time_scoping, n_shards) if len(chunk)]
+    # a single time set, a single time value or the default scoping cannot be split
+    return [time_scoping]
+
+
+def _split_mesh_scoping(result, mesh_scoping, n_shards) -> list:
+    """Split a mesh scoping, or the mesh, in at most ``n_shards`` non-empty mesh scopings."""
+    if isinstance(mesh_scoping, list):
+        ids, location = mesh_scoping, result._result_info.native_scoping_location
+    elif isinstance(mesh_scoping, Scoping):
+        ids, location = mesh_scoping.ids, mesh_scoping.location
+    elif mesh_scoping is None:
+        mesh = result._connector.mesh_provider.outputs.mesh()
+        location = result._result_info.native_scoping_location
+        entities = mesh.nodes if location == "Nodal" else mesh.elements
+        ids = entities.scoping.ids
+    else:
+        raise ValueError(f"A mesh scoping of type {type(mesh_scoping)} cannot be split.")
+    return [
+        (chunk.tolist(), location)
+        for chunk in np.array_split(np.asarray(ids), n_shards)
+        if len(chunk)
+    ]
+
+
+def _on_server(scoping, server):
+    """Return a scoping given as ids and location, or a DPF entity, on a server."""
+    if isinstance(scoping, tuple):
+        ids, location = scoping
+        return Scoping(ids=ids, location=location, server=server)
+    if hasattr(scoping, "deep_copy"):
+        return scoping.deep_copy(server)
+    return scoping
+
+
+def _eval_shard(  # noqa: PLR0913
+    model, result, time_scoping, mesh_scoping, target_server, mesh, time_values=False
+) -> tuple:
+    """Evaluate a share of a result on a pool model and copy its fields to the target server.
+
+    Return the label spaces and fields of the share, and the time frequencies of its time
+    frequency support when ``time_values`` is set, or ``None``.
+    """
+    shard = getattr(model.results, result._result_info.name)
+    if time_scoping is not None:
+        shard.on_time_scoping(_on_server(time_scoping, model._server))
+    if mesh_scoping is not None:
+        shard.on_mesh_scoping(_on_server(mesh_scoping, model._server))
+    if result._location:
+        shard.on_location(result._location)
+    if result._specific_fc_type == "shape":
+        shard = shard.split_by_shape
+    elif result._specific_fc_type == "body":
+        shard = shard.split_by_body
+    fc = shard.eval()
+    entries = []
+    for field, label_space in fc.get_entries_and_label_spaces():
+        # the mesh is already on the target server: only transfer the field data
+        copy = field._deep_copy_data(target_server)
+        if mesh is not None:
+            copy.meshed_region = mesh
+        entries.append((label_space, copy))
+    frequencies = None
+    if time_values:
+        time_frequencies = fc.time_freq_support.time_frequencies
+        frequencies = (np.asarray(time_frequencies.data).tolist(), time_frequencies.unit)
+    return entries, frequencies
+
+
+def _renumber_time_values(partials, split_by_time, server) -> tuple:
+    """Renumber the time sets of partial results evaluated at time values.
+
+    Each share numbers its time sets from 1 on its own time frequency support. When the time
+    values are split among the shares, the time sets of a share are offset by the number of
+    values of the previous shares. Return the renumbered partial results and the time frequency
+    support of all the values on ``server``.
+    """
+    values = []
+    unit = None
+    renumbered = []
+    for entries, (frequencies, frequencies_unit) in partials:
+        offset = len(values) if split_by_time else 0
+        renumbered.append(
+            (
+                [
+                    ({**label_space, "time": label_space["time"] + offset}, field)
+                    if "time" in label_space
+                    else (label_space, field)
+                    for label_space, field in entries
+                ],
+                None,
+            )
+        )
+        if split_by_time or not values:
+            # without splitting the times, every share is evaluated at the same values
+            values.extend(frequencies)
+            unit = unit or frequencies_unit
+    time_freq_field = fields_factory.create_scalar_field(
+        len(values), location=locations.time_freq, server=server
+    )
+    time_freq_field.append(values, 1)
+    if unit:
+        time_freq_field.unit = unit
+    time_freq_support = TimeFreqSupport(server=server)
+    time_freq_support.time_frequencies = time_freq_field
+    return renumbered, time_freq_support
+
+
+def _assemble(partials, server) -> FieldsContainer:
+    """Gather the fields of partial results, merging the fields sharing a label space."""
+    from ansys.dpf.core.operators.utility import merge_fields
+
+    fields_by_label_space = {}
+    labels = []
+    for entries in partials:
+        for label_space, field in entries:
+            labels.extend(label for label in label_space if label not in labels)
+            key = tuple(sorted(label_space.items()))
+            fields_by_label_space.setdefault(key, []).append(field)
+
+    fc = FieldsContainer(server=server)
+    fc.labels = labels
+    for key, fields in fields_by_label_space.items():
+        if len(fields) == 1:
+            field = fields[0]
+        else:
+            merge = merge_fields(server=server)
+            for pin, partial_field in enumerate(fields):
+                merge.connect(pin, partial_field)
+            field = merge.outputs.merged_field()
+        fc.add_field(dict(key), field)
+    return fc
@@ -469,6 +469,7 @@ class BaseServer(abc.ABC):
         self._info_instance = None
         self._docker_config = server_factory.RunningDockerConfig()
         self._server_meet_version = {}
+        self._specification_cache_key = None
 
     def set_as_global(self, as_global=True):
         """Set the current server as global if necessary.
@@ -620,8 +621,11 @@ class BaseServer(abc.ABC):
         -----
         Available with server's version starting at 6.0 (Ansys 2023R2).
         """
+        from ansys.dpf.core.operator_specification import _specification_cache
+
         self._base_service.apply_context(context)
         self._context = context
+        _specification_cache.invalidate(self)
 
     @property
     def context(self):
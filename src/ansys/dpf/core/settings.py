@@ -119,6 +119,140 @@ def set_dynamic_available_results_capability(value) -> None:
     misc.DYNAMIC_RESULTS = value
 
 
+def set_operator_specification_cache(enabled=True, path=None) -> None:
+    """Configure the cache of the operators specifications.
+
+    Operator specifications are read from the server once per server version, loaded plugins
+    and operator name, and then shared by all the operators created in the Python session.
+    The cache is invalidated for a server when it loads a new plugin.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether operator specifications are cached. The default is ``True``.
+    path : str, os.PathLike, optional
+        Directory where the specifications are persisted between Python sessions.
+        The default is ``None``, in which case specifications are only cached in memory.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_operator_specification_cache(False)
+    >>> dpf.settings.set_operator_specification_cache(True)
+
+    """
+    from ansys.dpf.core.operator_specification import _specification_cache
+
+    _specification_cache.save()
+    if not enabled:
+        _specification_cache.clear()
+    misc.SPECIFICATION_CACHE = enabled
+    misc.SPECIFICATION_CACHE_PATH = path
+
+
+def set_max_concurrent_requests(max_requests, server=None) -> None:
+    """Bound the number of background requests run concurrently on a server.
+
+    Background requests are started by methods such as
+    :meth:`Operator.eval_async <ansys.dpf.core.dpf_operator.Operator.eval_async>`.
+    Requests beyond the limit are queued until a running one completes.
+
+    Parameters
+    ----------
+    max_requests : int
+        Maximum number of concurrent requests. The default for all servers is ``4``.
+    server : server.DPFServer, optional
+        Server to set the limit of. The default is ``None``, in which case the default
+        limit of all the servers is set.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_max_concurrent_requests(8)
+    >>> dpf.settings.set_max_concurrent_requests(4)
+
+    """
+    from ansys.dpf.core import _concurrency
+
+    if server is None:
+        if max_requests < 1:
+            raise ValueError(f"max_requests must be at least 1, got {max_requests}.")
+        misc.MAX_CONCURRENT_REQUESTS = max_requests
+    else:
+        _concurrency.set_max_concurrent_requests(max_requests, server)
+
+
+def set_field_data_cache(enabled=True) -> None:
+    """Cache the last arrays read from gRPC servers for each field and scoping.
+
+    With the cache enabled, reading again the :attr:`data <ansys.dpf.core.field.Field.data>`,
+    :attr:`data_pointer <ansys.dpf.core.field.Field.data_pointer>` or
+    :attr:`scoping <ansys.dpf.core.field.Field.scoping>` IDs of an unchanged
+    :class:`Field <ansys.dpf.core.field.Field>` or
+    :class:`PropertyField <ansys.dpf.core.property_field.PropertyField>` costs one small
+    request checking the size of the data on the server instead of streaming the whole array.
+
+    The cache of an object is cleared by any of its setters. Cached arrays are read-only:
+    copy them before modifying them. Changes done on the server without changing the size of
+    the data, for example through another Python object referencing the same field, are not
+    detected.
+
+    Hits, misses and invalidations are counted per class, see
+    :meth:`CacheHandler.class_statistics <ansys.dpf.core.cache.CacheHandler.class_statistics>`.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether the arrays read from gRPC servers are cached. The default is ``True``.
+        The cache is disabled by default.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core.cache import CacheHandler
+    >>> dpf.settings.set_field_data_cache(True)
+    >>> statistics = CacheHandler.class_statistics("Field")
+    >>> dpf.settings.set_field_data_cache(False)
+
+    """
+    misc.FIELD_DATA_CACHE = enabled
+
+
+def set_stream_compression(compression=None) -> None:
+    """Compress losslessly the data streamed to gRPC servers.
+
+    Compression reduces the bytes sent on slow links, for example when uploading files or
+    setting the data of large fields, at the cost of CPU time on both ends. Whether the data
+    streamed back by the server is compressed depends on the server.
+
+    Parameters
+    ----------
+    compression : str, optional
+        ``"gzip"`` or ``"deflate"``. The default is ``None``, in which case the data is not
+        compressed.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.set_stream_compression("gzip")
+    >>> dpf.settings.set_stream_compression(None)
+
+    """
+    from ansys.dpf.gate import settings
+
+    if compression is None:
+        settings.set_stream_compression(None)
+        return
+    import grpc
+
+    algorithms = {"gzip": grpc.Compression.Gzip, "deflate": grpc.Compression.Deflate}
+    if compression not in algorithms:
+        raise ValueError(
+            f"compression must be one of {list(algorithms)} or None, got {compression!r}."
+        )
+    settings.set_stream_compression(algorithms[compression])
+
+
 def _forward_to_gate():
     from ansys.dpf.core.common import _common_progress_bar, _progress_bar_is_available
     from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
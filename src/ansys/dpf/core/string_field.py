@@ -70,6 +70,8 @@ class StringField(_FieldBase):
     Class available with server's version starting at 5.0 (Ansys 2023R1).
     """
 
+    _append_dtype = object
+
     def __init__(
         self,
         nentities=0,
@@ -222,6 +222,104 @@ def _dpf_mesh_to_vtk_op(
         return grid
 
 
+def _vtk_cells_from_connectivity(etypes, connectivity, elem_size, polyhedrons=None):
+    """Build the VTK legacy cells array of a mesh in a single vectorized pass.
+
+    Each cell is written as ``[n, id_0, ..., id_n-1]``. Polyhedrons are written as
+    ``[n_values, n_faces, n_face_0, face_0_id_0, ..., n_face_1, ...]``, where
+    ``n_values`` is the number of values which follow it.
+
+    Parameters
+    ----------
+    etypes:
+        Element type of each element.
+    connectivity:
+        Concatenated node indices of all the elements.
+    elem_size:
+        Number of node indices of each element in ``connectivity``.
+    polyhedrons:
+        Tuple of ``(elements_faces, elements_faces_offsets, faces_nodes, faces_nodes_offsets)``
+        with the flat data and the CSR offsets (including the total size) of the
+        ``elements_faces_connectivity`` and ``faces_nodes_connectivity`` property fields.
+        Required when ``etypes`` contains polyhedrons.
+
+    Returns
+    -------
+    cells:
+        VTK legacy cells array.
+    cells_insert_ind:
+        Start index of each cell in ``cells``.
+    cell_sizes:
+        Number of values of each cell in ``cells``, including its leading size.
+    """
+    etypes = np.asarray(etypes).reshape(-1)
+    connectivity = np.asarray(connectivity).reshape(-1)
+    elem_size = np.asarray(elem_size, dtype=np.int64).reshape(-1)
+    n_elements = elem_size.size
+    elem_first = np.cumsum(elem_size) - elem_size
+
+    is_poly = (
+        etypes == element_types.Polyhedron.value
+        if polyhedrons is not None
+        else np.zeros(n_elements, dtype=bool)
+    )
+    poly_indices = np.flatnonzero(is_poly)
+
+    # Number of values following the leading size of each cell
+    cell_values = elem_size.copy()
+    if poly_indices.size:
+        elements_faces, elements_faces_dp, faces_nodes, faces_nodes_dp = (
+            np.asarray(array).reshape(-1) for array in polyhedrons
+        )
+        elements_faces_dp = elements_faces_dp.astype(np.int64)
+        faces_nodes_dp = faces_nodes_dp.astype(np.int64)
+        n_faces = elements_faces_dp[poly_indices + 1] - elements_faces_dp[poly_indices]
+        # Faces of all the polyhedrons, concatenated in polyhedron order
+        face_owner = np.repeat(np.arange(poly_indices.size), n_faces)
+        face_local = np.arange(face_owner.size) - np.repeat(np.cumsum(n_faces) - n_faces, n_faces)
+        faces = elements_faces[elements_faces_dp[poly_indices][face_owner] + face_local]
+        face_sizes = faces_nodes_dp[faces + 1] - faces_nodes_dp[faces]
+        # Each face is written as its size followed by its nodes
+        face_values = face_sizes + 1
+        poly_values = 1 + np.bincount(face_owner, weights=face_values, minlength=poly_indices.size)
+        cell_values[poly_indices] = poly_values.astype(np.int64)
+
+    cell_sizes = cell_values + 1
+    cells_insert_ind = np.cumsum(cell_sizes) - cell_sizes
+    cells = np.empty(int(cell_sizes.sum()), dtype=connectivity.dtype)
+    cells[cells_insert_ind] = cell_values
+
+    # Standard elements: copy their connectivity after their leading size
+    standard = ~is_poly
+    n_standard_values = elem_size[standard]
+    entry_owner = np.repeat(np.flatnonzero(standard), n_standard_values)
+    entry_local = np.arange(entry_owner.size) - np.repeat(
+        np.cumsum(n_standard_values) - n_standard_values, n_standard_values
+    )
+    cells[cells_insert_ind[entry_owner] + 1 + entry_local] = connectivity[
+        elem_first[entry_owner] + entry_local
+    ]
+
+    if poly_indices.size:
+        poly_start = cells_insert_ind[poly_indices]
+        cells[poly_start + 1] = n_faces
+        # Start of each face in cells, faces of a polyhedron being written one after the other
+        face_cumsum = np.cumsum(face_values) - face_values
+        first_face_of_poly = np.cumsum(n_faces) - n_faces
+        face_offset_in_poly = face_cumsum - np.repeat(face_cumsum[first_face_of_poly], n_faces)
+        face_start = poly_start[face_owner] + 2 + face_offset_in_poly
+        cells[face_start] = face_sizes
+        node_owner = np.repeat(np.arange(faces.size), face_sizes)
+        node_local = np.arange(node_owner.size) - np.repeat(
+            np.cumsum(face_sizes) - face_sizes, face_sizes
+        )
+        cells[face_start[node_owner] + 1 + node_local] = faces_nodes[
+            faces_nodes_dp[faces[node_owner]] + node_local
+        ]
+
+    return cells, cells_insert_ind, cell_sizes
+
+
 def _dpf_mesh_to_vtk_py(  # noqa: PLR0912, PLR0915, C901
     mesh: dpf.MeshedRegion, nodes: dpf.Field = None, as_linear: bool = True
 ) -> pv.UnstructuredGrid:
@@ -252,55 +350,24 @@ def _dpf_mesh_to_vtk_py(  # noqa: PLR0912, PLR0915, C901
 
     elem_size = np.ediff1d(np.append(connectivity.entity_data_offsets, connectivity.shape))
 
-    faces_nodes_connectivity = mesh.property_field("faces_nodes_connectivity")
-    faces_nodes_connectivity_dp = np.append(
-        faces_nodes_connectivity.entity_data_offsets, len(faces_nodes_connectivity)
-    )
-    elements_faces_connectivity = mesh.property_field("elements_faces_connectivity")
-    elements_faces_connectivity_dp = np.append(
-        elements_faces_connectivity.entity_data_offsets, len(elements_faces_connectivity)
-    )
-
-    insert_ind = np.cumsum(elem_size)
-    insert_ind = np.hstack(([0], insert_ind))[:-1]
-
-    # partition cells in vtk format
-    cells = np.insert(connectivity.data, insert_ind, elem_size)
-
+    polyhedrons = None
     # Check if polyhedrons are present
     if element_types.Polyhedron.value in etypes:
-        cells = np.array(cells)
-        nodes = np.array(node_coordinates)
-        insert_ind = insert_ind + np.asarray(list(range(len(insert_ind))))
-        # Replace in cells values for polyhedron format
-        # [NValuesToFollow,
-        # NFaces, Face1NPoints, Face1Point1, Face1Point2..., Face1PointN, FaceNNPoints,...]]
-        for i, ind in reversed(list(enumerate(insert_ind))):
-            # Check if this is a polyhedron
-            if etypes[i] == element_types.Polyhedron.value:
-                # Construct the connectivity for the poly element
-                poly_connectivity = []
-                faces = elements_faces_connectivity.data[
-                    elements_faces_connectivity_dp[i] : elements_faces_connectivity_dp[i + 1]
-                ]
-                for face in faces:
-                    face_connectivity = faces_nodes_connectivity.data[
-                        faces_nodes_connectivity_dp[face] : faces_nodes_connectivity_dp[face + 1]
-                    ]
-                    face_fmt = [len(face_connectivity)] + list(face_connectivity)
-                    poly_connectivity += face_fmt
-                polyhedron = [len(faces)] + poly_connectivity
-                polyhedron = [len(polyhedron)] + polyhedron
-                # Replace the whole sequence between this index and the next
-                r = list(range(ind, ind + elem_size[i] + 1))
-                cells = np.delete(cells, r)
-                cells = np.insert(cells, ind, polyhedron)
-
-    def compute_offset():
-        """Return the starting point of a cell in the cells array."""
-        return insert_ind + np.arange(insert_ind.size)
-
-    cells_insert_ind = compute_offset()
+        faces_nodes_connectivity = mesh.property_field("faces_nodes_connectivity")
+        elements_faces_connectivity = mesh.property_field("elements_faces_connectivity")
+        polyhedrons = (
+            elements_faces_connectivity.data,
+            np.append(
+                elements_faces_connectivity.entity_data_offsets, len(elements_faces_connectivity)
+            ),
+            faces_nodes_connectivity.data,
+            np.append(faces_nodes_connectivity.entity_data_offsets, len(faces_nodes_connectivity)),
+        )
+
+    cells, cells_insert_ind, cell_sizes = _vtk_cells_from_connectivity(
+        etypes, connectivity.data, elem_size, polyhedrons
+    )
+
     # convert kAns to VTK cell type
     offset = None
     if as_linear:
@@ -339,13 +406,12 @@ def _dpf_mesh_to_vtk_py(  # noqa: PLR0912, PLR0915, C901
         # Handle semi-parabolic elements
         semi_mask = cells == -1
         if semi_mask.any():
-            cells_insert_ind = compute_offset()
             # Create a global mask of connectivity values to take
             mask = np.full(cells.shape, True)
             # Build a map of size cells with repeated element beginning index
-            repeated_insert_ind = cells_insert_ind.repeat(repeats=elem_size + 1)
+            repeated_insert_ind = cells_insert_ind.repeat(repeats=cell_sizes)
             # Apply the semi-mask to get a unique set of indices of semi-parabolic elements in cells
-            semi_indices_in_cells = np.array(list(set(repeated_insert_ind[semi_mask])))
+            semi_indices_in_cells = np.unique(repeated_insert_ind[semi_mask])
             semi_sizes = cells[semi_indices_in_cells]
             semi_quad8 = semi_sizes == _QUAD8_N_NODES
             if semi_quad8.any():
@@ -388,7 +454,7 @@ def _dpf_mesh_to_vtk_py(  # noqa: PLR0912, PLR0915, C901
 
     # might be computed when checking for VTK quadratic bug
     if offset is None:
-        offset = compute_offset()
+        offset = cells_insert_ind
 
     return pv.UnstructuredGrid(offset, cells, vtk_cell_type, node_coordinates)
 
@@ -437,6 +503,52 @@ def dpf_mesh_to_vtk(
     return grid
 
 
+def _cached_dpf_mesh_to_vtk(
+    mesh: dpf.MeshedRegion, nodes: dpf.Field = None, as_linear: bool = True
+) -> pv.UnstructuredGrid:
+    """Return a pyvista UnstructuredGrid given a MeshedRegion, reusing its cached cells.
+
+    The conversion of the mesh is done once per ``as_linear`` value and cached on the
+    MeshedRegion. Each call returns a shallow copy of the cached grid, so that arrays appended
+    to it do not leak into the next call. When ``nodes`` is given, only the points of the copy
+    are replaced.
+
+    Parameters
+    ----------
+    mesh:
+        Meshed Region to export to pyVista format.
+    nodes:
+        Field containing the node coordinates of the mesh (useful to get a deformed geometry).
+    as_linear:
+        Export quadratic surface elements as linear.
+
+    Returns
+    -------
+    grid:
+        UnstructuredGrid corresponding to the DPF mesh.
+    """
+    cached_grid = mesh._vtk_grids.get(as_linear)
+    if cached_grid is None:
+        cached_grid = dpf_mesh_to_vtk(mesh, as_linear=as_linear)
+        mesh._vtk_grids[as_linear] = cached_grid
+    grid = cached_grid.copy(deep=False)
+    if nodes is not None:
+        node_coordinates = nodes.data
+        if len(node_coordinates) != grid.n_points:
+            return dpf_mesh_to_vtk(mesh, nodes, as_linear)
+        # Give the copy its own points so that the cached grid is left untouched
+        grid.SetPoints(pv.vtk_points(node_coordinates, deep=False))
+        cache_value = [cached_grid, node_coordinates, nodes]
+    else:
+        cache_value = [cached_grid]
+    # The copy references the cached arrays, hold onto them as PyVista does not make a copy.
+    if hasattr(pv, "set_new_attribute"):  # For pyvista >=0.46.0
+        pv.set_new_attribute(obj=grid, name="_dpf_cache_op", value=cache_value)
+    else:  # For pyvista <0.46.0  # pragma: nocover
+        setattr(grid, "_dpf_cache_op", cache_value)
+    return grid
+
+
 @dataclass
 class VTKMeshValidity:
     """Dataclass containing the results of a call to vtk_mesh_is_valid.
@@ -622,7 +734,7 @@ def dpf_meshes_to_vtk(
         nodes_i = None
         if nodes:
             nodes_i = nodes[i]
-        grids.append(dpf_mesh_to_vtk(mesh, nodes_i, as_linear))
+        grids.append(_cached_dpf_mesh_to_vtk(mesh, nodes_i, as_linear))
     return pv.MultiBlock(grids).combine()
 
 
@@ -694,7 +806,7 @@ def dpf_field_to_vtk(
     # Initialize the bare UnstructuredGrid
     if meshed_region.nodes.n_nodes == 0:
         raise ValueError("The field does not have a meshed_region.")
-    grid = dpf_mesh_to_vtk(mesh=meshed_region, nodes=nodes, as_linear=as_linear)
+    grid = _cached_dpf_mesh_to_vtk(mesh=meshed_region, nodes=nodes, as_linear=as_linear)
 
     grid = append_field_to_grid(
         field=field, meshed_region=meshed_region, grid=grid, field_name=field_name
@@ -756,11 +868,8 @@ def dpf_fieldscontainer_to_vtk(
 
     # Associate the meshes in meshes_container to the corresponding fields if provided
     if meshes_container:
-        for i, mesh in enumerate(meshes_container):
-            label_space = meshes_container.get_label_space(i)
-            fields_container.get_field(
-                label_space_or_index=label_space
-            ).meshed_region = meshes_container.get_mesh(label_space_or_index=label_space)
+        for mesh, label_space in meshes_container.get_entries_and_label_spaces():
+            fields_container.get_field(label_space_or_index=label_space).meshed_region = mesh
 
     # Initialize the bare UnstructuredGrid
     # Loop on the fields to check if merging supports is necessary
@@ -778,7 +887,7 @@ def dpf_fieldscontainer_to_vtk(
         meshed_region = meshes[0]
     if meshed_region.nodes.n_nodes == 0:
         raise ValueError("The meshed_region of the fields contains no nodes.")
-    grid = dpf_mesh_to_vtk(mesh=meshed_region, nodes=nodes, as_linear=as_linear)
+    grid = _cached_dpf_mesh_to_vtk(mesh=meshed_region, nodes=nodes, as_linear=as_linear)
     grid = append_fieldscontainer_to_grid(
         fields_container=fields_container,
         meshed_region=meshed_region,
@@ -877,7 +986,7 @@ def dpf_property_field_to_vtk(
     # Initialize the bare UnstructuredGrid
     if meshed_region.nodes.n_nodes == 0:
         raise ValueError("The property field does not have a meshed_region.")
-    grid = dpf_mesh_to_vtk(mesh=meshed_region, nodes=nodes, as_linear=as_linear)
+    grid = _cached_dpf_mesh_to_vtk(mesh=meshed_region, nodes=nodes, as_linear=as_linear)
 
     grid = append_field_to_grid(
         field=property_field, meshed_region=meshed_region, grid=grid, field_name=field_name
@@ -969,9 +1078,8 @@ def append_fieldscontainer_to_grid(
     >>> fc = model.results.displacement().eval()
     >>> grid = append_fieldscontainer_to_grid(fc, mesh, grid, field_name="displacement")
     """
-    for i, field in enumerate(fields_container):
-        label_space = fields_container.get_label_space(i)
-        label_space = dict([(k, label_space[k]) for k in sorted(label_space.keys())])
+    for field, entry_label_space in fields_container.get_entries_and_label_spaces():
+        label_space = dict([(k, entry_label_space[k]) for k in sorted(entry_label_space.keys())])
         if not field_name:
             field_name = field.name
         grid = append_field_to_grid(
@@ -24,6 +24,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from enum import Enum
 import os
 from pathlib import Path
@@ -34,7 +35,7 @@ import warnings
 import numpy
 
 from ansys import dpf
-from ansys.dpf.core import dpf_operator, inputs, outputs, server as server_module
+from ansys.dpf.core import _concurrency, dpf_operator, inputs, outputs, server as server_module
 from ansys.dpf.core.check_version import (
     server_meet_version,
     server_meet_version_and_raise,
@@ -471,6 +472,29 @@ class Workflow:
             return out
         raise TypeError(f"{output_type} is not an implemented Workflow's output")
 
+    def get_output_async(self, pin_name, output_type) -> Future:
+        """Retrieve the output of the workflow on a pin in the background.
+
+        Background requests run concurrently up to the limit of the server, set with
+        :func:`ansys.dpf.core.settings.set_max_concurrent_requests`.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to retrieve. This name should be
+            exposed before with wf.set_output_name
+        output_type : core.type enum
+            Type of the requested output.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the output returned by :meth:`get_output`. Its ``cancel`` method
+            prevents the evaluation if it is still queued. Use ``asyncio.wrap_future``
+            to await it in a coroutine.
+        """
+        return _concurrency.submit(self._server, self.get_output, pin_name, output_type)
+
     def set_input_name(self, name, *args):
         """Set the name of the input pin of the workflow to expose it for future connection.
 
@@ -217,7 +217,8 @@ class AnyGRPCAPI(any_abstract_api.AnyAbstractAPI):
                     any,
                     set_array=_set_array_to_request
                 ),
-                metadata=metadata)
+                metadata=metadata,
+                **grpc_stream_helpers._stream_options())
         else:
             return AnyGRPCAPI.any_new_from_string_on_client(client, any)
 
@@ -156,6 +156,38 @@ class CollectionGRPCAPI(collection_abstract_api.CollectionAbstractAPI):
     def collection_get_obj_label_space_by_index(collection, index):
         return CollectionGRPCAPI._collection_get_entries(collection, index)[0].label_space
 
+    @staticmethod
+    def collection_get_entries_and_label_spaces(collection):
+        # an empty label space matches every entry: one request returns the whole collection
+        from ansys.grpc.dpf import label_space_pb2
+        entries = CollectionGRPCAPI._collection_get_entries(collection, label_space_pb2.LabelSpace())
+        out = []
+        for obj in entries:
+            # GetEntries already returns new references: take them instead of duplicating them
+            internal_obj = obj.entry.get_ownership()
+            if internal_obj is None:
+                internal_obj = data_processing_grpcapi.DataProcessingGRPCAPI.data_processing_duplicate_object_reference(
+                    obj.entry)
+            out.append((internal_obj, obj.label_space))
+        return out
+
+    @staticmethod
+    def collection_get_label_spaces(collection):
+        # an empty label space matches every entry: one request returns all the label spaces
+        from ansys.grpc.dpf import label_space_pb2
+        entries = CollectionGRPCAPI._collection_get_entries(collection, label_space_pb2.LabelSpace())
+        if collection._server.meet_version("4.0"):
+            # release the references returned with the entries in a single request
+            from ansys.grpc.dpf import base_pb2
+            request = base_pb2.DeleteRequest()
+            for obj in entries:
+                internal_obj = obj.entry.get_ownership()
+                if internal_obj is not None:
+                    request.dpf_type_id.append(internal_obj.id)
+            if len(request.dpf_type_id) > 0:
+                data_processing_grpcapi._get_stub(collection._server).Delete(request)
+        return [obj.label_space for obj in entries]
+
     @staticmethod
     def _collection_get_entries(collection, label_space_or_index):
         from ansys.grpc.dpf import collection_pb2, scoping_pb2, field_pb2, meshed_region_pb2, base_pb2, \
@@ -165,6 +197,8 @@ class CollectionGRPCAPI(collection_abstract_api.CollectionAbstractAPI):
 
         if isinstance(label_space_or_index, int):
             request.index = label_space_or_index
+        elif not hasattr(label_space_or_index, "_internal_obj"):
+            request.label_space.CopyFrom(label_space_or_index)
         else:
             request.label_space.CopyFrom(label_space_or_index._internal_obj)
 
@@ -225,7 +259,8 @@ class CollectionGRPCAPI(collection_abstract_api.CollectionAbstractAPI):
         request = collection_pb2.UpdateAllDataRequest()
         request.collection.CopyFrom(collection._internal_obj)
         _get_stub(collection._server).UpdateAllData(grpc_stream_helpers._data_chunk_yielder(request, data),
-                                                    metadata=metadata)
+                                                    metadata=metadata,
+                                                    **grpc_stream_helpers._stream_options())
 
     @staticmethod
     def collection_set_data_as_int(collection, data, size):
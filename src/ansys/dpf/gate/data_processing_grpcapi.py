@@ -257,7 +257,8 @@ class DataProcessingGRPCAPI(data_processing_abstract_api.DataProcessingAbstractA
             DataProcessingYielderHelper.file_chunk_yielder(
                 file_path=file_path, to_server_file_path=to_server_file_path,
                 use_tmp_dir=use_tmp_dir
-            )
+            ),
+            **grpc_stream_helpers._stream_options()
         ).server_file_path
         return to_return
 
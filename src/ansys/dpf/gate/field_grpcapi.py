@@ -162,10 +162,11 @@ class FieldGRPCAPI(field_abstract_api.FieldAbstractAPI):
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(field._internal_obj)
         _get_stub(field._server).UpdateDataPointer(
-            grpc_stream_helpers._data_chunk_yielder(request, data), metadata=metadata)
+            grpc_stream_helpers._data_chunk_yielder(request, data), metadata=metadata,
+            **grpc_stream_helpers._stream_options())
 
     @staticmethod
-    def csfield_get_data(field, np_array):
+    def csfield_get_data(field, np_array, out=None, stream_dtype=None):
         from ansys.grpc.dpf import field_pb2
         request = field_pb2.ListRequest()
         request.field.CopyFrom(field._internal_obj)
@@ -176,10 +177,10 @@ class FieldGRPCAPI(field_abstract_api.FieldAbstractAPI):
         elif field._internal_obj.datatype == "custom":
             dtype = field._type
         else:
-            data_type = "double"
-            dtype = np.float64
+            # Single precision data received into a double precision out is converted
+            data_type, dtype = grpc_stream_helpers._stream_type(stream_dtype)
         service = _get_stub(field._server).List(request, metadata=[("float_or_double", data_type)])
-        return grpc_stream_helpers._data_get_chunk_(dtype, service, np_array)
+        return grpc_stream_helpers._data_get_chunk_(dtype, service, np_array, out=out)
 
     @staticmethod
     def csfield_raw_set_data(field, data, metadata):
@@ -187,7 +188,8 @@ class FieldGRPCAPI(field_abstract_api.FieldAbstractAPI):
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(field._internal_obj)
         _get_stub(field._server).UpdateData(
-            grpc_stream_helpers._data_chunk_yielder(request, data), metadata=metadata
+            grpc_stream_helpers._data_chunk_yielder(request, data), metadata=metadata,
+            **grpc_stream_helpers._stream_options()
         )
 
     @staticmethod
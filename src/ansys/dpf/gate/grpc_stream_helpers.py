@@ -1,6 +1,4 @@
 from contextlib import suppress
-import sys
-import array
 import numpy as np
 from ansys.dpf.gate.dpf_vector import get_size_of_list
 
@@ -21,6 +19,37 @@ def _array_unit(data):
     return "byte"
 
 
+def _as_byte_view(data):
+    """Return a flat memoryview on the bytes of ``data``, without copy, and its item size."""
+    if isinstance(data, list):
+        data = np.asarray(data)
+    if isinstance(data, (np.generic, np.ndarray)):
+        data = np.ascontiguousarray(data).reshape(-1)
+        return memoryview(data.view(np.uint8)), data.dtype.itemsize
+    return memoryview(data).cast("B"), 1
+
+
+def _stream_options():
+    """Keyword arguments of the gRPC calls streaming data to the server.
+
+    When a compression is configured, the chunks sent are compressed losslessly by gRPC.
+    """
+    from ansys.dpf.gate import misc
+    if misc.STREAM_COMPRESSION is None:
+        return {}
+    return {"compression": misc.STREAM_COMPRESSION}
+
+
+def _stream_type(stream_dtype=None):
+    """Return the ``float_or_double`` metadata and the NumPy type to receive double data with.
+
+    ``stream_dtype=numpy.float32`` requests the server to convert the values to 4-byte floats.
+    """
+    if stream_dtype is not None and np.dtype(stream_dtype) == np.float32:
+        return "float", np.float32
+    return "double", np.float64
+
+
 def _data_chunk_yielder(request, data, chunk_size=None, set_array=_set_array_to_request):
     from ansys.dpf.gate import misc
     if not chunk_size:
@@ -33,38 +62,52 @@ def _data_chunk_yielder(request, data, chunk_size=None, set_array=_set_array_to_
             "Sending data...", unit=_array_unit(data), tot_size=length
         )
         bar.start()
-    sent_length = 0
     if length == 0:
         yield request
         return
-    unitary_size = int(chunk_size // sys.getsizeof(data[0]))
-    if length - sent_length < unitary_size:
-        unitary_size = length - sent_length
-    while sent_length < length:
-        currentcopy = data[sent_length: sent_length + unitary_size]
-        set_array(request, _to_bytes(currentcopy))
-        sent_length = sent_length + unitary_size
-        if length - sent_length < unitary_size:
-            unitary_size = length - sent_length
+    byte_view, itemsize = _as_byte_view(data)
+    # Chunks hold a whole number of items of chunk_size bytes at most
+    chunk_bytes = max(int(chunk_size) // itemsize, 1) * itemsize
+    total_bytes = len(byte_view)
+    sent_bytes = 0
+    while sent_bytes < total_bytes:
+        # Slicing the memoryview does not copy, protobuf only accepts bytes so the chunk
+        # is copied once when set to the request
+        set_array(request, bytes(byte_view[sent_bytes: sent_bytes + chunk_bytes]))
+        sent_bytes = min(sent_bytes + chunk_bytes, total_bytes)
         yield request
         with suppress(Exception):
             if need_progress_bar:
-                bar.update(sent_length)
+                bar.update(sent_bytes // itemsize)
     with suppress(Exception):
         if need_progress_bar:
             bar.finish()
 
 
-def dtype_to_array_type(dtype):
-    if dtype == np.float64:
-        return "d"
-    elif dtype == np.byte:
-        return "b"
-    else:
-        return "i"
+def _data_destination(out, dtype, size):
+    """Return a flat view of ``size`` values of ``out`` to receive data in.
+
+    ``out`` can be any C-contiguous writable array, for example a ``numpy.memmap``.
+    Float values streamed in single precision can be received in a ``float64`` array,
+    each chunk is then converted when written into ``out``.
+    """
+    dtype = np.dtype(dtype)
+    if out.dtype != dtype and not (
+        dtype == np.float32 and out.dtype == np.float64
+    ):
+        raise TypeError(
+            f"The output array must be of type {np.dtype(dtype).name}, not {out.dtype.name}."
+        )
+    if not out.flags.c_contiguous or not out.flags.writeable:
+        raise ValueError("The output array must be C-contiguous and writeable.")
+    if out.size < size:
+        raise ValueError(
+            f"The output array holds {out.size} values while {size} are received."
+        )
+    return out.reshape(-1)[:size]
 
 
-def _data_get_chunk_(dtype, service, np_array=True, get_array=lambda chunk: chunk.array):
+def _data_get_chunk_(dtype, service, np_array=True, get_array=lambda chunk: chunk.array, out=None):
     from ansys.dpf.gate import misc
     tupleMetaData = service.initial_metadata()
 
@@ -82,28 +125,24 @@ def _data_get_chunk_(dtype, service, np_array=True, get_array=lambda chunk: chun
         )
         bar.start()
 
-    if np_array:
+    if out is None:
         arr = np.empty(size // itemsize, dtype)
-        i = 0
-        for chunk in service:
-            curr_size = len(get_array(chunk)) // itemsize
-            arr[i: i + curr_size] = np.frombuffer(get_array(chunk), dtype)
-            i += curr_size
-            with suppress(Exception):
-                if need_progress_bar:
-                    bar.update(i)
-
     else:
-        arr = []
-        atype = dtype_to_array_type(dtype)
-        for chunk in service:
-            arr.extend(array.array(atype, get_array(chunk)))
-            with suppress(Exception):
-                if need_progress_bar:
-                    bar.update(len(arr))
+        arr = _data_destination(out, dtype, size // itemsize)
+    i = 0
+    for chunk in service:
+        # frombuffer does not copy, each chunk is written once into its final location
+        chunk_array = np.frombuffer(get_array(chunk), dtype)
+        arr[i: i + chunk_array.size] = chunk_array
+        i += chunk_array.size
+        with suppress(Exception):
+            if need_progress_bar:
+                bar.update(i)
     with suppress(Exception):
         if need_progress_bar:
             bar.finish()
+    if not np_array:
+        return arr.tolist()
     return arr
 
 
@@ -1,5 +1,6 @@
 DEFAULT_FILE_CHUNK_SIZE = None
 COMMON_PROGRESS_BAR = None
+STREAM_COMPRESSION = None
 class LocalClientConfig(dict):
     """Behaves as a RuntimeClientConfig"""
     __delattr__ = dict.__delitem__
@@ -106,7 +106,8 @@ class OperatorGRPCAPI(operator_abstract_api.OperatorAbstractAPI):
                     value,
                     set_array=_set_array_to_request
                 ),
-                metadata=metadata)
+                metadata=metadata,
+                **grpc_stream_helpers._stream_options())
         else:
             OperatorGRPCAPI.operator_connect_string(op, pin, value)
 
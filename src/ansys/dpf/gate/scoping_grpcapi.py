@@ -42,10 +42,11 @@ class ScopingGRPCAPI(scoping_abstract_api.ScopingAbstractAPI):
         request = scoping_pb2.UpdateIdsRequest()
         request.scoping.CopyFrom(scoping._internal_obj)
         if scoping._server.meet_version("2.1"):
-            _get_stub(scoping._server).UpdateIds(grpc_stream_helpers._data_chunk_yielder(request, ids), metadata=metadata)
+            _get_stub(scoping._server).UpdateIds(grpc_stream_helpers._data_chunk_yielder(request, ids), metadata=metadata,
+                                                 **grpc_stream_helpers._stream_options())
         else:
             _get_stub(scoping._server).UpdateIds(
-                grpc_stream_helpers._data_chunk_yielder(request, ids, 8.0e6), metadata=metadata
+                grpc_stream_helpers._data_chunk_yielder(request, ids, 1.0e6), metadata=metadata
             )
 
     @staticmethod
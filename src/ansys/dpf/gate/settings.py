@@ -2,4 +2,9 @@
 def forward_settings(default_file_chunk_size, common_progress_bar):
     from ansys.dpf.gate import misc
     misc.DEFAULT_FILE_CHUNK_SIZE = default_file_chunk_size
-    misc.COMMON_PROGRESS_BAR = common_progress_bar
\ No newline at end of file
+    misc.COMMON_PROGRESS_BAR = common_progress_bar
+
+
+def set_stream_compression(compression):
+    from ansys.dpf.gate import misc
+    misc.STREAM_COMPRESSION = compression
\ No newline at end of file
@@ -73,5 +73,6 @@ class StringFieldGRPCAPI(string_field_abstract_api.StringFieldAbstractAPI):
 		request = field_pb2.UpdateDataRequest()
 		request.field.CopyFrom(field._internal_obj)
 		field_grpcapi._get_stub(field._server).UpdateData(
-			grpc_stream_helpers._string_data_chunk_yielder(request, data), metadata=metadata
+			grpc_stream_helpers._string_data_chunk_yielder(request, data), metadata=metadata,
+			**grpc_stream_helpers._stream_options()
 		)
@@ -91,7 +91,8 @@ class WorkflowGRPCAPI(workflow_abstract_api.WorkflowAbstractAPI):
                     value,
                     set_array=_set_array_to_request
                 ),
-                metadata=metadata)
+                metadata=metadata,
+                **grpc_stream_helpers._stream_options())
         else:
             WorkflowGRPCAPI.work_flow_connect_string(wf, pin_name, value)
 
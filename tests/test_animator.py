@@ -251,3 +251,76 @@ def test_animator_animate_fields_container_cpos(remove_gifs, displacement_fields
     )
     assert Path(gif_name).is_file()
     assert Path(gif_name).stat().st_size > 6000
+
+
+def test_animator_update_field_actor_in_place():
+    import numpy as np
+    import pyvista as pv
+
+    from ansys.dpf.core.animator import _PyVistaAnimator
+
+    animator = _PyVistaAnimator(off_screen=True)
+    grid = pv.ImageData(dimensions=(3, 3, 3)).cast_to_unstructured_grid()
+    animator._field_actor = animator._plotter.add_mesh(grid, scalars=np.zeros(grid.n_points))
+
+    data = np.arange(grid.n_points, dtype=float)
+    points = np.asarray(grid.points) * 2.0
+    animator._update_field_actor(data, points)
+    assert animator._field_actor.mapper.dataset is grid
+    assert np.allclose(grid.point_data[animator._field_actor.mapper.array_name], data)
+    assert np.allclose(grid.points, points)
+    assert np.allclose(animator._field_actor.mapper.scalar_range, (0.0, grid.n_points - 1))
+    animator.close()
+
+
+def test_animator_animate_pipeline(displacement_fields):
+    frequencies = displacement_fields.time_freq_support.time_frequencies
+    loop_over = displacement_fields.get_time_scoping()
+    loop_over_field = dpf.fields_factory.field_from_array(frequencies.data[loop_over.ids - 1])
+    loop_over_field.scoping.ids = loop_over.ids
+    loop_over_field.unit = frequencies.unit
+
+    wf = Workflow()
+    wf.progress_bar = False
+    extract_field_op = dpf.operators.utility.extract_field(displacement_fields)
+    wf.set_input_name("loop_over", extract_field_op.inputs.indices)
+    wf.set_output_name("to_render", extract_field_op.outputs.field)
+    wf.set_output_name("deform_by", extract_field_op.outputs.field)
+
+    an = Animator(wf)
+    assert an.frames_per_second is None
+    an.animate(
+        loop_over=loop_over_field,
+        pipeline=True,
+        meshed_region=displacement_fields[0].meshed_region,
+        off_screen=True,
+    )
+    assert an.frames_per_second > 0
+
+
+def test_animator_animate_fields_container_pipeline(displacement_fields):
+    displacement_fields.animate(pipeline=True, off_screen=True)
+
+
+def test_animator_animate_fields_container_shared_meshed_region(displacement_fields):
+    mesh = displacement_fields[0].meshed_region
+    displacement_fields.animate(meshed_region=mesh, off_screen=True)
+    # the mesh is converted to VTK once and its grid reused by all the frames
+    assert len(mesh._vtk_grids) == 1
+
+
+@pytest.mark.slow
+def test_benchmark_animate_pipeline():
+    import time
+
+    model = dpf.Model(examples.find_msup_transient())
+    displacement_fields = model.results.displacement.on_all_time_freqs.eval()
+    meshed_region = model.metadata.meshed_region
+
+    for pipeline in [False, True]:
+        start = time.perf_counter()
+        displacement_fields.animate(pipeline=pipeline, meshed_region=meshed_region, off_screen=True)
+        print(
+            f"animate {len(displacement_fields)} frames with pipeline={pipeline}: "
+            f"{time.perf_counter() - start:.3f}s"
+        )
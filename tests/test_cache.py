@@ -19,3 +19,246 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+
+import threading
+
+import numpy as np
+import pytest
+
+from ansys.dpf.core import misc
+from ansys.dpf.core.cache import (
+    CacheHandler,
+    MethodIdentifier,
+    ResultCache,
+    _cached_read,
+    _invalidate_read_cache,
+    class_handling_cache,
+)
+
+
+def _make_cached_class(max_entries=None, max_bytes=None):
+    class _Entity:
+        def __init__(self):
+            self.calls = 0
+            self.value = 1.0
+
+        def get_array(self, size, scale=1.0):
+            self.calls += 1
+            return np.full(size, self.value * scale)
+
+        def get_ids(self, ids):
+            self.calls += 1
+            return sum(ids)
+
+        def set_value(self, value):
+            self.value = value
+
+        _to_cache = {get_array: [set_value], get_ids: [set_value]}
+        _cache_max_entries = max_entries
+        _cache_max_bytes = max_bytes
+
+    return class_handling_cache(_Entity)
+
+
+def test_method_identifier_hashes_unhashable_arguments():
+    first = MethodIdentifier("get", ([1, 2], np.arange(3)), {"option": [3]})
+    second = MethodIdentifier("get", ([1, 2], np.arange(3)), {"option": [3]})
+    other = MethodIdentifier("get", ([1, 2], np.arange(4)), {"option": [3]})
+    assert hash(first) == hash(second)
+    assert first == second
+    assert first != other
+    assert first == "get"
+
+
+def test_cache_handler_hits_and_misses():
+    entity_class = _make_cached_class()
+    entity = entity_class()
+    statistics = CacheHandler.class_statistics(entity_class.__name__)
+    hits, misses = statistics.hits, statistics.misses
+    assert np.allclose(entity.get_array(3), 1.0)
+    entity.get_array(3)
+    assert entity.get_ids([1, 2, 3]) == 6
+    assert entity.get_ids([1, 2, 3]) == 6
+    assert entity.calls == 2
+    assert statistics.hits - hits == 2
+    assert statistics.misses - misses == 2
+
+
+def test_cache_handler_skips_unhashable_arguments():
+    class Ids:
+        __hash__ = None
+
+        def __iter__(self):
+            return iter([1, 2])
+
+    entity = _make_cached_class()()
+    assert entity.get_ids(Ids()) == 3
+    assert entity.get_ids(Ids()) == 3
+    assert entity.calls == 2
+    assert len(entity._cache.cached) == 0
+    with pytest.raises(TypeError):
+        hash(MethodIdentifier("get", (np.array([Ids()], dtype=object),), {}))
+
+
+def test_cache_handler_setter_invalidates_all_arguments():
+    entity = _make_cached_class()()
+    entity.get_array(3)
+    entity.get_array(4, scale=2.0)
+    entity.get_ids([1])
+    assert len(entity._cache.cached) == 3
+    entity.set_value(5.0)
+    assert len(entity._cache.cached) == 0
+    assert np.allclose(entity.get_array(4, scale=2.0), 10.0)
+
+
+def test_cache_handler_lru_eviction():
+    entity = _make_cached_class(max_entries=2)()
+    entity.get_array(1)
+    entity.get_array(2)
+    entity.get_array(1)
+    entity.get_array(3)
+    # 2 is the least recently used entry
+    assert [identifier.args for identifier in entity._cache.cached] == [(1,), (3,)]
+    calls = entity.calls
+    entity.get_array(1)
+    assert entity.calls == calls
+
+
+def test_cache_handler_byte_budget():
+    entity = _make_cached_class(max_bytes=8 * 100)()
+    entity.get_array(60)
+    entity.get_array(30)
+    assert entity._cache.nbytes == 8 * 90
+    entity.get_array(20)
+    assert entity._cache.nbytes == 8 * 50
+    assert [identifier.args for identifier in entity._cache.cached] == [(30,), (20,)]
+    # Results larger than the budget are not cached
+    entity.get_array(200)
+    assert entity._cache.nbytes == 8 * 50
+
+
+def test_cache_handler_thread_safe():
+    entity = _make_cached_class(max_entries=16)()
+
+    def worker():
+        for i in range(200):
+            assert np.allclose(entity.get_array(i % 32), 1.0)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(entity._cache.cached) <= 16
+    assert entity._cache.nbytes == sum(
+        _size * 8 for (_size,) in (identifier.args for identifier in entity._cache.cached)
+    )
+
+
+def test_read_cache_validated_by_size():
+    class ReadCacheEntity:
+        pass
+
+    entity = ReadCacheEntity()
+    server_data = {"values": np.arange(4.0)}
+    reads = []
+
+    def read():
+        reads.append(1)
+        return server_data["values"].copy()
+
+    def size():
+        return server_data["values"].size
+
+    statistics = CacheHandler.class_statistics("ReadCacheEntity")
+    enabled = misc.FIELD_DATA_CACHE
+    misc.FIELD_DATA_CACHE = True
+    try:
+        first = _cached_read(entity, "data", size, read)
+        second = _cached_read(entity, "data", size, read)
+        assert second is first
+        assert not first.flags.writeable
+        assert len(reads) == 1
+        server_data["values"] = np.arange(5.0)
+        assert _cached_read(entity, "data", size, read).size == 5
+        _invalidate_read_cache(entity)
+        _cached_read(entity, "data", size, read)
+        assert len(reads) == 3
+        assert (statistics.hits, statistics.misses, statistics.invalidations) == (1, 3, 1)
+    finally:
+        misc.FIELD_DATA_CACHE = enabled
+    _cached_read(entity, "data", size, read)
+    assert len(reads) == 4
+
+
+class _FakeDataSources:
+    def __init__(self, paths, upstreams=()):
+        self.paths = paths
+        self._upstreams = list(upstreams)
+
+    def _paths(self):
+        return self.paths
+
+
+def test_data_sources_signature(tmp_path):
+    from ansys.dpf.core.cache import _data_sources_signature, _signature_is_checked
+
+    cas = tmp_path / "file.cas"
+    dat = tmp_path / "file.dat"
+    mode = tmp_path / "file.mode"
+    for path in (cas, dat, mode):
+        path.write_bytes(b"0")
+    main = _FakeDataSources([("cas", str(cas))])
+    with_dat = _FakeDataSources([("cas", str(cas)), ("dat", str(dat))])
+    upstream = _FakeDataSources([("mode", str(mode))])
+    with_upstream = _FakeDataSources([("cas", str(cas))], [upstream])
+    signatures = [_data_sources_signature(ds) for ds in (main, with_dat, with_upstream)]
+    assert len(set(signatures)) == 3
+    assert all(_signature_is_checked(signature) for signature in signatures)
+
+    mode.write_bytes(b"01")
+    assert _data_sources_signature(with_upstream) != signatures[2]
+    remote = _FakeDataSources([("cas", str(cas))], [_FakeDataSources([("mode", "/remote")])])
+    assert not _signature_is_checked(_data_sources_signature(remote))
+    unknown = _FakeDataSources([("cas", str(cas))], [upstream])
+    unknown._upstreams = None
+    assert _data_sources_signature(unknown) is None
+    assert not _signature_is_checked(None)
+
+
+def test_result_cache_lru_byte_budget_and_files(tmp_path):
+    class FakeField:
+        size = 30
+
+    class FakeFieldsContainer:
+        def get_entries_and_label_spaces(self):
+            return [(FakeField(), {"time": 1})]
+
+    nbytes = 30 * 8
+    result_file = tmp_path / "file.rst"
+    result_file.write_bytes(b"0")
+    files = _FakeDataSources([("rst", str(result_file))])
+    cache = ResultCache(max_bytes=2 * nbytes)
+    evaluations = []
+
+    def evaluate():
+        evaluations.append(1)
+        return FakeFieldsContainer()
+
+    first = cache.get("a", evaluate, files)
+    assert cache.get("a", evaluate, files) is first
+    cache.get("b", evaluate, files)
+    cache.get("c", evaluate, files)
+    assert list(cache.cached) == ["b", "c"]
+    assert cache.nbytes == 2 * nbytes
+    cache.get("a", evaluate, files)
+    assert len(evaluations) == 4
+    statistics = cache.statistics
+    assert (statistics.hits, statistics.misses, statistics.evictions) == (1, 4, 2)
+    assert statistics.bytes_saved == nbytes
+
+    result_file.write_bytes(b"01")
+    cache.get("a", evaluate, files)
+    assert len(evaluations) == 5
+    assert statistics.invalidations == 2
+    assert list(cache.cached) == ["a"]
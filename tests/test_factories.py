@@ -58,6 +58,39 @@ def test_create_scalar_field():
     assert f.component_count == 1
 
 
+def test_fields_from_arrays(server_type_remote_process):
+    arrays = [np.random.rand(100, 3), np.random.rand(50), np.random.rand(20, 6)]
+    fields = fields_factory.fields_from_arrays(arrays, server=server_type_remote_process)
+    assert [f.component_count for f in fields] == [3, 1, 6]
+    for field, arr in zip(fields, arrays):
+        assert np.allclose(field.data, arr)
+        assert np.allclose(field.scoping.ids, np.arange(1, len(arr) + 1))
+    with pytest.raises(ValueError):
+        fields_factory.fields_from_arrays([np.zeros((2, 4))], server=server_type_remote_process)
+
+
+@pytest.mark.slow
+def test_benchmark_fields_from_arrays_parallel_upload(server_type_legacy_grpc):
+    import time
+
+    arrays = [np.random.rand(2_000_000, 3) for _ in range(4)]
+    start = time.perf_counter()
+    sequential = fields_factory.fields_from_arrays(
+        arrays, server=server_type_legacy_grpc, max_workers=1
+    )
+    sequential_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = fields_factory.fields_from_arrays(arrays, server=server_type_legacy_grpc)
+    parallel_time = time.perf_counter() - start
+    n_bytes = sum(arr.nbytes for arr in arrays)
+    print(
+        f"\nUpload of {n_bytes / 1e6:.0f} MB: "
+        f"sequential {n_bytes / 1e6 / sequential_time:.0f} MB/s, "
+        f"parallel {n_bytes / 1e6 / parallel_time:.0f} MB/s"
+    )
+    assert np.allclose(sequential[-1].data, parallel[-1].data)
+
+
 def _vector_comparison(f):
     assert f is not None
     assert f.component_count == 3
@@ -641,6 +641,86 @@ def test_local_field_append(server_type_remote_process):
     assert len(field_to_local.entity_data_offsets) == 0
 
 
+def test_append_many_field(server_type):
+    num_entities = 400
+    field = dpf.core.fields_factory.create_3d_vector_field(num_entities, server=server_type)
+    for i in range(1, 3):
+        field.append([0.1 * i, 0.2 * i, 0.3 * i], i)
+    ids = np.arange(3, num_entities + 1)
+    data = np.outer(ids, [0.1, 0.2, 0.3])
+    field.append_many(ids, data)
+    expected = np.outer(np.arange(1, num_entities + 1), [0.1, 0.2, 0.3])
+    assert np.allclose(field.data, expected)
+    assert np.allclose(field.scoping.ids, np.arange(1, num_entities + 1))
+    assert len(field.entity_data_offsets) == 0
+
+
+def test_append_many_twice_elemental_nodal_field(server_type):
+    field = dpf.core.fields_factory.create_3d_vector_field(
+        10, location=dpf.core.locations.elemental_nodal, server=server_type
+    )
+    expected = dpf.core.fields_factory.create_3d_vector_field(
+        10, location=dpf.core.locations.elemental_nodal, server=server_type
+    )
+    for ids in ([1, 2, 3], [4, 5]):
+        entities = [[[0.1 * i, 0.2 * i, 0.3 * i]] * (1 + i % 3) for i in ids]
+        field.append_many(ids, entities)
+        for i, entity in zip(ids, entities):
+            expected.append(entity, i)
+    assert np.allclose(field.data, expected.data)
+    assert np.allclose(field.scoping.ids, [1, 2, 3, 4, 5])
+    assert np.allclose(field.entity_data_offsets, expected.entity_data_offsets)
+
+
+def test_append_buffer_elemental_nodal_field(server_type):
+    num_entities = 100
+    field = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, location=dpf.core.locations.elemental_nodal, server=server_type
+    )
+    expected = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, location=dpf.core.locations.elemental_nodal, server=server_type
+    )
+    with field.append_buffer() as buffer:
+        for i in range(1, num_entities + 1):
+            entity = [[0.1 * i, 0.2 * i, 0.3 * i]] * (1 + i % 3)
+            buffer.append(entity, i)
+            expected.append(entity, i)
+        assert len(field.scoping.ids) == 0
+    assert np.allclose(field.data, expected.data)
+    assert np.allclose(field.scoping.ids, expected.scoping.ids)
+    assert np.allclose(field.entity_data_offsets, expected.entity_data_offsets)
+    for i in range(num_entities):
+        assert np.allclose(field.get_entity_data(i), expected.get_entity_data(i))
+
+
+def test_field_data_cache(server_type_remote_process):
+    from ansys.dpf.core.cache import CacheHandler
+
+    field = dpf.core.fields_factory.create_3d_vector_field(10, server=server_type_remote_process)
+    field.append_many(np.arange(1, 11), np.random.rand(10, 3))
+    statistics = CacheHandler.class_statistics("Field")
+    dpf.core.settings.set_field_data_cache(True)
+    try:
+        hits = statistics.hits
+        data = field.data
+        assert field.data is data
+        assert field.scoping is field.scoping
+        assert statistics.hits - hits >= 2
+        with pytest.raises(ValueError):
+            data[0, 0] = 1.0
+        new_data = np.ones((10, 3))
+        field.data = new_data
+        assert np.allclose(field.data, new_data)
+        with field.as_local_field() as f:
+            f.data[0, 0] = 2.0
+        assert field.data[0, 0] == 2.0
+        field.append([3.0, 3.0, 3.0], 11)
+        assert field.data.shape == (11, 3)
+        assert list(field.scoping.ids)[-1] == 11
+    finally:
+        dpf.core.settings.set_field_data_cache(False)
+
+
 def test_local_elemental_nodal_field_append(server_type_remote_process):
     num_entities = 100
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(
@@ -913,6 +993,322 @@ def test_empty_data_field(server_type):
     assert len(field_to_local.data) == 0
 
 
+def test_local_field_data_in_place_update(server_type_remote_process):
+    num_entities = 100
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, server=server_type_remote_process
+    )
+    field_to_local.data = np.zeros((num_entities, 3))
+    field_to_local.scoping.ids = range(1, num_entities + 1)
+    with field_to_local.as_local_field() as f:
+        data = f.data
+        data[:, 0] = np.arange(num_entities)
+        f.get_entity_data(1)[0, 1] = 5.0
+        assert np.shares_memory(data, f.data)
+        assert hasattr(f, "_is_set") is False
+    expected = np.zeros((num_entities, 3))
+    expected[:, 0] = np.arange(num_entities)
+    expected[1, 1] = 5.0
+    assert np.allclose(field_to_local.data, expected)
+
+
+def test_local_field_read_only_is_not_sent_back(server_type_remote_process, monkeypatch):
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        10, server=server_type_remote_process
+    )
+    field_to_local.data = np.ones((10, 3))
+    uploads = []
+    set_data = dpf.core.Field._set_data
+
+    def counting_set_data(self, data):
+        uploads.append(len(data))
+        return set_data(self, data)
+
+    monkeypatch.setattr(dpf.core.Field, "_set_data", counting_set_data)
+    with field_to_local.as_local_field() as f:
+        assert np.allclose(f.data, 1.0)
+        assert np.allclose(f.get_entity_data(2), 1.0)
+    assert uploads == []
+    with field_to_local.as_local_field() as f:
+        f.data[0, 0] = 2.0
+    assert len(uploads) == 1
+    assert field_to_local.data[0, 0] == 2.0
+
+
+def test_local_buffer_amortized_growth():
+    from ansys.dpf.core.field_base import _LocalBuffer
+
+    buffer = _LocalBuffer([], np.float64)
+    capacities = set()
+    for i in range(1000):
+        buffer.extend([i, i, i])
+        capacities.add(buffer._array.size)
+    assert len(buffer) == 3000
+    assert np.allclose(buffer.view.reshape(-1, 3)[:, 0], np.arange(1000))
+    # Doubling capacity keeps the number of reallocations logarithmic
+    assert len(capacities) < 15
+
+
+@pytest.mark.slow
+def test_benchmark_local_field_buffer_vs_list(server_type_remote_process):
+    import time
+    import tracemalloc
+
+    num_entities = 200_000
+    field = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, server=server_type_remote_process
+    )
+    field.data = np.random.rand(num_entities, 3)
+    field.scoping.ids = range(1, num_entities + 1)
+    new_ids = range(num_entities + 1, num_entities + 1001)
+
+    # Local field mode with Python lists, as as_local_field() used to work
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = field.data_as_list
+    ids = list(field.scoping.ids)
+    for i in new_ids:
+        data.extend([0.1 * i, 0.2 * i, 0.3 * i])
+        ids.append(i)
+    for _ in range(10):
+        _ = np.array(data).reshape(-1, 3)
+    field.data = data
+    field.scoping.ids = ids
+    list_time = time.perf_counter() - start
+    _, list_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data, ids
+
+    field.data = np.random.rand(num_entities, 3)
+    field.scoping.ids = range(1, num_entities + 1)
+    # Local field mode with NumPy buffers
+    tracemalloc.start()
+    start = time.perf_counter()
+    with field.as_local_field() as f:
+        for i in new_ids:
+            f.append([0.1 * i, 0.2 * i, 0.3 * i], i)
+        for _ in range(10):
+            _ = f.data
+    buffer_time = time.perf_counter() - start
+    _, buffer_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert field.data.shape == (num_entities + len(new_ids), 3)
+
+    start = time.perf_counter()
+    with field.as_local_field() as f:
+        _ = f.data
+    read_only_time = time.perf_counter() - start
+    print(
+        f"\nLocal field of {num_entities} entities, 1000 appends and 10 reads: "
+        f"lists {list_time:.3f}s {list_peak / 1e6:.1f} MB, "
+        f"buffers {buffer_time:.3f}s {buffer_peak / 1e6:.1f} MB, "
+        f"read-only block {read_only_time:.3f}s"
+    )
+
+
+def test_copy_data_to_memmap(server_type, tmp_path):
+    field = dpf.core.fields_factory.create_3d_vector_field(100, server=server_type)
+    field.data = np.arange(300, dtype=np.float64).reshape(100, 3)
+    out = np.memmap(tmp_path / "data.bin", dtype=np.float64, mode="w+", shape=field.shape)
+    data = field.copy_data_to(out)
+    assert data.shape == (100, 3)
+    assert np.shares_memory(data, out)
+    assert np.allclose(out, field.data)
+    with pytest.raises(ValueError, match="holds 3 values"):
+        field.copy_data_to(np.empty(3))
+    with pytest.raises(TypeError):
+        field.copy_data_to(np.empty(300, dtype=np.float32))
+
+
+class _FakeStreamService:
+    def __init__(self, data, n_chunks):
+        self._chunks = np.array_split(data, n_chunks)
+        self._size = data.nbytes
+
+    def initial_metadata(self):
+        class _Metadata:
+            key = "size_tot"
+            value = str(self._size)
+
+        return [_Metadata()]
+
+    def __iter__(self):
+        for chunk in self._chunks:
+
+            class _Chunk:
+                array = chunk.tobytes()
+
+            yield _Chunk()
+
+
+def test_data_get_chunk_into_destination():
+    from ansys.dpf.gate import grpc_stream_helpers
+
+    data = np.random.rand(1000)
+    out = np.zeros(1200)
+    received = grpc_stream_helpers._data_get_chunk_(
+        np.float64, _FakeStreamService(data, 7), out=out
+    )
+    assert np.shares_memory(received, out)
+    assert np.allclose(received, data)
+    assert np.allclose(out[1000:], 0.0)
+    as_list = grpc_stream_helpers._data_get_chunk_(
+        np.int32, _FakeStreamService(np.arange(10, dtype=np.int32), 3), np_array=False
+    )
+    assert as_list == list(range(10))
+
+
+def test_data_get_chunk_single_precision_into_double_destination():
+    from ansys.dpf.gate import grpc_stream_helpers
+
+    data = np.random.rand(1000).astype(np.float32)
+    out = np.zeros(1000)
+    received = grpc_stream_helpers._data_get_chunk_(
+        np.float32, _FakeStreamService(data, 7), out=out
+    )
+    assert np.shares_memory(received, out)
+    assert received.dtype == np.float64
+    assert np.array_equal(received, data.astype(np.float64))
+    with pytest.raises(TypeError):
+        grpc_stream_helpers._data_get_chunk_(
+            np.float64, _FakeStreamService(data.astype(np.float64), 3), out=data
+        )
+
+
+class _StandInStreamRequest:
+    array = b""
+
+
+def test_data_chunk_yielder_chunks_from_itemsize():
+    from ansys.dpf.gate import grpc_stream_helpers
+
+    data = np.random.rand(1050)
+    chunks = [
+        request.array
+        for request in grpc_stream_helpers._data_chunk_yielder(
+            _StandInStreamRequest(), data, chunk_size=800
+        )
+    ]
+    # 800 bytes hold 100 doubles
+    assert [len(chunk) for chunk in chunks] == [800] * 10 + [400]
+    assert b"".join(chunks) == data.tobytes()
+    # Non contiguous arrays and bytes are also streamed
+    chunks = [
+        request.array
+        for request in grpc_stream_helpers._data_chunk_yielder(
+            _StandInStreamRequest(), data.reshape(-1, 3)[:, 0], chunk_size=100
+        )
+    ]
+    assert b"".join(chunks) == np.ascontiguousarray(data.reshape(-1, 3)[:, 0]).tobytes()
+    chunks = [
+        request.array
+        for request in grpc_stream_helpers._data_chunk_yielder(
+            _StandInStreamRequest(), b"abcdefg", chunk_size=3
+        )
+    ]
+    assert chunks == [b"abc", b"def", b"g"]
+
+
+@pytest.mark.slow
+def test_benchmark_data_chunk_yielder_throughput():
+    import time
+
+    from ansys.dpf.gate import grpc_stream_helpers
+
+    data = np.random.rand(25_000_000)
+    start = time.perf_counter()
+    # Stand-in for the server: consume the stream and count the received bytes
+    received = sum(
+        len(request.array)
+        for request in grpc_stream_helpers._data_chunk_yielder(
+            _StandInStreamRequest(), data, chunk_size=524288
+        )
+    )
+    elapsed = time.perf_counter() - start
+    assert received == data.nbytes
+    print(
+        f"\nStreamed {received / 1e6:.0f} MB in {elapsed:.3f} s "
+        f"({received / 1e6 / elapsed:.0f} MB/s)"
+    )
+
+
+def test_stream_type_and_compression_options():
+    from ansys.dpf.gate import grpc_stream_helpers
+    import grpc
+
+    assert grpc_stream_helpers._stream_type() == ("double", np.float64)
+    assert grpc_stream_helpers._stream_type(np.float32) == ("float", np.float32)
+    dpf.core.settings.set_stream_compression("gzip")
+    try:
+        assert grpc_stream_helpers._stream_options() == {"compression": grpc.Compression.Gzip}
+    finally:
+        dpf.core.settings.set_stream_compression(None)
+    assert grpc_stream_helpers._stream_options() == {}
+    with pytest.raises(ValueError):
+        dpf.core.settings.set_stream_compression("zip")
+
+
+def test_get_data_single_precision(server_type):
+    field = dpf.core.fields_factory.create_3d_vector_field(100, server=server_type)
+    field.data = np.random.rand(100, 3)
+    data = field.get_data(dtype=np.float32)
+    assert data.dtype == np.float32
+    assert data.shape == (100, 3)
+    assert np.allclose(data, field.data, rtol=1e-6)
+    assert field.get_data().dtype == np.float64
+    with pytest.raises(ValueError):
+        field.get_data(dtype=np.int32)
+
+
+@pytest.mark.slow
+def test_benchmark_reduced_precision_and_compressed_streams(server_type_remote_process):
+    import time
+    import zlib
+
+    from ansys.dpf.gate import grpc_stream_helpers
+
+    # Stand-in server: bytes on the wire for double, float and compressed chunks
+    data = np.cumsum(np.random.rand(5_000_000))
+    for name, values in (("float64", data), ("float32", data.astype(np.float32))):
+        start = time.perf_counter()
+        received = grpc_stream_helpers._data_get_chunk_(
+            values.dtype, _FakeStreamService(values, 65536)
+        )
+        elapsed = time.perf_counter() - start
+        assert received.size == data.size
+        print(f"\nStand-in {name}: {values.nbytes / 1e6:.0f} MB on the wire in {elapsed:.3f} s")
+    start = time.perf_counter()
+    compressed = sum(
+        len(zlib.compress(request.array))
+        for request in grpc_stream_helpers._data_chunk_yielder(_StandInStreamRequest(), data)
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"Stand-in gzip: {compressed / 1e6:.0f} MB on the wire instead of "
+        f"{data.nbytes / 1e6:.0f} MB, compressed in {elapsed:.3f} s"
+    )
+
+    # Local server: end-to-end time of the retrieval
+    field = dpf.core.fields_factory.create_scalar_field(
+        data.size, server=server_type_remote_process
+    )
+    field.data = data
+    for dtype in (np.float64, np.float32):
+        start = time.perf_counter()
+        field.get_data(dtype=dtype)
+        elapsed = time.perf_counter() - start
+        print(f"Local server {np.dtype(dtype).name}: retrieved in {elapsed:.3f} s")
+    for compression in (None, "gzip"):
+        dpf.core.settings.set_stream_compression(compression)
+        try:
+            start = time.perf_counter()
+            field.data = data
+            elapsed = time.perf_counter() - start
+        finally:
+            dpf.core.settings.set_stream_compression(None)
+        print(f"Local server upload with compression {compression}: {elapsed:.3f} s")
+
+
 def test_set_data_numpy_array_field(server_type):
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(100, server=server_type)
     arr = np.arange(300, dtype=np.int32).reshape(100, 3)
@@ -1440,3 +1836,30 @@ def test_deep_copy_field_with_dimensionless_unit(server_type):
     assert my_field_copy is not None
     assert my_field_copy.unit == my_field.unit
     assert my_field_copy.unit == (Homogeneity.dimensionless, "some_units")
+
+
+@pytest.mark.slow
+def test_benchmark_append_many_vs_append(server_type_remote_process):
+    import time
+
+    num_entities = 5_000
+    ids = np.arange(1, num_entities + 1)
+    data = np.random.rand(num_entities, 3)
+    field = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, server=server_type_remote_process
+    )
+    start = time.perf_counter()
+    for i in range(num_entities):
+        field.append(data[i], int(ids[i]))
+    append_time = time.perf_counter() - start
+    field_many = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, server=server_type_remote_process
+    )
+    start = time.perf_counter()
+    field_many.append_many(ids, data)
+    append_many_time = time.perf_counter() - start
+    print(
+        f"\nAppending {num_entities} entities: append {append_time:.3f}s, "
+        f"append_many {append_many_time:.3f}s"
+    )
+    assert np.allclose(field.data, field_many.data)
@@ -710,3 +710,215 @@ def test_get_entries_indices_fields_container(server_type):
     assert np.allclose(fc.get_entries_indices({"time": 1, "complex": 0}), [0])
     assert np.allclose(fc.get_entries_indices({"time": 2}), [1])
     assert np.allclose(fc.get_entries_indices({"complex": 0}), range(0, 20))
+
+
+def test_get_entries_and_label_spaces_fields_container(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex"]
+    for i in range(0, 20):
+        mscop = {"time": i + 1, "complex": i % 2}
+        fc.add_field(mscop, Field(nentities=i + 10, server=server_type))
+    entries = fc.get_entries_and_label_spaces()
+    assert len(entries) == 20
+    for i, (field, label_space) in enumerate(entries):
+        assert isinstance(field, Field)
+        assert field.size == fc.get_field(i).size
+        assert label_space == fc.get_label_space(i)
+    assert [field.size for field in fc] == [field.size for field, _ in entries]
+    assert FieldsContainer(server=server_type).get_entries_and_label_spaces() == []
+
+
+def test_fields_container_next(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time"]
+    for i in range(0, 3):
+        fc.add_field({"time": i + 1}, Field(nentities=i + 1, server=server_type))
+    assert next(fc).size == 1
+    assert next(fc).size == 2
+    assert next(fc).size == 3
+    with pytest.raises(StopIteration):
+        next(fc)
+    # iterating over the collection restarts the iteration with next
+    assert [field.size for field in fc] == [1, 2, 3]
+    assert next(fc).size == 1
+
+
+def test_fields_container_get_data_single_precision(allkindofcomplexity):
+    model = dpf.Model(allkindofcomplexity)
+    stress = model.results.stress
+    fc = stress.eval()
+    fc_single = stress.eval(dtype=np.float32)
+    data = fc.get_data()
+    data_single = fc_single.get_data()
+    assert len(data) == len(data_single) == len(fc)
+    for double, single in zip(data, data_single):
+        assert single.dtype == np.float32
+        assert single.shape == double.shape
+        assert np.allclose(single, double, rtol=1e-6)
+    assert fc_single[0].data.dtype == np.float32
+    assert fc.get_data(dtype=np.float32)[0].dtype == np.float32
+    with pytest.raises(ValueError):
+        fc.get_data(dtype=np.int32)
+
+
+@pytest.mark.slow
+def test_benchmark_fields_container_iteration(server_type):
+    import time
+
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time"]
+    for i in range(0, 500):
+        fc.add_field({"time": i + 1}, Field(nentities=1, server=server_type))
+
+    start = time.perf_counter()
+    per_entry = [(fc[i], fc.get_label_space(i)) for i in range(len(fc))]
+    per_entry_time = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = fc.get_entries_and_label_spaces()
+    batched_time = time.perf_counter() - start
+    assert [label_space for _, label_space in batched] == [ls for _, ls in per_entry]
+    print(f"\n{len(fc)} entries: per entry {per_entry_time:.3f}s, batched {batched_time:.3f}s")
+
+
+def test_fields_container_label_space_index(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex"]
+    for i in range(0, 10):
+        fc.add_field(
+            {"time": i // 2 + 1, "complex": i % 2}, Field(nentities=i + 1, server=server_type)
+        )
+    assert [f.size for f in fc.get_fields({"time": 2})] == [3, 4]
+    assert [f.size for f in fc.get_fields({"complex": 1})] == [2, 4, 6, 8, 10]
+    assert fc.get_field({"time": 3, "complex": 0}).size == 5
+    assert fc.get_fields({"time": 10}) == []
+    assert fc._label_index is not None
+    assert fc.get_label_space(3) == {"time": 2, "complex": 1}
+
+    other = FieldsContainer(fields_container=fc, server=server_type)
+    assert other.get_fields({"time": 6}) == []
+
+    # adding entries or labels drops the index
+    fc.add_field({"time": 6, "complex": 0}, Field(nentities=20, server=server_type))
+    assert fc._label_index is None
+    # another object of the same collection sees the new entry
+    assert [f.size for f in other.get_fields({"time": 6})] == [20]
+    assert fc.get_field({"time": 6, "complex": 0}).size == 20
+    fc.add_label("body", 1)
+    assert fc._label_index is None
+    assert len(fc.get_fields({"body": 1})) == 11
+
+
+def test_fields_container_label_spaces_legacy_grpc(server_type_legacy_grpc):
+    server = server_type_legacy_grpc
+    fc = FieldsContainer(server=server)
+    fc.labels = ["time", "complex"]
+    for i in range(0, 6):
+        fc.add_field({"time": i // 2 + 1, "complex": i % 2}, Field(nentities=i + 1, server=server))
+    # the label spaces are retrieved in one request and the entries returned with them released
+    assert fc._api.collection_get_label_spaces(fc) == [fc.get_label_space(i) for i in range(6)]
+    assert [f.size for f in fc.get_fields({"time": 2})] == [3, 4]
+    assert fc.get_field({"time": 3, "complex": 1}).size == 6
+    assert [f.size for f in fc.get_fields_by_time_complex_ids(timeid=1)] == [1, 2]
+    assert [f.size for f in fc] == list(range(1, 7))
+    assert len(fc.get_entries_and_label_spaces()) == 6
+
+
+@pytest.mark.slow
+def test_benchmark_fields_container_label_space_index(server_type):
+    import time
+
+    from ansys.dpf.core.label_space import LabelSpace
+
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex", "body"]
+    for time_id in range(1, 101):
+        for complex_id in range(0, 2):
+            for body in range(1, 51):
+                label_space = {"time": time_id, "complex": complex_id, "body": body}
+                fc.add_field(label_space, Field(nentities=1, server=server_type))
+    queries = [{"time": time_id, "complex": 1} for time_id in range(1, 101)]
+
+    start = time.perf_counter()
+    server_counts = [
+        fc._api.collection_get_num_obj_for_label_space(
+            fc, LabelSpace(label_space=query, obj=fc, server=server_type)
+        )
+        for query in queries
+    ]
+    server_time = time.perf_counter() - start
+    start = time.perf_counter()
+    index_counts = [len(fc._get_label_index().indices(query)) for query in queries]
+    index_time = time.perf_counter() - start
+    assert index_counts == server_counts == [50] * len(queries)
+    print(
+        f"\n{len(fc)} entries, {len(queries)} queries: "
+        f"server {server_time:.3f}s, index (with build) {index_time:.3f}s"
+    )
+
+
+def test_fields_container_to_numpy(server_type, tmp_path):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex"]
+    for time_id, ids in [(2, [3, 1]), (1, [1, 2, 3])]:
+        for complex_id in range(0, 2):
+            f = fields_factory.create_3d_vector_field(len(ids), server=server_type)
+            f.scoping.ids = ids
+            f.data = [[10 * complex_id + entity_id] * 3 for entity_id in ids]
+            fc.add_field({"time": time_id, "complex": complex_id}, f)
+
+    with pytest.raises(ValueError, match="label_space"):
+        fc.to_numpy()
+    data, time_ids, ids = fc.to_numpy(label_space={"complex": 0})
+    assert data.shape == (2, 3, 3)
+    assert time_ids.tolist() == [1, 2]
+    assert ids.tolist() == [1, 2, 3]
+    assert np.allclose(data[0], [[1] * 3, [2] * 3, [3] * 3])
+    assert np.allclose(data[1, [0, 2]], [[1] * 3, [3] * 3])
+    assert np.isnan(data[1, 1]).all()
+
+    scoping = dpf.Scoping(ids=[3, 4], location=dpf.locations.nodal, server=server_type)
+    data, _, ids = fc.to_numpy(align_to=scoping, label_space={"complex": 1}, dtype=np.float32)
+    assert data.dtype == np.float32
+    assert ids.tolist() == [3, 4]
+    assert np.allclose(data[:, 0], 13)
+    assert np.isnan(data[:, 1]).all()
+
+    out = np.memmap(tmp_path / "dense.dat", dtype=np.float64, mode="w+", shape=(2, 3, 3))
+    data, _, _ = fc.to_numpy(align_to=[1, 2, 3], label_space={"complex": 0}, out=out)
+    assert data is out
+    assert np.allclose(out[0, :, 0], [1, 2, 3])
+    with pytest.raises(ValueError, match="shape"):
+        fc.to_numpy(label_space={"complex": 0}, out=np.empty((1, 3, 3)))
+    with pytest.raises(ValueError, match="no label"):
+        fc.to_numpy(label="body")
+
+
+@pytest.mark.slow
+def test_benchmark_fields_container_to_numpy(server_type):
+    import time
+
+    n_times, n_nodes = 200, 10000
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time"]
+    node_ids = np.arange(1, n_nodes + 1)
+    for time_id in range(1, n_times + 1):
+        f = fields_factory.create_3d_vector_field(n_nodes, server=server_type)
+        f.scoping.ids = node_ids[::-1] if time_id % 2 else node_ids
+        f.data = np.random.rand(n_nodes, 3)
+        fc.add_field({"time": time_id}, f)
+
+    start = time.perf_counter()
+    by_hand = np.empty((n_times, n_nodes, 3))
+    for i, f in enumerate(fc):
+        index = {entity_id: row for row, entity_id in enumerate(f.scoping.ids)}
+        rows = [index[entity_id] for entity_id in node_ids]
+        by_hand[i] = f.data[rows]
+    by_hand_time = time.perf_counter() - start
+    start = time.perf_counter()
+    data, _, _ = fc.to_numpy(align_to=node_ids)
+    to_numpy_time = time.perf_counter() - start
+    assert np.allclose(data, by_hand)
+    print(
+        f"\n{n_times} fields of {n_nodes} nodes: "
+        f"by hand {by_hand_time:.3f}s, to_numpy {to_numpy_time:.3f}s"
+    )
@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 import numpy as np
+import pytest
 
 from ansys.dpf import core
 from ansys.dpf.core import common
@@ -154,7 +155,85 @@ def test_incremental_estimation(server_type, plate_msup):
     (start_op, end_op) = create_wf()
 
     helper = core.IncrementalHelper(start_op, end_op, scoping, scoping_pin=0)
-    # 9432 bytes per output according to the heuristic for this plate_msup example
+    # 393 nodes with 3 doubles and one int32 id: 11004 bytes per output for this plate_msup example
     chunk_size = helper.estimate_size(max_bytes=50 * 1024)
 
-    assert chunk_size == 5
+    assert chunk_size == 4
+    statistics = helper.statistics
+    assert [chunk.num_ids for chunk in statistics.chunks] == [1, 4]
+    assert statistics.bytes_per_id == 11004
+    assert statistics.peak_bytes == 4 * 11004 <= 50 * 1024
+    assert statistics.chunk_size == 4
+
+
+def test_incremental_estimation_elemental_nodal_budget(server_type, allkindofcomplexity):
+    ds = core.DataSources(allkindofcomplexity, server=server_type)
+    model = core.Model(ds, server=server_type)
+    mesh_scoping = model.metadata.meshed_region.elements.scoping
+
+    start_op = core.operators.result.stress(
+        data_sources=ds, mesh_scoping=mesh_scoping, server=server_type
+    )
+    end_op = core.Operator("incremental::merge::fields_container", server=server_type)
+    end_op.connect(0, start_op, 0)
+
+    helper = core.IncrementalHelper(start_op, end_op, mesh_scoping, scoping_pin=1)
+    max_bytes = 200 * 1024
+    chunk_size = helper.estimate_size(max_bytes=max_bytes, max_calibrations=3)
+    measured = helper.statistics.chunks[-1]
+    assert 1 <= chunk_size <= mesh_scoping.size
+    # The estimation is calibrated on whole chunks of elements of different types
+    assert measured.nbytes / measured.num_ids * chunk_size <= max_bytes
+    assert all(chunk.seconds >= 0 for chunk in helper.statistics.chunks)
+
+
+def test_incremental_statistics():
+    from ansys.dpf.core.incremental import ChunkStatistics, IncrementalStatistics
+
+    statistics = IncrementalStatistics()
+    assert statistics.peak_bytes == 0
+    assert statistics.bytes_per_id == 0.0
+    statistics.chunks = [ChunkStatistics(1, 100, 0.5), ChunkStatistics(10, 800, 2.0)]
+    statistics.chunk_size = 10
+    assert statistics.peak_bytes == 800
+    assert statistics.bytes_per_id == 80.0
+    assert statistics.seconds_per_id == 0.2
+    assert "chunk_size: 10" in str(statistics)
+
+
+def test_incremental_stream(server_type, plate_msup):
+    ds = core.DataSources(plate_msup, server=server_type)
+    scoping = core.time_freq_scoping_factory.scoping_on_all_time_freqs(ds)
+    res_op = core.operators.result.displacement(
+        data_sources=ds, time_scoping=scoping, server=server_type
+    )
+    ref_fc = res_op.get_output(0, core.types.fields_container)
+
+    streamed_ids = []
+    num_chunks = 0
+    for fc in core.split_workflow_in_chunks(res_op, None, scoping, chunk_size=5, stream=True):
+        num_chunks += 1
+        assert len(fc) <= 5
+        for id in fc.get_time_scoping().ids:
+            streamed_ids.append(id)
+            assert np.isclose(
+                fc.get_field_by_time_id(id).data, ref_fc.get_field_by_time_id(id).data
+            ).all()
+    assert num_chunks == -(-len(scoping.ids) // 5)
+    assert streamed_ids == list(ref_fc.get_time_scoping().ids)
+
+    with pytest.raises(ValueError):
+        core.split_workflow_in_chunks(res_op, None, scoping, chunk_size=5)
+
+    # the operators after the first one are evaluated for each chunk
+    norm_op = core.operators.math.norm_fc(res_op, server=server_type)
+    ref_norm = core.operators.math.norm_fc(ref_fc, server=server_type).outputs.fields_container()
+    streamed_ids = []
+    for fc in core.split_workflow_in_chunks(res_op, norm_op, scoping, chunk_size=5, stream=True):
+        assert len(fc) <= 5
+        for id in fc.get_time_scoping().ids:
+            streamed_ids.append(id)
+            field = fc.get_field_by_time_id(id)
+            assert field.component_count == 1
+            assert np.allclose(field.data, ref_norm.get_field_by_time_id(id).data)
+    assert streamed_ids == list(ref_fc.get_time_scoping().ids)
@@ -0,0 +1,72 @@
+# Copyright (C) 2020 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+
+import pytest
+
+from ansys.dpf import core as dpf
+
+_COUNT_LOADED_OPERATORS = (
+    "import sys, ansys.dpf.core; "
+    "print(len([m for m in sys.modules if m.startswith('ansys.dpf.core.operators.')]))"
+)
+
+
+def test_import_does_not_load_operator_modules():
+    out = subprocess.run(
+        [sys.executable, "-c", _COUNT_LOADED_OPERATORS], capture_output=True, text=True, check=True
+    )
+    # only the lazy index and the few operators used by the core modules are imported
+    assert int(out.stdout) < 50
+
+
+def test_lazy_operator_access():
+    from ansys.dpf.core.operators.math.scale import scale
+    import ansys.dpf.core.operators.math as math
+
+    assert dpf.operators.math.add.__name__ == "add"
+    assert isinstance(dpf.operators.math.add, type)
+    assert math.scale is scale
+    assert "norm" in dir(math)
+    assert "norm" in math.__all__
+    assert not hasattr(math, "not_an_operator")
+    with pytest.raises(AttributeError):
+        dpf.operators.not_a_category
+
+
+@pytest.mark.slow
+def test_benchmark_import_time():
+    code = (
+        "import time; start = time.perf_counter(); import ansys.dpf.core; "
+        "print(time.perf_counter() - start)"
+    )
+    times = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(3)
+    ]
+    print(f"\nimport ansys.dpf.core: best of 3 {min(times):.3f}s")
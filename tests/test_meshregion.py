@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
+
 import numpy as np
 import pytest
 import vtk
@@ -109,6 +111,41 @@ def test_get_element_meshedregion(simple_bar_model):
     assert node.coordinates == [0.1, 1.6, 0.1]
 
 
+def test_elements_as_arrays_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    elements = mesh.elements
+    arrays = elements.as_arrays()
+    assert len(arrays) == len(elements)
+    assert np.array_equal(arrays.ids, elements.scoping.ids)
+    assert np.array_equal(arrays.types, elements.element_types_field.data)
+    assert arrays.offsets.size == len(arrays) + 1
+    assert arrays.offsets[-1] == arrays.connectivity.size
+    assert np.allclose(arrays.coordinates, mesh.nodes.coordinates_field.data)
+    for index in [0, 1, len(arrays) - 1]:
+        view = arrays[index]
+        el = mesh.elements.element_by_index(index)
+        assert view.id == el.id
+        assert view.index == el.index
+        assert view.type == el.type
+        assert view.shape == el.shape
+        assert view.n_nodes == el.n_nodes
+        assert view.node_ids == el.node_ids
+        assert view.connectivity == el.connectivity
+        assert np.allclose(
+            [node.coordinates for node in view.nodes], [node.coordinates for node in el.nodes]
+        )
+
+
+def test_iterate_and_slice_elements_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    elements = mesh.elements
+    ids = [el.id for el in elements]
+    assert np.array_equal(ids, elements.scoping.ids)
+    sliced = elements[2:10:2]
+    assert [el.index for el in sliced] == [2, 4, 6, 8]
+    assert [el.id for el in sliced] == ids[2:10:2]
+
+
 def test_get_coordinates_field_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     nodescoping = mesh.nodes.scoping
@@ -336,6 +373,42 @@ def test_id_indeces_mapping_on_elements_2(allkindofcomplexity, server_type):
         assert mapping[4520] == 2011
 
 
+def test_map_scoping_on_nodes_and_elements(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    mesh = model.metadata.meshed_region
+    for mesh_location, location in [
+        (mesh.nodes, dpf.core.locations.nodal),
+        (mesh.elements, dpf.core.locations.elemental),
+    ]:
+        mapping = mesh_location.mapping_id_to_index
+        ids = np.array(mesh_location.scoping.ids)[::-3]
+        ids = np.append(ids, [0, -1, ids.max() + 1])
+        external_scope = dpf.core.Scoping(ids=ids, location=location, server=server_type)
+        ind, mask = mesh_location.map_scoping(external_scope)
+        expected = [mapping.get(i) for i in ids]
+        assert ind.dtype == np.int32
+        assert mask.tolist() == [i is not None for i in expected]
+        assert ind.tolist() == [i for i in expected if i is not None]
+
+
+def test_id_to_index_map():
+    from ansys.dpf.core._mapping_helpers import IdToIndexMap
+
+    compact_ids = np.array([5, 3, 4, 3, 10])
+    sparse_ids = compact_ids * 10**8
+    for ids in [compact_ids, sparse_ids]:
+        id_to_index_map = IdToIndexMap(ids)
+        query = np.concatenate([ids, [0, -7, ids.max() + 1]])
+        ind, mask = id_to_index_map.map(query)
+        expected = {eid: i for i, eid in enumerate(ids)}
+        assert mask.tolist() == [i in expected for i in query]
+        assert ind.tolist() == [expected[i] for i in query if i in expected]
+    assert IdToIndexMap(compact_ids).is_dense
+    assert not IdToIndexMap(sparse_ids).is_dense
+    ind, mask = IdToIndexMap([]).map([1, 2])
+    assert ind.size == 0
+    assert not mask.any()
+
 
 def test_named_selection_mesh(allkindofcomplexity, server_type):
     model = dpf.core.Model(allkindofcomplexity, server=server_type)
@@ -527,6 +600,99 @@ def test_create_by_copy_meshed_region(server_type):
     assert len(el.nodes) == 4
 
 
+def _quad_grid_arrays(n):
+    """Return the arrays of a flat grid of n x n quadrangle shells."""
+    x, y = np.meshgrid(np.arange(n + 1, dtype=float), np.arange(n + 1, dtype=float))
+    coordinates = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+    node_ids = np.arange(1, coordinates.shape[0] + 1)
+    first = (np.arange(n)[:, None] * (n + 1) + np.arange(n)[None, :]).ravel()
+    connectivity = np.column_stack([first, first + 1, first + n + 2, first + n + 1])
+    element_ids = np.arange(1, connectivity.shape[0] + 1)
+    element_types = np.full(element_ids.size, dpf.core.element_types.Quad4.value)
+    return node_ids, coordinates, element_ids, element_types, connectivity
+
+
+def _mesh_from_adders(node_ids, coordinates, element_ids, connectivity, server):
+    mesh = dpf.core.MeshedRegion(
+        num_nodes=len(node_ids), num_elements=len(element_ids), server=server
+    )
+    for i, node in enumerate(mesh.nodes.add_nodes(len(node_ids))):
+        node.id = int(node_ids[i])
+        node.coordinates = coordinates[i]
+    for i, element in enumerate(mesh.elements.add_elements(len(element_ids))):
+        element.id = int(element_ids[i])
+        element.connectivity = connectivity[i].tolist()
+        element.is_shell = True
+    return mesh
+
+
+def test_create_meshed_region_from_arrays(server_type):
+    node_ids, coordinates, element_ids, element_types, connectivity = _quad_grid_arrays(3)
+    mesh = dpf.core.MeshedRegion.from_arrays(
+        node_ids, coordinates, element_ids, element_types, connectivity, server=server_type
+    )
+    ref_mesh = _mesh_from_adders(node_ids, coordinates, element_ids, connectivity, server_type)
+    assert mesh.nodes.n_nodes == ref_mesh.nodes.n_nodes == 16
+    assert mesh.elements.n_elements == ref_mesh.elements.n_elements == 9
+    assert np.array_equal(mesh.nodes.scoping.ids, ref_mesh.nodes.scoping.ids)
+    assert np.array_equal(mesh.elements.scoping.ids, ref_mesh.elements.scoping.ids)
+    assert np.allclose(mesh.nodes.coordinates_field.data, ref_mesh.nodes.coordinates_field.data)
+    assert np.array_equal(
+        mesh.elements.connectivities_field.data, ref_mesh.elements.connectivities_field.data
+    )
+    el = mesh.elements.element_by_id(5)
+    assert el.shape == "shell"
+    assert el.type == dpf.core.element_types.Quad4
+    assert el.connectivity == connectivity[4].tolist()
+    assert mesh.elements.has_shell_elements
+
+    # CSR offsets give the same mesh
+    offsets = np.arange(len(element_ids) + 1) * 4
+    mesh_csr = dpf.core.MeshedRegion.from_arrays(
+        node_ids,
+        coordinates,
+        element_ids,
+        element_types,
+        connectivity.ravel(),
+        offsets=offsets,
+        server=server_type,
+    )
+    assert np.array_equal(
+        mesh_csr.elements.connectivities_field.data, mesh.elements.connectivities_field.data
+    )
+
+    with pytest.raises(ValueError):
+        dpf.core.MeshedRegion.from_arrays(
+            node_ids, coordinates[:-1], element_ids, element_types, connectivity
+        )
+    with pytest.raises(ValueError):
+        dpf.core.MeshedRegion.from_arrays(
+            node_ids, coordinates, element_ids, element_types, connectivity.ravel()
+        )
+
+
+@pytest.mark.slow
+def test_benchmark_meshed_region_from_arrays_vs_adders(server_type):
+    node_ids, coordinates, element_ids, element_types, connectivity = _quad_grid_arrays(100)
+
+    start = time.perf_counter()
+    ref_mesh = _mesh_from_adders(node_ids, coordinates, element_ids, connectivity, server_type)
+    adders_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mesh = dpf.core.MeshedRegion.from_arrays(
+        node_ids, coordinates, element_ids, element_types, connectivity, server=server_type
+    )
+    from_arrays_time = time.perf_counter() - start
+
+    print(
+        f"{len(node_ids)} nodes, {len(element_ids)} elements: "
+        f"adders {adders_time:.3f}s, from_arrays {from_arrays_time:.3f}s"
+    )
+    assert mesh.nodes.n_nodes == ref_mesh.nodes.n_nodes
+    assert mesh.elements.n_elements == ref_mesh.elements.n_elements
+
+
 def test_has_element_shape_meshed_region(server_type):
     mesh = dpf.core.MeshedRegion(num_nodes=11, num_elements=4, server=server_type)
     # Any of those four calls make the second call to has_****_elements wrong when using InProcess
@@ -144,6 +144,73 @@ def test_result_not_overrided(plate_msup):
     assert len(model2.results) > len(model1.results)
 
 
+def test_results_created_on_access(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    results = model.results
+    assert "stress" in dir(results)
+    assert results._available == {}
+    stress = results.stress
+    assert results._available == {"stress": True}
+    assert isinstance(stress(), dpf.core.Operator)
+    assert "S" in type(results).stress.__doc__
+    assert "fields_container" in stress.__doc__
+    assert "Result" in dpf.core.results.Result.__doc__
+    assert len(results) == len(list(results))
+
+
+def test_result_eval_async_keeps_inputs_of_each_request(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    model.set_result_cache()
+    disp = model.results.displacement
+    first = disp.on_time_scoping([1]).eval_async()
+    second = disp.on_time_scoping([2]).eval_async()
+    assert list(first.result().get_label_scoping("time").ids) == [1]
+    assert list(second.result().get_label_scoping("time").ids) == [2]
+    expected = model.results.displacement.on_time_scoping([1]).eval()
+    assert np.allclose(first.result()[0].data, expected[0].data)
+    # the cache holds each request under its own inputs
+    assert disp.on_time_scoping([1]).eval() is first.result()
+
+
+def test_model_result_cache(plate_msup, tmp_path):
+    model = dpf.core.Model(plate_msup)
+    assert model.result_cache is None
+    model.set_result_cache(spill_directory=str(tmp_path))
+    stress = model.results.stress
+    first = stress.on_last_time_freq.eval()
+    assert stress.on_last_time_freq.eval() is first
+    assert stress.on_location(dpf.core.locations.nodal).eval() is not first
+    model.results.stress.on_time_scoping([1, 2]).eval()
+    statistics = model.result_cache.statistics
+    assert (statistics.hits, statistics.misses) == (1, 3)
+    assert statistics.bytes_saved > 0
+
+    # evicted results of local servers are spilled to disk and read back on their next hit
+    local = model._server.local_server
+    model.result_cache.max_bytes = 1
+    assert model.results.stress.on_time_scoping([2, 3]).eval_async().result() is not None
+    assert (statistics.spills > 0) == local
+    reloaded = model.results.stress.on_last_time_freq.eval()
+    assert statistics.hits == (2 if local else 1)
+    assert np.allclose(reloaded[0].data, first[0].data)
+
+    model.set_result_cache(False)
+    assert model.result_cache is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_model_result_cache_extra_inputs(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    model.set_result_cache()
+    stress = model.results.stress
+    first = stress.eval()
+    assert stress.eval() is first
+    # inputs connected on the operator are not part of the key: the cache is bypassed
+    stress().inputs.bool_rotate_to_global(False)
+    assert stress.eval() is not first
+    assert model.result_cache.statistics.hits == 1
+
+
 def test_result_displacement_model():
     model = dpf.core.Model(examples.download_all_kinds_of_complexity_modal())
     results = model.results
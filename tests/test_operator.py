@@ -1516,3 +1516,66 @@ def test_operator_version(server_type):
     from packaging.version import Version
 
     assert isinstance(dpf.core.operators.math.add(server=server_type).version, Version)
+
+
+def test_eval_async_operator(server_type):
+    field = dpf.core.fields_factory.field_from_array(np.arange(1.0, 10.0), server=server_type)
+    op = dpf.core.operators.min_max.min_max(field=field, server=server_type)
+    future = op.eval_async()
+    assert np.allclose(future.result().data, op.eval().data)
+    op.run_async().result()
+    assert np.allclose(op.eval_async(pin=1).result().data, [9.0])
+
+
+def test_requests_concurrency_limit():
+    from concurrent.futures import wait
+    import threading
+    import time
+    from types import SimpleNamespace
+
+    from ansys.dpf.core import _concurrency
+
+    server = SimpleNamespace()
+    _concurrency.set_max_concurrent_requests(2, server)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def request():
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    futures = [_concurrency.submit(server, request) for _ in range(6)]
+    # the last requests are still queued and can be cancelled
+    assert futures[-1].cancel()
+    wait(futures)
+    assert max(max_running) == 2
+    assert len(max_running) == 5
+    with pytest.raises(ValueError):
+        _concurrency.set_max_concurrent_requests(0, server)
+
+
+@pytest.mark.slow
+def test_benchmark_eval_async_overlapped_requests(local_server, allkindofcomplexity):
+    import time
+
+    model = dpf.core.Model(allkindofcomplexity, server=local_server)
+    names = ["displacement", "stress", "elastic_strain", "velocity", "acceleration"]
+    results = [getattr(model.results, name) for name in names if hasattr(model.results, name)]
+
+    start = time.perf_counter()
+    sequential = [result.eval() for result in results]
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    overlapped = [future.result() for future in [result.eval_async() for result in results]]
+    overlapped_time = time.perf_counter() - start
+    assert [len(fc) for fc in overlapped] == [len(fc) for fc in sequential]
+    print(
+        f"\n{len(results)} results: sequential {sequential_time:.3f}s, "
+        f"overlapped {overlapped_time:.3f}s"
+    )
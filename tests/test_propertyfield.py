@@ -95,6 +95,20 @@ def test_create_property_field_push_back(server_type):
     assert f_scal.scoping.ids[1] == 2
 
 
+def test_append_many_property_field(server_type):
+    f_vec = core.PropertyField(1, core.natures.vector, core.locations.nodal, server=server_type)
+    f_vec.append([1, 2, 4], 1)
+    f_vec.append_many([2, 3], np.array([[5, 6, 7], [8, 9, 10]]))
+    assert np.array_equal(f_vec.data, [[1, 2, 4], [5, 6, 7], [8, 9, 10]])
+    assert list(f_vec.scoping.ids) == [1, 2, 3]
+
+    f_var = core.PropertyField(1, core.natures.scalar, core.locations.elemental, server=server_type)
+    f_var.append_many([1, 2], [[1, 2, 3], [4, 5]])
+    assert np.array_equal(f_var.get_entity_data(0), [1, 2, 3])
+    assert np.array_equal(f_var.get_entity_data_by_id(2), [4, 5])
+    assert list(f_var.entity_data_offsets) == [0, 3]
+
+
 def check_on_property_field_from_simplebar(prop_field):
     assert prop_field is not None
     assert len(prop_field.data) != 0
@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from pathlib import Path
+
 import pytest
 
 from ansys import dpf
@@ -151,6 +153,21 @@ def test_print_result_info(model):
     str(model.metadata.result_info)
 
 
+def test_result_info_snapshot_shared_between_models(velocity_acceleration, server_type):
+    result_info = Model(velocity_acceleration, server=server_type).metadata.result_info
+    other = Model(velocity_acceleration, server=server_type).metadata.result_info
+    assert [res.name for res in other.available_results] == [
+        res.name for res in result_info.available_results
+    ]
+    if Path(velocity_acceleration).exists():
+        # files only visible to a remote server are not shared
+        assert other._snapshot is result_info._snapshot
+    assert str(other) == str(result_info)
+    assert "stress" in other
+    assert other["stress"].name == "stress"
+    assert len(other.available_results) == len(other)
+
+
 def test_repr_available_results_list(model):
     ar = model.metadata.result_info.available_results
     assert type(ar) is list
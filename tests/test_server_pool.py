@@ -0,0 +1,100 @@
+# Copyright (C) 2020 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core.server_pool import _split_time_scoping
+
+
+@pytest.fixture(scope="module")
+def server_pool():
+    with dpf.ServerPool(n_servers=2) as pool:
+        yield pool
+
+
+def test_split_time_scoping():
+    assert _split_time_scoping([1, 2, 3, 4, 5], 2) == [[1, 2, 3], [4, 5]]
+    assert _split_time_scoping([1, 2], 4) == [[1], [2]]
+    assert _split_time_scoping(3, 4) == [3]
+    assert _split_time_scoping(None, 4) == [None]
+
+
+def test_server_pool_eval_split_by_time(server_pool, plate_msup):
+    model = dpf.Model(plate_msup)
+    expected = model.results.displacement.on_all_time_freqs.eval()
+    fc = server_pool.eval(model.results.displacement.on_all_time_freqs)
+    assert len(fc) == len(expected)
+    assert fc.get_label_scoping("time").ids.tolist() == list(range(1, len(expected) + 1))
+    for field, label_space in fc.get_entries_and_label_spaces():
+        assert np.allclose(field.data, expected.get_field(label_space).data)
+    assert fc.time_freq_support is not None
+
+
+def test_server_pool_eval_split_by_mesh(server_pool, plate_msup):
+    model = dpf.Model(plate_msup)
+    expected = model.results.displacement.on_time_scoping([1, 2]).eval()
+    fc = server_pool.eval(model.results.displacement.on_time_scoping([1, 2]), split_by="mesh")
+    assert len(fc) == len(expected)
+    for field, label_space in fc.get_entries_and_label_spaces():
+        expected_field = expected.get_field(label_space)
+        assert sorted(field.scoping.ids) == sorted(expected_field.scoping.ids)
+        index = np.argsort(field.scoping.ids)
+        expected_index = np.argsort(expected_field.scoping.ids)
+        assert np.allclose(field.data[index], expected_field.data[expected_index])
+
+
+def test_server_pool_eval_time_values(server_pool, plate_msup):
+    model = dpf.Model(plate_msup)
+    frequencies = model.metadata.time_freq_support.time_frequencies.data
+    times = [float(value) + 1e-3 for value in frequencies[[1, 3, 5, 7]]]
+    expected = model.results.displacement.on_time_scoping(times).eval()
+    expected_times = expected.time_freq_support.time_frequencies.data
+    for split_by in ["time", "mesh"]:
+        fc = server_pool.eval(model.results.displacement.on_time_scoping(times), split_by=split_by)
+        assert len(fc) == len(expected)
+        assert np.allclose(fc.time_freq_support.time_frequencies.data, expected_times)
+        for field, label_space in fc.get_entries_and_label_spaces():
+            expected_field = expected.get_field(label_space)
+            index = np.argsort(field.scoping.ids)
+            expected_index = np.argsort(expected_field.scoping.ids)
+            assert np.allclose(field.data[index], expected_field.data[expected_index])
+
+
+def test_server_pool_requires_grpc():
+    with pytest.raises(ValueError):
+        dpf.ServerPool(n_servers=1, config=dpf.AvailableServerConfigs.InProcessServer)
+
+
+@pytest.mark.slow
+def test_benchmark_server_pool_eval(server_pool, plate_msup):
+    import time
+
+    model = dpf.Model(plate_msup)
+    start = time.perf_counter()
+    model.results.stress.on_all_time_freqs.eval()
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    server_pool.eval(model.results.stress.on_all_time_freqs)
+    pooled = time.perf_counter() - start
+    print(f"single server: {single:.3f}s, pool of {len(server_pool)} servers: {pooled:.3f}s")
@@ -109,3 +109,63 @@ def test_pin_alias(server_type):
     op.inputs.weights.connect(weights)
     output: dpf.Field = op.eval()
     assert output.data_as_list == [2.0]
+
+
+def test_specification_cache_shares_and_persists(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from ansys.dpf.core import misc
+    from ansys.dpf.core.operator_specification import _SpecificationCache
+
+    monkeypatch.setattr(misc, "SPECIFICATION_CACHE_PATH", tmp_path)
+    cache = _SpecificationCache()
+    server = SimpleNamespace(version="11.0", plugins={"native": "Ans.Dpf.Native"})
+    record = cache.record(server, "U")
+    assert record == {}
+    record["description"] = "displacement"
+    cache.mark_modified(server)
+    # servers with the same version and plugins share their specifications
+    other_server = SimpleNamespace(version="11.0", plugins={"native": "Ans.Dpf.Native"})
+    assert cache.record(other_server, "U") is record
+    cache.save()
+    assert len(list(tmp_path.glob("specifications_*.json"))) == 1
+
+    # a new Python session reads the specifications from the disk
+    new_session = _SpecificationCache()
+    assert new_session.record(server, "U") == {"description": "displacement"}
+
+    # loading a plugin invalidates the specifications of the server, not the persisted ones
+    server.plugins = {"native": "Ans.Dpf.Native", "mech": "Ans.Dpf.Mech"}
+    new_session.invalidate(server)
+    assert len(list(tmp_path.glob("specifications_*.json"))) == 1
+    assert new_session.record(server, "U") == {}
+    assert new_session.record(other_server, "U") == {"description": "displacement"}
+
+
+def test_specification_cache_unidentified_plugins():
+    from types import SimpleNamespace
+
+    from ansys.dpf.core.operator_specification import _SpecificationCache
+
+    class NoPlugins(SimpleNamespace):
+        @property
+        def plugins(self):
+            raise AttributeError
+
+    cache = _SpecificationCache()
+    server = NoPlugins(version="6.0")
+    cache.record(server, "U")["description"] = "displacement"
+    assert cache.record(server, "U") == {"description": "displacement"}
+    assert cache.record(NoPlugins(version="6.0"), "U") == {}
+
+
+def test_operator_specification_cached(server_type):
+    first = dpf.Operator("U", server=server_type).specification
+    second = dpf.Operator("U", server=server_type).specification
+    assert second.description == first.description
+    assert second.inputs == first.inputs
+    assert second.outputs == first.outputs
+    assert second.properties == first.properties
+    assert second.inputs is not first.inputs
+    # the cached specification is only created on the server when required
+    assert second._internal_obj_instance is None
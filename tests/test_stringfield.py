@@ -77,6 +77,16 @@ def test_create_string_field_push_back(server_type):
     assert f_scal.data[2] == "blu"
 
 
+def test_append_many_string_field(server_type):
+    f_scal = core.StringField(1, server=server_type)
+    f_scal.append(["blo"], 1)
+    with f_scal.append_buffer() as buffer:
+        buffer.append_many([2, 3], ["blu", "bla"])
+        buffer.append(["bli"], 4)
+    assert list(f_scal.data) == ["blo", "blu", "bla", "bli"]
+    assert list(f_scal.scoping.ids) == [1, 2, 3, 4]
+
+
 def test_entity_data_string_field(server_type):
     f_vec = core.StringField(1, server=server_type)
     vec = ["water", "oil", "gaz"]
@@ -20,6 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import time
+
+import numpy as np
 import pytest
 
 import ansys.dpf.core as dpf
@@ -38,6 +41,8 @@ from ansys.dpf.core.vtk_helper import (
 if misc.module_exists("pyvista"):
     HAS_PYVISTA = True
     import pyvista as pv
+
+    from ansys.dpf.core.vtk_helper import _vtk_cells_from_connectivity
 else:
     HAS_PYVISTA = False
 
@@ -104,6 +109,40 @@ def test_dpf_field_to_vtk_errors(server_type):
         _ = dpf_field_to_vtk(field=field)
 
 
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_dpf_field_to_vtk_reuses_cached_grid(simple_rst, server_type):
+    model = dpf.Model(simple_rst, server=server_type)
+    mesh = model.metadata.meshed_region
+    fields = model.results.displacement.on_all_time_freqs().eval()
+    grids = [dpf_field_to_vtk(field=f, meshed_region=mesh, field_name="disp") for f in fields]
+    # The mesh is converted once, each grid only gets its own point data
+    assert list(mesh._vtk_grids.keys()) == [True]
+    cached_grid = mesh._vtk_grids[True]
+    for grid in grids:
+        assert grid.GetCells() is cached_grid.GetCells()
+        assert "disp" in grid.point_data.keys()
+    assert "disp" not in cached_grid.point_data.keys()
+    assert not np.allclose(grids[0].point_data["disp"], grids[-1].point_data["disp"])
+    # Deformed grids get their own points
+    initial_coord = mesh.nodes.coordinates_field
+    updated_coord = (initial_coord + fields[-1]).eval()
+    deformed = dpf_field_to_vtk(field=fields[-1], meshed_region=mesh, nodes=updated_coord)
+    assert np.allclose(deformed.points, updated_coord.data)
+    assert np.allclose(cached_grid.points, initial_coord.data)
+    # A new as_linear value gets its own entry
+    dpf_field_to_vtk(field=fields[0], meshed_region=mesh, as_linear=False)
+    assert sorted(mesh._vtk_grids.keys()) == [False, True]
+    # Setting the coordinates updates the cached grids
+    mesh.set_coordinates_field(updated_coord)
+    for grid in mesh._vtk_grids.values():
+        assert np.allclose(grid.points, updated_coord.data)
+    # Changing the topology invalidates them
+    mesh.set_property_field(
+        dpf.common.elemental_properties.connectivity, mesh.elements.connectivities_field
+    )
+    assert mesh._vtk_grids == {}
+
+
 @pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
 def test_dpf_meshes_to_vtk(fluent_axial_comp, server_type):
     model = dpf.Model(fluent_axial_comp(server=server_type), server=server_type)
@@ -282,3 +321,68 @@ def test_vtk_mesh_is_valid_polyhedron():
     assert len(validity.non_contiguous_edges) == 0
     assert len(validity.non_convex) == 0
     assert len(validity.inverted_faces) == 1
+
+
+def _polyhedron_mesh_arrays(n_elements):
+    """Return connectivity arrays of alternating hexahedrons and wedge-shaped polyhedrons."""
+    hex_type = dpf.element_types.Hex8.value
+    poly_type = dpf.element_types.Polyhedron.value
+    wedge_faces = [[0, 1, 2], [3, 5, 4], [0, 3, 4, 1], [1, 4, 5, 2], [2, 5, 3, 0]]
+    etypes = np.resize([hex_type, poly_type], n_elements)
+    elem_size = np.where(etypes == hex_type, 8, 6)
+    connectivity = np.concatenate([np.arange(size) + i for i, size in enumerate(elem_size)])
+    # Each polyhedron has its own 5 faces
+    n_poly = np.count_nonzero(etypes == poly_type)
+    faces_nodes = np.concatenate([np.add(face, i) for i in range(n_poly) for face in wedge_faces])
+    faces_sizes = np.tile([len(face) for face in wedge_faces], n_poly)
+    faces_nodes_offsets = np.append(0, np.cumsum(faces_sizes))
+    elements_faces = np.arange(5 * n_poly)
+    elements_faces_offsets = np.append(0, np.cumsum(np.where(etypes == poly_type, 5, 0)))
+    polyhedrons = (elements_faces, elements_faces_offsets, faces_nodes, faces_nodes_offsets)
+    return etypes, connectivity, elem_size, polyhedrons
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_vtk_cells_from_connectivity_polyhedrons():
+    etypes, connectivity, elem_size, polyhedrons = _polyhedron_mesh_arrays(3)
+    cells, cells_insert_ind, cell_sizes = _vtk_cells_from_connectivity(
+        etypes, connectivity, elem_size, polyhedrons
+    )
+    hexa_0 = [8, 0, 1, 2, 3, 4, 5, 6, 7]
+    # [n_values, n_faces, face_0_size, face_0_nodes..., face_1_size, ...]
+    poly_1 = [24, 5, 3, 0, 1, 2, 3, 3, 5, 4, 4, 0, 3, 4, 1, 4, 1, 4, 5, 2, 4, 2, 5, 3, 0]
+    hexa_2 = [8, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert cells.tolist() == hexa_0 + poly_1 + hexa_2
+    assert cells_insert_ind.tolist() == [0, 9, 34]
+    assert cell_sizes.tolist() == [9, 25, 9]
+
+    grid = pv.UnstructuredGrid(
+        cells,
+        [pv.CellType.HEXAHEDRON, pv.CellType.POLYHEDRON, pv.CellType.HEXAHEDRON],
+        np.random.default_rng(0).random((10, 3)),
+    )
+    assert grid.n_cells == 3
+
+    # Without polyhedrons, cells are the connectivity with each element size inserted
+    cells, cells_insert_ind, _ = _vtk_cells_from_connectivity(
+        [dpf.element_types.Hex8.value] * 2, np.arange(16), [8, 8]
+    )
+    assert cells.tolist() == [8, *range(8), 8, *range(8, 16)]
+    assert cells_insert_ind.tolist() == [0, 9]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_benchmark_vtk_cells_from_connectivity_scaling():
+    timings = {}
+    for n_elements in [20_000, 160_000]:
+        etypes, connectivity, elem_size, polyhedrons = _polyhedron_mesh_arrays(n_elements)
+        start = time.perf_counter()
+        cells, _, cell_sizes = _vtk_cells_from_connectivity(
+            etypes, connectivity, elem_size, polyhedrons
+        )
+        timings[n_elements] = time.perf_counter() - start
+        assert cells.size == cell_sizes.sum()
+    print(f"VTK cells building time per number of elements: {timings}")
+    # Building is linear: 8 times more elements should cost about 8 times more
+    print(f"Scaling ratio: {timings[160_000] / timings[20_000]:.1f}")